@@ -0,0 +1,4 @@
+"""
+발표자료 빌드 벤치마크
+- 저장소 루트에서 `python -m benchmarks.<모듈>` 로 실행
+"""
@@ -0,0 +1,108 @@
+"""
+렌더링 백엔드 A/B 벤치마크: python-pptx 프록시 vs XML 템플릿 복사(xmlshapes.py)
+- 기본 도형별로 슬라이드 한 장에 N개씩 그리는 시간 비교
+- 실제 세 덱 전체 빌드 시간 비교 (캐시 없이 직렬)
+- 두 백엔드의 슬라이드 XML이 같은지도 함께 확인
+- 테이블은 두 백엔드 모두 table.py 일괄 작성기를 쓰므로 제외
+
+실행: python -m benchmarks.bench_backend [--count N] [--repeat N]
+"""
+
+import argparse
+import os
+import time
+
+from lxml import etree
+from pptx.util import Inches
+
+from hydrogen_decks import build, render
+from hydrogen_decks.style import NAVY
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+DECKS = [
+    os.path.join(ROOT, "수소에너지", "create_ppt.py"),
+    os.path.join(ROOT, "수소에너지", "create_hydrogen_car_ppt.py"),
+    os.path.join(ROOT, "연료전지", "create_fuelcell_ppt.py"),
+]
+
+
+def bars(slide, i):
+    render.add_navy_header_bar(slide)
+    render.add_green_accent_line(slide)
+    render.add_footer_line(slide)
+
+
+def colored_box(slide, i):
+    render.add_colored_box(slide, Inches(i % 10), Inches(2), Inches(2), Inches(1),
+                           NAVY, f"박스 {i}")
+
+
+def bullets(slide, i):
+    tf = render.add_body_textbox(slide)
+    for j in range(5):
+        render.add_bullet(tf, f"항목 {i}-{j}", level=j % 2, first=j == 0)
+
+
+def title_and_number(slide, i):
+    render.add_title_text(slide, f"제목 {i}")
+    render.add_slide_number(slide, i, 99)
+
+
+CASES = [
+    ("막대 3개", bars),
+    ("둥근 색상 박스", colored_box),
+    ("텍스트박스 + 불릿 5개", bullets),
+    ("제목 + 번호", title_and_number),
+]
+
+
+def run_case(fn, count, backend):
+    render.BACKEND = backend
+    prs = build.new_presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
+    start = time.perf_counter()
+    for i in range(count):
+        fn(slide, i)
+    return time.perf_counter() - start, etree.tostring(slide._element)
+
+
+def run_deck(path, backend):
+    render.BACKEND = backend
+    slides = build.load_generator(path).SLIDES
+    start = time.perf_counter()
+    prs = build.build_presentation(slides)
+    elapsed = time.perf_counter() - start
+    return elapsed, [slide.part.blob for slide in prs.slides]
+
+
+def best(fn, repeat, *args):
+    results = [fn(*args) for _ in range(repeat)]
+    return min(t for t, _ in results), results[-1][1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="렌더링 백엔드 A/B 벤치마크")
+    parser.add_argument("--count", type=int, default=200, help="도형별 반복 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args(argv)
+
+    # 템플릿 생성 비용은 한 번뿐이므로 측정 전에 미리 채워 둠
+    for _, fn in CASES:
+        run_case(fn, 1, "xml")
+
+    print(f"{'케이스':<24}{'pptx(ms)':>10}{'xml(ms)':>10}{'배속':>8}  XML 동일")
+    for name, fn in CASES:
+        t_pptx, xml_pptx = best(run_case, args.repeat, fn, args.count, "pptx")
+        t_xml, xml_xml = best(run_case, args.repeat, fn, args.count, "xml")
+        print(f"{name:<24}{t_pptx * 1000:>10.1f}{t_xml * 1000:>10.1f}"
+              f"{t_pptx / t_xml:>7.1f}x  {xml_pptx == xml_xml}")
+    for path in DECKS:
+        name = os.path.basename(path)
+        t_pptx, blobs_pptx = best(run_deck, args.repeat, path, "pptx")
+        t_xml, blobs_xml = best(run_deck, args.repeat, path, "xml")
+        print(f"{name:<24}{t_pptx * 1000:>10.1f}{t_xml * 1000:>10.1f}"
+              f"{t_pptx / t_xml:>7.1f}x  {blobs_pptx == blobs_xml}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+슬라이드 공통 장식 벤치마크: 슬라이드마다 그리기 vs 콘텐츠 레이아웃
+- 슬라이드마다: 빈 레이아웃 + 배경·헤더바·포인트 라인·하단 라인·번호 (예전 setup_slide)
+- 레이아웃: chrome.py 콘텐츠 레이아웃 + 제목만 (현재 setup_slide)
+- 슬라이드 수별로 도형 수, 슬라이드 XML 바이트, 파일 크기, 빌드+저장 시간 비교
+
+실행: python -m benchmarks.bench_chrome [--slides 24 100 500] [--repeat N]
+"""
+
+import argparse
+import io
+import time
+import zipfile
+
+from pptx.util import Inches
+
+from hydrogen_decks import package, render
+from hydrogen_decks.build import new_presentation
+from hydrogen_decks.style import WHITE
+
+
+def body(slide, num):
+    tf = render.add_body_textbox(slide)
+    for i in range(5):
+        render.add_bullet(tf, f"{num}번 슬라이드 항목 {i + 1}", first=i == 0)
+    render.add_colored_box(slide, Inches(0.8), Inches(5.5), Inches(3), Inches(1),
+                           render.NAVY, "요약")
+
+
+def legacy_slide(prs, num, total):
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
+    render.add_background(slide, WHITE)
+    render.add_navy_header_bar(slide)
+    render.add_green_accent_line(slide)
+    render.add_title_text(slide, f"슬라이드 {num}")
+    render.add_footer_line(slide)
+    render.add_slide_number(slide, num, total)
+    return slide
+
+
+def layout_slide(prs, num, total):
+    return render.setup_slide(prs, f"슬라이드 {num}")
+
+
+def measure(make_slide, n, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        prs = new_presentation(n)
+        for num in range(1, n + 1):
+            body(make_slide(prs, num, n), num)
+        buf = io.BytesIO()
+        package.save(prs, buf)
+        best = min(best, time.perf_counter() - start)
+    shapes = sum(len(slide.shapes) for slide in prs.slides)
+    with zipfile.ZipFile(buf) as z:
+        xml = sum(i.file_size for i in z.infolist()
+                  if i.filename.startswith("ppt/slides/slide"))
+    return best, shapes, xml, len(buf.getvalue())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="슬라이드 공통 장식 벤치마크")
+    parser.add_argument("--slides", type=int, nargs="+", default=[24, 100, 500],
+                        help="슬라이드 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args(argv)
+
+    print(f"{'슬라이드':>8}  {'방식':<8}{'도형':>8}{'슬라이드 XML(KB)':>18}"
+          f"{'파일(KB)':>10}{'시간(ms)':>10}")
+    for n in args.slides:
+        for label, fn in (("슬라이드", legacy_slide), ("레이아웃", layout_slide)):
+            t, shapes, xml, size = measure(fn, n, args.repeat)
+            print(f"{n:>8}  {label:<8}{shapes:>8}{xml / 1024:>18.1f}"
+                  f"{size / 1024:>10.1f}{t * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
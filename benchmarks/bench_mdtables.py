@@ -0,0 +1,57 @@
+"""
+연구 문서 전체 표 색인 시간: 파싱 vs 디스크 캐시 vs 메모리 캐시 (mdtables.py)
+- 저장소의 모든 .md 문서를 Corpus로 색인하고 표 수를 셈
+- 파싱: 캐시 없이 줄 단위 파싱 / 디스크: 새 프로세스처럼 메모리 캐시를 비운 뒤 pickle 로드
+- 메모리: 같은 프로세스에서 mtime·크기만 확인
+
+실행: python -m benchmarks.bench_mdtables [--root .] [--repeat 5]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from hydrogen_decks import mdtables
+
+
+def load(root, disk_cache):
+    start = time.perf_counter()
+    corpus = mdtables.Corpus(root)
+    count = sum(len(mdtables.parse_file(doc.path, disk_cache))
+                for doc in corpus.documents.values())
+    return time.perf_counter() - start, count
+
+
+def best(root, repeat, disk_cache, clear):
+    times = []
+    for _ in range(repeat):
+        if clear:
+            mdtables._parsed.clear()
+        elapsed, count = load(root, disk_cache)
+        times.append(elapsed)
+    return min(times), count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="연구 문서 표 색인 시간")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(__file__), os.pardir),
+                        help="문서 디렉터리")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mdtables.DEFAULT_TABLE_CACHE_DIR = tmp
+        parse, count = best(args.root, args.repeat, False, True)
+        load(args.root, True)
+        disk, _ = best(args.root, args.repeat, True, True)
+        memory, _ = best(args.root, args.repeat, True, False)
+
+    print(f"문서 {len(mdtables.Corpus(args.root).documents)}개, 표 {count}개")
+    print(f"{'파싱':<10}{parse * 1000:>10.1f} ms")
+    print(f"{'디스크 캐시':<10}{disk * 1000:>10.1f} ms")
+    print(f"{'메모리 캐시':<10}{memory * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+덱 크기별 빌드 시간: python-pptx 기본 Slides vs DeckSlides(slides.py)
+- 합성 콘텐츠 슬라이드 N장 빌드 + 저장, 슬라이드당 시간이 일정하면 선형
+- 기본 Slides는 제곱으로 느려지므로 --stock-max 이하에서만 측정
+
+실행: python -m benchmarks.bench_scaling [--slides 100 1000 10000] [--stock-max 2000]
+"""
+
+import argparse
+import io
+import time
+
+from pptx.slide import Slides
+
+from hydrogen_decks import package, render
+from hydrogen_decks.build import new_presentation
+
+from .bench_chrome import body
+
+
+def build(n, stock):
+    start = time.perf_counter()
+    prs = new_presentation(n)
+    if stock:
+        prs.__dict__["slides"] = Slides(prs._element.get_or_add_sldIdLst(), prs)
+    for num in range(1, n + 1):
+        body(render.setup_slide(prs, f"슬라이드 {num}"), num)
+    package.save(prs, io.BytesIO())
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="덱 크기별 빌드 시간")
+    parser.add_argument("--slides", type=int, nargs="+",
+                        default=[100, 300, 1000, 3000, 10000], help="슬라이드 수")
+    parser.add_argument("--stock-max", type=int, default=2000,
+                        help="기본 Slides를 측정할 최대 슬라이드 수")
+    args = parser.parse_args(argv)
+
+    print(f"{'슬라이드':>8}{'기본(s)':>10}{'ms/장':>8}{'DeckSlides(s)':>15}{'ms/장':>8}")
+    for n in args.slides:
+        stock = f"{'-':>10}{'-':>8}"
+        if n <= args.stock_max:
+            t = build(n, stock=True)
+            stock = f"{t:>10.2f}{t / n * 1000:>8.2f}"
+        t = build(n, stock=False)
+        print(f"{n:>8}{stock}{t:>15.2f}{t / n * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
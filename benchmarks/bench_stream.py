@@ -0,0 +1,82 @@
+"""
+스트리밍 저장 벤치마크: package.save vs package.StreamWriter
+- 합성 콘텐츠 슬라이드 N장을 만들고 저장할 때의 최대 RSS와 시간
+- lxml 트리는 C 힙에 있어 tracemalloc에 잡히지 않으므로 케이스마다 새 프로세스를
+  띄워 ru_maxrss로 측정
+- save는 슬라이드 수에 비례해 늘고, 스트리밍은 거의 일정해야 함
+
+실행: python -m benchmarks.bench_stream [--slides 100 500 2000]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from hydrogen_decks import package, render
+from hydrogen_decks.build import new_presentation
+
+from .bench_chrome import body
+
+
+def slide_fn(num):
+    def make(prs):
+        body(render.setup_slide(prs, f"슬라이드 {num}"), num)
+    return make
+
+
+def run(n, path, stream):
+    start = time.perf_counter()
+    prs = new_presentation(n)
+    writer = package.StreamWriter(path) if stream else None
+    for num in range(1, n + 1):
+        slide_fn(num)(prs)
+        if writer:
+            writer.flush(prs)
+    if writer:
+        writer.close(prs)
+    else:
+        package.save(prs, path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return elapsed, peak
+
+
+def run_child(n, path, stream):
+    """새 프로세스에서 run() 실행 → (시간, 최대 RSS)"""
+    cmd = [sys.executable, "-m", "benchmarks.bench_stream", "--child",
+           str(n), path] + (["--stream"] if stream else [])
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    elapsed, peak = out.split()
+    return float(elapsed), int(peak)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스트리밍 저장 벤치마크")
+    parser.add_argument("--slides", type=int, nargs="+", default=[100, 500, 2000],
+                        help="슬라이드 수")
+    parser.add_argument("--child", nargs=2, metavar=("N", "PATH"),
+                        help=argparse.SUPPRESS)
+    parser.add_argument("--stream", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        elapsed, peak = run(int(args.child[0]), args.child[1], args.stream)
+        print(elapsed, peak)
+        return
+
+    print(f"{'슬라이드':>8}{'save RSS(MB)':>14}{'스트림 RSS(MB)':>16}"
+          f"{'save(s)':>10}{'스트림(s)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.pptx")
+        for n in args.slides:
+            t_save, m_save = run_child(n, path, stream=False)
+            t_stream, m_stream = run_child(n, path, stream=True)
+            print(f"{n:>8}{m_save / 2**20:>14.1f}{m_stream / 2**20:>16.1f}"
+                  f"{t_save:>10.2f}{t_stream:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+테이블 작성 벤치마크: 셀 단위·헬퍼 경로 vs 일괄 작성기(table.add_table)
+- 셀 단위 경로: 셀마다 set_cell (table.cell() 조회 + 셀 교체)
+- 헬퍼 경로: create_table + 열 너비 + style_header_row + style_data_rows
+- 일괄 경로: table.add_table 한 번 호출
+- 세 경로의 a:tbl XML이 같은지도 함께 확인
+
+실행: python -m benchmarks.bench_table [--repeat N]
+"""
+
+import argparse
+import time
+
+from pptx.util import Inches
+from pptx.enum.text import PP_ALIGN
+from lxml import etree
+
+from hydrogen_decks import render, table
+from hydrogen_decks.style import WHITE, TABLE_HEADER_BG
+from hydrogen_decks.build import new_presentation
+
+# (이름, 행 수, 열 수) - slide_23 규모, 넓은 표, 한국 보고서 500행 표
+CASES = [
+    ("slide_23 규모 6x3", 6, 3),
+    ("넓은 표 20x12", 20, 12),
+    ("보고서 표 500x8", 500, 8),
+]
+
+
+def make_data(rows, cols):
+    header = [f"항목 {c + 1}" for c in range(cols)]
+    data = [[f"{r + 1}-{c + 1} 수소 {r * cols + c}" for c in range(cols)]
+            for r in range(rows - 1)]
+    return header, data
+
+
+def cell_path(slide, header, data, widths):
+    _, tbl = render.create_table(slide, len(data) + 1, len(header),
+                                 Inches(0.5), Inches(1.5), Inches(12), Inches(5))
+    for col, w in zip(tbl.columns, widths):
+        col.width = w
+    for c, h in enumerate(header):
+        render.set_cell(tbl, 0, c, h, size=14, bold=True, color=WHITE,
+                        alignment=PP_ALIGN.CENTER, fill_color=TABLE_HEADER_BG)
+    for r, row in enumerate(data, start=1):
+        for c, val in enumerate(row):
+            render.set_cell(tbl, r, c, val, size=13, fill_color=table.band_fill(r))
+    return tbl._tbl
+
+
+def helper_path(slide, header, data, widths):
+    _, tbl = render.create_table(slide, len(data) + 1, len(header),
+                                 Inches(0.5), Inches(1.5), Inches(12), Inches(5))
+    for col, w in zip(tbl.columns, widths):
+        col.width = w
+    render.style_header_row(tbl, header)
+    render.style_data_rows(tbl, data)
+    return tbl._tbl
+
+
+def bulk_path(slide, header, data, widths):
+    shape = table.add_table(slide, data, Inches(0.5), Inches(1.5), Inches(12),
+                            Inches(5), header=header, col_widths=widths)
+    return shape.table._tbl
+
+
+def measure(fn, header, data, widths, repeat):
+    best = float("inf")
+    tbl = None
+    for _ in range(repeat):
+        prs = new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
+        start = time.perf_counter()
+        tbl = fn(slide, header, data, widths)
+        best = min(best, time.perf_counter() - start)
+    return best, etree.tostring(tbl)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="테이블 작성 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args(argv)
+
+    print(f"{'케이스':<20}{'셀 단위(ms)':>12}{'헬퍼(ms)':>10}{'일괄(ms)':>10}"
+          f"{'배속':>8}  XML 동일")
+    for name, rows, cols in CASES:
+        header, data = make_data(rows, cols)
+        widths = [Inches(12) // cols] * cols
+        t_cell, xml_cell = measure(cell_path, header, data, widths, args.repeat)
+        t_helper, xml_helper = measure(helper_path, header, data, widths, args.repeat)
+        t_bulk, xml_bulk = measure(bulk_path, header, data, widths, args.repeat)
+        print(f"{name:<20}{t_cell * 1000:>12.2f}{t_helper * 1000:>10.2f}"
+              f"{t_bulk * 1000:>10.2f}{t_cell / t_bulk:>7.1f}x  "
+              f"{xml_cell == xml_helper == xml_bulk}")
+
+
+if __name__ == "__main__":
+    main()
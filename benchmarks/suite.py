@@ -0,0 +1,252 @@
+"""
+벤치마크 모음 + 회귀 게이트
+- deck:*   세 발표자료 전체 빌드 + 저장 (슬라이드 캐시 없이)
+- micro:*  헬퍼 단위 (style_data_rows, add_bullet, setup_slide, 압축 정책별 package.save,
+           new_presentation 복제)
+- synth:*  합성 작업량 (1천/1만 장 덱, 100x10 표, 긴 한국어 불릿)
+- 반복 중 최솟값을 결과로 쓰고 기준값(baseline.json)과 비교,
+  threshold 넘게 느려진 항목이 있으면 종료 코드 1
+- 기본 시계는 프로세스 CPU 시간: 공유 머신에서 벽시계는 ±40%까지 흔들려
+  게이트가 쓸모없어짐 (--clock wall로 벽시계 측정). 매 반복 전 gc.collect()
+- CPU 시간도 가상 머신에서는 20~40% 흔들리므로, 회귀로 보인 항목은
+  반복을 두 배로 다시 재서 최솟값으로 한 번 더 판정
+
+실행:
+    python -m benchmarks.suite                      # 기준값과 비교 (10k 제외)
+    python -m benchmarks.suite --large              # 1만 장 덱 포함
+    python -m benchmarks.suite --save               # 현재 결과를 기준값으로 저장
+    python -m benchmarks.suite -k micro --threshold 0.3
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+import pptx
+
+from hydrogen_decks import build, decks, package, render
+from hydrogen_decks.build import new_presentation
+
+from . import workloads
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+BENCHMARKS = {}
+CLOCKS = {"cpu": time.process_time, "wall": time.perf_counter}
+clock = CLOCKS["cpu"]
+
+
+def benchmark(name, repeat=10, large=False):
+    """측정 함수 등록 (함수는 측정한 초를 반환, 준비 작업은 시간에서 뺌)"""
+    def register(fn):
+        BENCHMARKS[name] = (fn, repeat, large)
+        return fn
+    return register
+
+
+def _save(prs):
+    package.save(prs, io.BytesIO())
+
+
+# ── 덱 전체 ───────────────────────────────────────────
+def _deck(name):
+    def run():
+        slides = decks.generator(name).SLIDES
+        start = clock()
+        _save(build.build_presentation(slides))
+        return clock() - start
+    return run
+
+
+for _name in decks.DECKS:
+    benchmark(f"deck:{_name}", repeat=3)(_deck(_name))
+
+
+# ── 헬퍼 ──────────────────────────────────────────────
+@benchmark("micro:style_data_rows 20x6")
+def style_data_rows():
+    prs = new_presentation()
+    slide = render.setup_slide(prs, "표")
+    header, data = workloads.table_data(20, 6)
+    _, tbl = render.create_table(slide, 20, 6, 0, 0, 100, 100)
+    start = clock()
+    render.style_data_rows(tbl, data)
+    return clock() - start
+
+
+@benchmark("micro:add_bullet x200")
+def add_bullet():
+    prs = new_presentation()
+    tf = render.add_body_textbox(render.setup_slide(prs, "불릿"))
+    start = clock()
+    for i in range(200):
+        render.add_bullet(tf, f"항목 {i}", first=i == 0)
+    return clock() - start
+
+
+def _package_save(policy):
+    def run():
+        prs = build.build_presentation(decks.generator("연료전지_발표자료").SLIDES)
+        start = clock()
+        package.save(prs, io.BytesIO(), package.POLICIES[policy])
+        return clock() - start
+    return run
+
+
+for _policy in package.POLICIES:
+    benchmark(f"micro:package.save {_policy}", repeat=5)(_package_save(_policy))
+
+
+@benchmark("micro:new_presentation x100")
+def new_presentations():
+    start = clock()
+    for _ in range(100):
+        new_presentation(27)
+    return clock() - start
+
+
+@benchmark("micro:setup_slide x200")
+def setup_slide():
+    prs = new_presentation(200)
+    start = clock()
+    for i in range(200):
+        render.setup_slide(prs, f"슬라이드 {i}")
+    return clock() - start
+
+
+# ── 합성 작업량 ───────────────────────────────────────
+def _synthetic_deck(n):
+    def run():
+        start = clock()
+        prs = new_presentation(n)
+        for num in range(1, n + 1):
+            workloads.content_slide(prs, num)
+        _save(prs)
+        return clock() - start
+    return run
+
+
+benchmark("synth:slides 1k", repeat=3)(_synthetic_deck(1000))
+benchmark("synth:slides 10k", repeat=1, large=True)(_synthetic_deck(10000))
+
+
+@benchmark("synth:table 100x10", repeat=3)
+def table_100x10():
+    start = clock()
+    prs = new_presentation()
+    workloads.table_slide(prs, 100, 10)
+    _save(prs)
+    return clock() - start
+
+
+@benchmark("synth:korean bullets 20x40", repeat=3)
+def korean_bullets():
+    start = clock()
+    prs = new_presentation(20)
+    for num in range(1, 21):
+        workloads.korean_bullets_slide(prs, num, 40)
+    _save(prs)
+    return clock() - start
+
+
+# ── 실행 · 비교 ───────────────────────────────────────
+def machine(clock_name):
+    return {"python": platform.python_version(), "python-pptx": pptx.__version__,
+            "machine": platform.machine(), "cpus": os.cpu_count(), "clock": clock_name}
+
+
+def run(names, repeat=None, scale=1):
+    results = {}
+    for name in names:
+        fn, default_repeat, _ = BENCHMARKS[name]
+        fn()  # 준비 실행 (import·템플릿 캐시)
+        times = []
+        for _ in range(repeat or default_repeat * scale):
+            gc.collect()
+            times.append(fn())
+        results[name] = min(times)
+        print(f"  {name:<44}{results[name] * 1000:>10.1f} ms", flush=True)
+    return results
+
+
+def load_baseline(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def compare(results, baseline, threshold):
+    """기준값 대비 표 출력, 느려진 항목 목록 반환"""
+    regressions = []
+    print(f"\n{'벤치마크':<44}{'기준(ms)':>10}{'현재(ms)':>10}{'변화':>9}")
+    for name, seconds in results.items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<44}{'-':>10}{seconds * 1000:>10.1f}{'새 항목':>9}")
+            continue
+        change = seconds / base - 1
+        mark = ""
+        if change > threshold:
+            regressions.append(name)
+            mark = "  ← 회귀"
+        print(f"{name:<44}{base * 1000:>10.1f}{seconds * 1000:>10.1f}{change:>+9.1%}{mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크 모음 + 회귀 게이트")
+    parser.add_argument("-k", "--filter", default="", help="이름에 이 문자열이 든 항목만")
+    parser.add_argument("--large", action="store_true", help="1만 장 덱 등 큰 작업량 포함")
+    parser.add_argument("--repeat", type=int, help="반복 횟수 (기본: 항목별)")
+    parser.add_argument("--clock", choices=CLOCKS, default="cpu",
+                        help="측정 시계 (cpu: 프로세스 CPU 시간, wall: 벽시계)")
+    parser.add_argument("--baseline", default=BASELINE, help="기준값 JSON 경로")
+    parser.add_argument("--save", action="store_true", help="현재 결과를 기준값에 저장")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="회귀 판정 비율 (0.25 = 기준보다 25%% 넘게 느려지면 실패)")
+    args = parser.parse_args(argv)
+    global clock
+    clock = CLOCKS[args.clock]
+
+    names = [name for name, (_, _, large) in BENCHMARKS.items()
+             if args.filter in name and (args.large or not large)]
+    print(f"벤치마크 {len(names)}개")
+    results = run(names, args.repeat)
+
+    baseline = load_baseline(args.baseline)
+    if args.save:
+        merged = dict(baseline["results"]) if baseline else {}
+        merged.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"machine": machine(args.clock), "results": merged}, f,
+                      ensure_ascii=False, indent=1, sort_keys=True)
+            f.write("\n")
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"기준값 없음: {args.baseline} (--save로 생성)")
+        return 0
+    if baseline.get("machine") != machine(args.clock):
+        print(f"주의: 기준값을 잰 환경이 다름 {baseline.get('machine')}")
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n회귀 의심 {len(regressions)}개 재측정")
+        again = run(regressions, 2 * (args.repeat or 0) or None, scale=2)
+        results.update({name: min(results[name], again[name]) for name in regressions})
+        regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n회귀 {len(regressions)}개 (기준 +{args.threshold:.0%} 초과): "
+              + ", ".join(regressions))
+        return 1
+    print(f"\n회귀 없음 (기준 +{args.threshold:.0%} 이내)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+합성 작업량 생성기 (suite.py와 개별 벤치마크에서 공용)
+- 콘텐츠 슬라이드 N장, 큰 표(행×열), 긴 한국어 불릿 목록
+- 생성 스크립트와 같은 헬퍼(render.setup_slide, style_data_rows, add_bullet)만 사용
+"""
+
+from pptx.util import Inches
+
+from hydrogen_decks import render
+
+SENTENCE = ("수소경제 로드맵 대비 실제 달성률은 분야별로 편차가 크며, "
+            "발전용 연료전지와 충전소는 비교적 양호하지만 수소차 보급은 목표의 23%에 그친다")
+
+
+def table_data(rows, cols):
+    """머리행 + (rows - 1)행 데이터"""
+    header = [f"항목 {c + 1}" for c in range(cols)]
+    data = [[f"{r + 1}-{c + 1} 수소 {r * cols + c}" for c in range(cols)]
+            for r in range(rows - 1)]
+    return header, data
+
+
+def content_slide(prs, num):
+    """불릿 5개 + 색상 박스 하나인 보통 콘텐츠 슬라이드"""
+    slide = render.setup_slide(prs, f"슬라이드 {num}")
+    tf = render.add_body_textbox(slide)
+    for i in range(5):
+        render.add_bullet(tf, f"{num}번 슬라이드 항목 {i + 1}", first=i == 0)
+    render.add_colored_box(slide, Inches(0.8), Inches(5.5), Inches(3), Inches(1),
+                           render.NAVY, "요약")
+    return slide
+
+
+def table_slide(prs, rows, cols):
+    """rows×cols 표 하나 (머리행 포함)"""
+    slide = render.setup_slide(prs, f"표 {rows}x{cols}")
+    header, data = table_data(rows, cols)
+    _, tbl = render.create_table(slide, rows, cols, Inches(0.5), Inches(1.5),
+                                 Inches(12), Inches(5))
+    render.style_header_row(tbl, header)
+    render.style_data_rows(tbl, data)
+    return slide
+
+
+def korean_bullets_slide(prs, num, bullets):
+    """긴 한국어 문장 불릿 bullets개 (수준 0/1 번갈아)"""
+    slide = render.setup_slide(prs, f"한국어 불릿 {num}")
+    tf = render.add_body_textbox(slide)
+    for i in range(bullets):
+        render.add_bullet(tf, f"{i + 1}. {SENTENCE}", level=i % 2, size=14, first=i == 0)
+    return slide
@@ -0,0 +1,19 @@
+"""
+수소 발표자료 공용 렌더링 패키지
+- style: 색상·폰트·슬라이드 크기 상수
+- render: 슬라이드/텍스트/테이블 헬퍼 (스타일 템플릿 재사용)
+- chrome: 콘텐츠 슬라이드 공통 장식 레이아웃
+- basetemplate: 최소 기본 템플릿 (마스터 하나·빈 레이아웃 하나·다듬은 테마, 디스크 캐시)
+- theme: 테마 색·글꼴 슬롯 (도형·텍스트는 schemeClr·테마 글꼴로 참조)
+- retheme: 완성된 .pptx 색상·글꼴 일괄 교체 (바뀐 파트만 다시 압축, 디렉터리 병렬)
+- spec: 선언형 덱 명세 (JSON/TOML/YAML) 컴파일·캐시·렌더링
+- mdtables: 연구 문서 마크다운 표 추출·색인 (mtime 캐시)
+- decks / cli: 세 덱 일괄 빌드 (python -m hydrogen_decks build)
+- registry: 슬라이드 함수 등록부 (순서·섹션·태그 → SLIDES)
+- fields: 쪽 번호·총 장수·섹션 시작 쪽·상호 참조 지연 필드 (빌드 후 한 번에 해석)
+- catalog: 생성 스크립트 정적 목록 (pptx 없이 list-slides / show-slide / validate-spec)
+- daemon: 모듈을 미리 로드해 둔 빌드 서버 (Unix 소켓)
+- dag: 문서 → 표 → 슬라이드 → 덱 → README 의존 그래프 (내용 해시 캐시)
+- instrument: 슬라이드별 시간·메모리·도형 수·XML 크기 계측
+- sampler: 빌드 전체 샘플링 프로파일 (flame graph용 collapsed stack)
+"""
@@ -0,0 +1,7 @@
+"""python -m hydrogen_decks <명령> — cli.py 참고"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
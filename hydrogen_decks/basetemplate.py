@@ -0,0 +1,108 @@
+"""
+최소 기본 템플릿
+- python-pptx 기본 템플릿에는 레이아웃 11개, 썸네일, 프린터 설정, 30여 개 문자 체계별
+  테마 글꼴이 들어 있지만 생성 스크립트는 빈 레이아웃만 씀 (+ chrome의 콘텐츠 레이아웃)
+- compact(): 마스터 하나 + 빈 레이아웃 하나 + 한글 글꼴만 남긴 테마, 16:9 크기
+  (테마 색·글꼴 슬롯은 theme.apply()로 덱 색상·맑은 고딕)
+  → 레이아웃 인덱스는 0 = 빈 레이아웃, 1 = 콘텐츠 레이아웃 (render.BLANK_LAYOUT)
+- 결과는 압축하지 않은 .pptx로 캐시 디렉터리에 저장해 다음 프로세스부터 그대로 읽음
+  (python-pptx 버전 + 이 모듈과 여기서 import하는 theme.py·style.py 등 소스의 해시가
+   파일 이름 → 색상·슬라이드 크기를 바꿔도 새로 만듦)
+- 덱마다 레이아웃 10개·썸네일·프린터 설정이 빠져 약 15 KB 작아지고,
+  템플릿을 여는 비용(파트 파싱)도 줄어듦
+"""
+
+import hashlib
+import io
+import os
+import sys
+from functools import lru_cache
+
+import pptx
+from lxml import etree
+from pptx import Presentation
+from pptx.api import _default_pptx_path
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+
+from .cache import DEFAULT_CACHE_DIR, KeyBuilder
+from .package import Compression, save
+from .style import SLIDE_WIDTH, SLIDE_HEIGHT
+from . import theme as deck_theme
+
+DEFAULT_DIR = os.path.dirname(DEFAULT_CACHE_DIR)
+BLANK_LAYOUT_NAME = "Blank"
+THEME_SCRIPTS = {"Hang"}  # 테마 보조 글꼴 중 남길 문자 체계 (한글)
+STORED = Compression(0, 0, 0)  # 템플릿은 읽기 전용이라 압축 해제 비용도 없앰
+
+
+def _drop_rels(rels, reltype):
+    for rId, rel in list(rels.items()):
+        if rel.reltype == reltype:
+            rels.pop(rId)
+
+
+def _trim_theme(theme_part):
+    """테마 글꼴 목록에서 THEME_SCRIPTS 외 문자 체계 항목 삭제, 색·글꼴 슬롯을 덱 스타일로"""
+    theme = etree.fromstring(theme_part.blob)
+    for font in list(theme.iter(qn("a:font"))):
+        if font.get("script") not in THEME_SCRIPTS:
+            font.getparent().remove(font)
+    deck_theme.apply(theme)
+    theme_part._blob = etree.tostring(theme, xml_declaration=True, encoding="UTF-8",
+                                      standalone=True)
+
+
+def compact(prs):
+    """빈 레이아웃 하나만 남기고 썸네일·프린터 설정·테마 보조 글꼴을 덜어냄"""
+    layouts = prs.slide_layouts
+    blank = layouts.get_by_name(BLANK_LAYOUT_NAME)
+    for layout in list(layouts):
+        if layout != blank:
+            layouts.remove(layout)
+    blank.part.partname = PackURI("/ppt/slideLayouts/slideLayout1.xml")
+    master = prs.slide_master
+    _trim_theme(master.part.part_related_by(RT.THEME))
+    _drop_rels(prs.part.rels, RT.PRINTER_SETTINGS)
+    _drop_rels(prs.part.package._rels, RT.THUMBNAIL)
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    return prs
+
+
+def _digest():
+    """python-pptx 버전 + 이 모듈과 상대 import로 닿는 모듈(theme, style 등) 소스"""
+    h = hashlib.sha256(pptx.__version__.encode())
+    h.update(KeyBuilder()._module(sys.modules[__name__]))
+    return h.hexdigest()[:16]
+
+
+def build():
+    """python-pptx 기본 템플릿 → 최소 템플릿 바이트"""
+    with open(_default_pptx_path(), "rb") as f:
+        prs = compact(Presentation(io.BytesIO(f.read())))
+    buf = io.BytesIO()
+    save(prs, buf, STORED)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def template_bytes(cache_dir=DEFAULT_DIR):
+    """최소 템플릿 바이트 (프로세스당 한 번, 디스크 캐시가 있으면 읽기만)"""
+    path = os.path.join(cache_dir, f"template-{_digest()}.pptx")
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    blob = build()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # 캐시를 못 써도 이번 프로세스는 메모리의 바이트로 계속
+    return blob
@@ -0,0 +1,331 @@
+"""
+덱 빌드 파이프라인
+- 직렬 빌드: 슬라이드 함수를 순서대로 하나의 Presentation에 실행
+- 병렬 빌드(--jobs N): 워커 프로세스가 슬라이드 묶음을 만들어 XML 파트만 반환,
+  부모가 원래 순서대로 병합 → 직렬 빌드와 바이트 단위로 동일
+- 증분 빌드: 슬라이드 캐시(cache.py)에 없는 슬라이드만 렌더링
+"""
+
+import argparse
+import importlib.util
+import io
+import linecache
+import math
+import os
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.parts.slide import SlidePart
+
+from . import basetemplate, chrome, fields, instrument, package, render, slides as deck_slides
+from .cache import SlideCache, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+from .catalog import range_text
+from .sampler import Sampler
+
+_GENERATORS = {}
+
+
+@lru_cache(maxsize=16)
+def _prototype(total):
+    """총 장수별 원형 (최소 템플릿 파싱 + 콘텐츠 레이아웃) — 복제 원본으로만 씀"""
+    prs = Presentation(io.BytesIO(basetemplate.template_bytes()))
+    chrome.add_content_layout(prs, total)
+    return prs
+
+
+def new_presentation(total=None):
+    """16:9 빈 프레젠테이션 + 콘텐츠 레이아웃 (번호 옆 총 장수 total)
+
+    최소 템플릿(basetemplate.py, 이미 16:9)에 레이아웃을 미리 추가한 원형을 총 장수마다
+    한 번 만들고 덱마다 복제한다 (package.clone) → 여러 덱·변형을 만들어도 템플릿 파싱과
+    레이아웃 그리기는 한 번. 워커와 부모의 레이아웃 인덱스도 같다.
+    슬라이드 추가는 DeckSlides(slides.py)로 O(1).
+    """
+    prs = package.clone(_prototype(total))
+    deck_slides.install(prs)
+    return prs
+
+
+def load_generator(path):
+    """생성 스크립트를 경로로 import (워커에서 슬라이드 함수 조회용)
+
+    파일 mtime이 바뀌었을 때만 다시 import하므로 오래 떠 있는 프로세스
+    (빌드 서버 등)도 수정된 스크립트를 바로 반영한다.
+    """
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    entry = _GENERATORS.get(path)
+    if entry is None or entry[0] != mtime:
+        name = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        linecache.checkcache(path)  # 캐시 키용 inspect.getsource가 새 소스를 읽도록
+        spec.loader.exec_module(module)
+        entry = _GENERATORS[path] = (mtime, module)
+    return entry[1]
+
+
+# ── 슬라이드 파트 스냅샷 · 병합 ───────────────────────
+class SplicedSlidePart(SlidePart):
+    """스냅샷 XML 바이트를 그대로 보관하는 슬라이드 파트
+
+    재파싱·재직렬화 없이 저장하므로 원본과 바이트 단위로 같고,
+    요소에 접근할 때만 파싱한다.
+    """
+
+    def __init__(self, partname, package, blob):
+        super().__init__(partname, CT.PML_SLIDE, package, None)
+        self._raw = blob
+
+    @property
+    def _element(self):
+        if self._parsed is None:
+            self._parsed = parse_xml(self._raw)
+            self._raw = None
+        return self._parsed
+
+    @_element.setter
+    def _element(self, element):
+        self._parsed = element
+
+    @property
+    def blob(self):
+        if self._raw is not None:
+            return self._raw
+        return super().blob
+
+
+def snapshot_slide(prs, slide):
+    """(레이아웃 인덱스, 직렬화된 슬라이드 XML) 쌍"""
+    layout_idx = prs.slide_layouts.index(slide.slide_layout)
+    return layout_idx, slide.part.blob
+
+
+def splice_slide(prs, layout_idx, blob):
+    """스냅샷한 슬라이드 XML을 덱 끝에 새 슬라이드 파트로 추가"""
+    slides = prs.slides
+    slide_part = SplicedSlidePart(slides.next_partname(), prs.part.package, blob)
+    slide_part.relate_to(prs.slide_layouts[layout_idx].part, RT.SLIDE_LAYOUT)
+    slides.append_part(slide_part)
+
+
+def render_slides(slides):
+    """슬라이드 함수마다 새로 만든 슬라이드 파트 목록"""
+    prs = new_presentation()
+    rendered = []
+    for slide_fn in slides:
+        start = len(prs.slides)
+        slide_fn(prs)
+        rendered.append([snapshot_slide(prs, slide)
+                         for slide in list(prs.slides)[start:]])
+    return rendered
+
+
+def _render_group(path, names):
+    """워커: 슬라이드 함수 묶음을 렌더링해 파트만 반환"""
+    module = load_generator(path)
+    return render_slides([getattr(module, name) for name in names])
+
+
+def _groups(slides, jobs):
+    """순서를 유지한 연속 묶음 (워커당 약 4묶음으로 부하 분산)"""
+    size = max(1, math.ceil(len(slides) / (jobs * 4)))
+    return [slides[i:i + size] for i in range(0, len(slides), size)]
+
+
+def _render(slides, jobs):
+    """jobs > 1이면 워커 프로세스에서, 아니면 현재 프로세스에서 렌더링"""
+    if jobs <= 1 or len(slides) <= 1:
+        return render_slides(slides)
+    groups = _groups(slides, jobs)
+    paths = [group[0].__code__.co_filename for group in groups]
+    names = [[fn.__name__ for fn in group] for group in groups]
+    rendered = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for group_parts in pool.map(_render_group, paths, names):
+            rendered.extend(group_parts)
+    return rendered
+
+
+# ── 빌드 ──────────────────────────────────────────────
+def _slide_indices(text, count):
+    """"10-15", "3", "1-3,22" → 0부터 시작하는 슬라이드 인덱스 (정렬, 중복 제거)"""
+    indices = set()
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        try:
+            first = int(first)
+            last = int(last) if last else first
+        except ValueError:
+            raise ValueError(f"슬라이드 범위 형식 오류: {part!r} (예: 10-15, 3, 1-3,22)")
+        if not 1 <= first <= last <= count:
+            raise ValueError(f"슬라이드 범위 {part.strip()}: 1~{count} 사이여야 함")
+        indices.update(range(first - 1, last))
+    return sorted(indices)
+
+
+def slide_runs(text, count):
+    """"1-3,5,4,22" → ["1-5", "22"] (이어지는 구간마다 하나, 범위 검사 포함)"""
+    return range_text(i + 1 for i in _slide_indices(text, count)).split(",")
+
+
+def parse_slide_range(text, count):
+    """"10-15", "3", "1-3,4-6" → 0부터 시작하는 슬라이드 인덱스
+
+    한 덱의 쪽 번호(slidenum 필드·{{page}})는 firstSlideNum부터 이어지므로
+    중간이 빠진 선택("1-3,22")은 한 덱으로 만들 수 없어 ValueError.
+    build 명령은 slide_runs로 나눠 구간마다 따로 빌드한다.
+    """
+    indices = _slide_indices(text, count)
+    if indices[-1] - indices[0] + 1 != len(indices):
+        raise ValueError(f"슬라이드 범위 {text}: 중간이 빠진 선택은 한 덱으로 빌드할 수 없음 "
+                         f"(구간마다 따로: {', '.join(slide_runs(text, count))})")
+    return indices
+
+
+def partial_output(path, text):
+    """부분 빌드 출력 경로 (전체 덱을 덮어쓰지 않도록 접미사)"""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}_slides{text.replace(',', '_')}{ext}"
+
+
+def build_presentation(slides, jobs=1, cache=None, after_slide=None,
+                       total=None, numbers=None, field_values=None):
+    """슬라이드 함수 목록으로 덱 생성
+
+    jobs > 1이면 프로세스 병렬, cache가 있으면 바뀐 슬라이드만 렌더링하고
+    나머지는 캐시된 XML 파트를 그대로 이어 붙인다.
+    after_slide(prs)는 슬라이드 함수 하나가 끝날 때마다 호출된다
+    (스트리밍 저장기의 flush 연결용).
+    부분 빌드는 total(전체 장수)과 numbers(슬라이드마다 전체 덱 기준 번호, 이어지는 구간)로
+    번호 필드가 전체 덱과 같게 표시되고, field_values(fields.table(전체 SLIDES))로
+    상호 참조·섹션 시작 쪽이 전체 덱 기준이 된다.
+    """
+    numbers = list(numbers or range(1, len(slides) + 1))
+    if numbers != list(range(numbers[0], numbers[0] + len(numbers))):
+        raise ValueError("부분 빌드는 이어지는 슬라이드만 가능 (slidenum 필드는 firstSlideNum부터 연속)")
+    prs = new_presentation(total or len(slides))
+    if numbers[0] != 1:
+        prs._element.set("firstSlideNum", str(numbers[0]))
+    resolve = fields.Resolver(field_values or fields.table(slides, total), numbers)
+    if cache is None and (jobs <= 1 or len(slides) <= 1):
+        for slide_fn in slides:
+            slide_fn(prs)
+            resolve(prs)
+            if after_slide:
+                after_slide(prs)
+        return prs
+
+    keys = [cache.key(fn) for fn in slides] if cache else [None] * len(slides)
+    found = [cache.get(key) for key in keys] if cache else [None] * len(slides)
+    fresh = iter(_render([fn for fn, parts in zip(slides, found)
+                          if parts is None], jobs))
+    for i, key in enumerate(keys):
+        parts, found[i] = found[i], None
+        if parts is None:
+            parts = next(fresh)
+            if cache:
+                cache.put(key, parts)
+        for layout_idx, blob in parts:
+            splice_slide(prs, layout_idx, blob)
+        resolve(prs)
+        if after_slide:
+            after_slide(prs)
+    return prs
+
+
+def main(slides, output_path, argv=None):
+    """생성 스크립트 공용 진입점"""
+    parser = argparse.ArgumentParser(description="발표자료 PPT 생성")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="병렬 빌드 워커 수 (1 = 직렬, 0 = CPU 코어 수)")
+    parser.add_argument("-o", "--output", default=output_path,
+                        help="출력 .pptx 경로")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="슬라이드 캐시 없이 전체 재빌드")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="슬라이드 캐시 디렉터리")
+    parser.add_argument("--cache-size", type=int,
+                        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="슬라이드 캐시 상한 (MB)")
+    parser.add_argument("--stream", action="store_true",
+                        help="슬라이드를 완성되는 대로 기록·해제 (대용량 덱 메모리 절약)")
+    parser.add_argument("--backend", choices=["pptx", "xml"], default=render.BACKEND,
+                        help="기본 도형 렌더링 백엔드 (xml = 도형 XML 템플릿 복사)")
+    parser.add_argument("--compression", choices=list(package.POLICIES),
+                        default=package.COMPRESSION,
+                        help="zip 압축 정책 (fast = 빠르게, max = 가장 작게, zip = zipfile 기본)")
+    parser.add_argument("--slides", metavar="RANGE",
+                        help="이어지는 일부 슬라이드만 빌드 (예: 10-15, 3)")
+    parser.add_argument("--instrument", action="store_true",
+                        help="슬라이드별 시간·메모리·도형 수·XML 크기 계측 (직렬, 캐시 없이)")
+    parser.add_argument("--instrument-out", metavar="PATH",
+                        help="계측 결과 저장 (.json 또는 .csv)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="계측·프로파일 요약에 출력할 항목 수")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="빌드 전체를 샘플링해 collapsed stack 저장 (flame graph용, 직렬 빌드)")
+    args = parser.parse_args(argv)
+    total = len(slides)
+    field_values = fields.table(slides)
+    indices = list(range(total))
+    if args.slides:
+        try:
+            indices = parse_slide_range(args.slides, total)
+        except ValueError as e:
+            parser.error(str(e))
+        slides = [slides[i] for i in indices]
+        if args.output == output_path:
+            args.output = partial_output(output_path, args.slides)
+    numbers = [i + 1 for i in indices]
+    # 워커 프로세스도 같은 백엔드를 쓰도록 환경 변수로도 전달
+    render.BACKEND = os.environ["HYDROGEN_DECKS_BACKEND"] = args.backend
+    package.COMPRESSION = args.compression
+
+    jobs = args.jobs or os.cpu_count() or 1
+    cache = None
+    if not args.no_cache and not args.instrument:
+        cache = SlideCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    recorder = None
+    if args.instrument or args.instrument_out:
+        # 계측은 이 프로세스에서 슬라이드 함수를 직접 실행해야 하므로 직렬·캐시 없이
+        recorder = instrument.Recorder()
+        recorder.start()
+        slides = recorder.wrap_all(slides, [i + 1 for i in indices])
+        jobs, cache = 1, None
+    sampler = None
+    if args.profile:
+        sampler = Sampler()
+        sampler.start()
+        jobs = 1  # 워커 프로세스는 샘플링하지 않으므로 직렬
+    if args.stream:
+        writer = package.StreamWriter(args.output)
+        prs = build_presentation(slides, jobs=jobs, cache=cache,
+                                 after_slide=writer.flush, total=total,
+                                 numbers=numbers, field_values=field_values)
+        writer.close(prs)
+    else:
+        prs = build_presentation(slides, jobs=jobs, cache=cache, total=total,
+                                 numbers=numbers, field_values=field_values)
+        package.save(prs, args.output)
+    if sampler:
+        sampler.stop()
+    print(f"PPT 생성 완료: {args.output}")
+    print(f"총 {len(prs.slides)}장 슬라이드")
+    if cache:
+        print(f"슬라이드 캐시: {cache.hits}장 재사용, {cache.misses}장 렌더링")
+    if recorder:
+        recorder.stop()
+        print()
+        instrument.print_top(recorder.stats, args.top)
+        if args.instrument_out:
+            instrument.write(recorder.stats, args.instrument_out)
+            print(f"계측 결과: {args.instrument_out}")
+    if sampler:
+        print()
+        sampler.print_summary(args.top)
+        sampler.write_collapsed(args.profile)
+        print(f"collapsed stack: {args.profile}")
@@ -0,0 +1,193 @@
+"""
+슬라이드 단위 빌드 캐시
+- 키: 슬라이드 함수 소스 + 참조하는 데이터·헬퍼 + 공용 모듈(style, render 등) 소스
+  + python-pptx 버전
+- 값: 직렬화된 슬라이드 XML 파트 목록 (레이아웃 인덱스 포함)
+- LRU 방출: 적중 시 mtime 갱신, 용량 초과 시 오래 안 쓴 항목부터 삭제
+"""
+
+import ast
+import hashlib
+import importlib.util
+import inspect
+import os
+import pickle
+import sys
+import types
+
+import pptx
+
+CACHE_VERSION = 3
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "hydrogen_decks", "slides",
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+
+# ── 캐시 키 ───────────────────────────────────────────
+def _global_names(code):
+    """코드 객체(중첩 포함)가 참조하는 전역 이름"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _package_module(value):
+    """hydrogen_decks 내부 모듈이거나 그 모듈에 정의된 객체면 해당 모듈"""
+    if isinstance(value, types.ModuleType):
+        module = value
+    elif isinstance(value, (types.FunctionType, type)):
+        module = sys.modules.get(value.__module__)
+    else:
+        return None
+    if module is not None and module.__name__.startswith(_PACKAGE + "."):
+        return module
+    return None
+
+
+def _relative_imports(module, source):
+    """모듈 소스의 상대 import(from .style import ...) 대상 공용 모듈"""
+    deps = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.ImportFrom) and node.level:
+            base = importlib.util.resolve_name(
+                "." * node.level + (node.module or ""), module.__package__
+            )
+            names = [base] if node.module else [
+                f"{base}.{alias.name}" for alias in node.names
+            ]
+            deps.extend(sys.modules[name] for name in names
+                        if name in sys.modules)
+    return deps
+
+
+class KeyBuilder:
+    """슬라이드 함수 → 캐시 키 (모듈·함수 지문은 빌드 동안 메모)"""
+
+    def __init__(self):
+        self._memo = {}
+
+    def key(self, slide_fn):
+        h = hashlib.sha256()
+        h.update(f"{CACHE_VERSION}:{pptx.__version__}:".encode())
+        h.update(self._function(slide_fn))
+        return h.hexdigest()
+
+    def _module(self, module):
+        """공용 모듈 소스 + 그 모듈이 import하는 다른 공용 모듈"""
+        memo_key = ("module", module.__name__)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = b""  # 순환 참조 방지
+            with open(module.__file__, "rb") as f:
+                source = f.read()
+            h = hashlib.sha256(source)
+            for dep in _relative_imports(module, source):
+                h.update(self._module(dep))
+            self._memo[memo_key] = h.digest()
+        return self._memo[memo_key]
+
+    def _function(self, fn):
+        """함수 소스 + 참조하는 전역(같은 모듈 함수는 재귀, 데이터는 repr)"""
+        memo_key = ("function", fn.__module__, fn.__qualname__)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = b""
+            h = hashlib.sha256(inspect.getsource(fn).encode())
+            for name in sorted(_global_names(fn.__code__)):
+                if name in fn.__globals__:
+                    h.update(name.encode())
+                    h.update(self._value(fn.__globals__[name], fn))
+            self._memo[memo_key] = h.digest()
+        return self._memo[memo_key]
+
+    def _value(self, value, owner):
+        module = _package_module(value)
+        if module is not None:
+            return self._module(module)
+        if isinstance(value, types.FunctionType):
+            if value.__module__ == owner.__module__:
+                return self._function(value)
+            return f"{value.__module__}.{value.__qualname__}".encode()
+        if isinstance(value, (types.ModuleType, type)):
+            return value.__name__.encode()
+        return repr(value).encode()
+
+
+# ── 디스크 캐시 ───────────────────────────────────────
+class SlideCache:
+    """내용 주소 기반 슬라이드 파트 저장소 (크기 상한 + LRU)"""
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, keys=None):
+        """keys: 여러 빌드에 걸쳐 재사용할 KeyBuilder (소스가 그대로일 때만)"""
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._keys = keys or KeyBuilder()
+        self._size = None
+
+    def key(self, slide_fn):
+        return self._keys.key(slide_fn)
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".slide")
+
+    def get(self, key):
+        """캐시된 [(레이아웃 인덱스, XML 바이트), ...] 또는 None"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                parts = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return parts
+
+    def put(self, key, parts):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = pickle.dumps(parts, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """(경로, 크기, mtime) 목록"""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for bucket in os.scandir(self.root):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(".slide"):
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_size, st.st_mtime))
+        return entries
+
+    def evict(self):
+        """최근 사용 순으로 max_bytes 이하가 될 때까지 오래된 항목 삭제"""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._size = total
@@ -0,0 +1,224 @@
+"""
+생성 스크립트 정적 목록 (python-pptx를 import하지 않는 메타데이터 명령용)
+- 스크립트를 실행하지 않고 ast로 읽어 @REGISTRY.slide 등록(순서·섹션·태그)과
+  슬라이드 함수 이름·제목·설명·줄 범위·참조하는 연구 문서를 뽑음 (registry.py와 같은 순서 규칙)
+- 제목은 함수 안 첫 setup_slide(prs, "...") 문자열, 없으면 docstring 첫 줄 (표지·결론)
+- 스크립트 하나 파싱에 20~30 ms라 결과를 (mtime, 크기)로 JSON 캐시
+  → 두 번째 실행부터는 파일 stat + JSON 읽기만 (ast도 바뀐 스크립트가 있을 때만 import)
+- list-slides / show-slide / validate-spec 명령과 decks.DECKS가 사용
+"""
+
+import json
+import os
+import re
+from typing import NamedTuple
+
+CATALOG_VERSION = 2
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DECKS = {
+    "수소에너지_발표자료": os.path.join("수소에너지", "create_ppt.py"),
+    "연료전지_발표자료": os.path.join("연료전지", "create_fuelcell_ppt.py"),
+    "수소자동차_시장분석_발표자료": os.path.join("수소에너지", "create_hydrogen_car_ppt.py"),
+}
+
+# cache.DEFAULT_CACHE_DIR 옆 (cache 모듈은 pptx를 import하므로 경로만 같게 계산)
+DEFAULT_CATALOG = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "hydrogen_decks", "catalog.json",
+)
+
+_NUMBERED = re.compile(r"slide_(\d+)_")
+
+
+class SlideInfo(NamedTuple):
+    number: int
+    name: str
+    title: str
+    doc: str
+    line: int
+    end_line: int
+    documents: tuple  # 참조하는 mdtables.Document 파일 이름
+    section: str
+    tags: tuple
+    position: int  # 등록(정의) 순서 — order=로 옮기지 않았으면 number와 같음
+
+
+class DeckInfo(NamedTuple):
+    name: str
+    path: str
+    slides: list
+    unused: list  # 정의됐지만 등록하지 않은 slide_ 함수
+
+    def select(self, section=None, tag=None):
+        """섹션(앞부분 일치)·태그로 고른 슬라이드 번호"""
+        return [s.number for s in self.slides
+                if (section is None or s.section.startswith(section))
+                and (tag is None or tag in s.tags)]
+
+
+def range_text(numbers):
+    """[3, 4, 5, 9] → "3-5,9" (build --slides 형식)"""
+    parts = []
+    for number in sorted(numbers):
+        if parts and parts[-1][1] == number - 1:
+            parts[-1][1] = number
+        else:
+            parts.append([number, number])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in parts)
+
+
+def resolve(names):
+    """덱 이름(앞부분만 써도 됨) → 등록 이름 목록, 비어 있으면 전체"""
+    if not names:
+        return list(DECKS)
+    resolved = []
+    for name in names:
+        found = [deck for deck in DECKS if deck == name] or \
+                [deck for deck in DECKS if deck.startswith(name)]
+        if len(found) != 1:
+            choices = ", ".join(found or DECKS)
+            raise ValueError(f"덱 {name!r}: {'모호함' if found else '없음'} ({choices})")
+        if found[0] not in resolved:
+            resolved.append(found[0])
+    return resolved
+
+
+# ── 스크립트 읽기 ─────────────────────────────────────
+def _title(fn):
+    import ast
+
+    for node in ast.walk(fn):
+        if isinstance(node, ast.Call) and len(node.args) >= 2:
+            func = node.func
+            called = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+            arg = node.args[1]
+            if called == "setup_slide" and isinstance(arg, ast.Constant) \
+                    and isinstance(arg.value, str):
+                return arg.value
+    return (ast.get_docstring(fn) or "").split("\n")[0]
+
+
+def _documents(tree):
+    """모듈 수준 X = mdtables.Document(..., "파일.md") → {X: 파일 이름}"""
+    import ast
+
+    found = {}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)):
+            continue
+        func = node.value.func
+        if getattr(func, "attr", getattr(func, "id", None)) != "Document":
+            continue
+        names = [c.value for c in ast.walk(node.value)
+                 if isinstance(c, ast.Constant) and isinstance(c.value, str)]
+        for target in node.targets:
+            if isinstance(target, ast.Name) and names:
+                found[target.id] = names[-1]
+    return found
+
+
+def _registration(fn):
+    """@REGISTRY.slide(section, tags=..., order=...) 인자 → (section, tags, order) 또는 None"""
+    import ast
+
+    for deco in fn.decorator_list:
+        if not (isinstance(deco, ast.Call) and getattr(deco.func, "attr", None) == "slide"):
+            continue
+        args = {kw.arg: kw.value for kw in deco.keywords}
+        if deco.args:
+            args["section"] = deco.args[0]
+        values = {key: ast.literal_eval(node) for key, node in args.items()}
+        return values.get("section", ""), tuple(values.get("tags", ())), values.get("order")
+    return None
+
+
+def scan(source):
+    """스크립트 소스 → JSON으로 저장할 수 있는 dict (slides, unused)"""
+    import ast
+
+    tree = ast.parse(source)
+    documents = _documents(tree)
+    registered, unused = [], []
+    for fn in tree.body:
+        if not isinstance(fn, ast.FunctionDef):
+            continue
+        found = _registration(fn)
+        if found is None:
+            if fn.name.startswith("slide_"):
+                unused.append(fn.name)
+            continue
+        section, tags, order = found
+        position = len(registered) + 1
+        used = {n.id for n in ast.walk(fn) if isinstance(n, ast.Name)}
+        registered.append((position if order is None else order, [
+            fn.name, _title(fn), ast.get_docstring(fn) or "", fn.lineno, fn.end_lineno,
+            sorted(documents[n] for n in used & documents.keys()), section, list(tags),
+            position]))
+    registered.sort(key=lambda item: item[0])  # 같은 order면 정의 순서 (안정 정렬)
+    return {"slides": [row for _, row in registered], "unused": unused}
+
+
+# ── 캐시 ──────────────────────────────────────────────
+def _load(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if data.get("version") == CATALOG_VERSION else {}
+
+
+def _store(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def load(names=None, cache_path=DEFAULT_CATALOG):
+    """덱 이름 목록 → [DeckInfo, ...] (cache_path=None이면 캐시 없이 매번 파싱)"""
+    data = _load(cache_path) if cache_path else {}
+    entries = data.get("decks", {})
+    changed = False
+    infos = []
+    for name in resolve(names):
+        path = os.path.join(ROOT, DECKS[name])
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = entries.get(name)
+        if entry is None or entry["stamp"] != stamp:
+            with open(path, encoding="utf-8") as f:
+                entry = entries[name] = {"stamp": stamp, **scan(f.read())}
+            changed = True
+        slides = [SlideInfo(number, name_, title, doc, line, end, tuple(docs), section,
+                            tuple(tags), position)
+                  for number, (name_, title, doc, line, end, docs, section, tags, position)
+                  in enumerate(entry["slides"], start=1)]
+        infos.append(DeckInfo(name, path, slides, entry["unused"]))
+    if changed and cache_path:
+        try:
+            _store(cache_path, {"version": CATALOG_VERSION, "decks": entries})
+        except OSError:
+            pass  # 캐시를 못 써도 목록은 그대로 돌려줌
+    return infos
+
+
+# ── 검증 ──────────────────────────────────────────────
+def problems(deck):
+    """등록 누락·함수 번호·제목·섹션·연구 문서 불일치 메시지 목록"""
+    found = [f"{name}: @REGISTRY.slide로 등록하지 않음" for name in deck.unused]
+    for s in deck.slides:
+        m = _NUMBERED.match(s.name)
+        if m and int(m.group(1)) != s.position:
+            found.append(f"{s.number}번 {s.name}: 함수 이름 번호와 정의 순서({s.position})가 다름")
+        if not s.title:
+            found.append(f"{s.number}번 {s.name}: 제목 없음 (setup_slide 문자열·docstring 모두 없음)")
+        if not s.section:
+            found.append(f"{s.number}번 {s.name}: 섹션 없음")
+        for doc in s.documents:
+            if not os.path.exists(os.path.join(os.path.dirname(deck.path), doc)):
+                found.append(f"{s.number}번 {s.name}: 연구 문서 없음 {doc}")
+    return found
@@ -0,0 +1,91 @@
+"""
+콘텐츠 슬라이드 공통 장식(chrome)을 담은 사용자 지정 레이아웃
+- 흰 배경, 남색 헤더 바, 녹색 포인트 라인, 하단 라인, 슬라이드 번호를
+  슬라이드마다 그리지 않고 레이아웃에 한 번만 둔다
+- 슬라이드 번호는 slidenum 필드라 각 슬라이드에서 자기 번호로 표시된다
+"""
+
+from copy import deepcopy
+from types import SimpleNamespace
+
+from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.parts.slide import SlideLayoutPart
+from pptx.shapes.shapetree import SlideShapes
+from pptx.util import Inches
+
+from .style import WHITE, MEDIUM_GRAY, FONT_NAME
+from .templates import run_properties
+
+CONTENT_LAYOUT_NAME = "Hydrogen Content"
+BLANK_LAYOUT = 0  # 최소 템플릿(basetemplate)의 유일한 기본 레이아웃
+# 레이아웃 XML이 빌드마다 같도록 고정 필드 id 사용
+SLIDENUM_FIELD_ID = "{5C1E6A0B-2F4D-4B8E-9D3A-7E1F0C2B4A61}"
+
+
+def content_layout(prs):
+    """콘텐츠 레이아웃 (없으면 번호만 있는 레이아웃을 새로 추가)"""
+    layout = prs.slide_layouts.get_by_name(CONTENT_LAYOUT_NAME)
+    if layout is None:
+        layout = add_content_layout(prs)
+    return layout
+
+
+def add_content_layout(prs, total=None):
+    """빈 레이아웃을 복제해 장식 도형을 얹은 레이아웃을 마스터에 추가"""
+    from . import render
+
+    master = prs.slide_master
+    package = prs.part.package
+    element = deepcopy(prs.slide_layouts[BLANK_LAYOUT]._element)
+    del element.attrib["type"]
+    element.cSld.set("name", CONTENT_LAYOUT_NAME)
+    spTree = element.cSld.spTree
+    for sp in spTree.xpath("./p:sp"):
+        spTree.remove(sp)
+
+    partname = package.next_partname("/ppt/slideLayouts/slideLayout%d.xml")
+    part = SlideLayoutPart(partname, CT.PML_SLIDE_LAYOUT, package, element)
+    part.relate_to(master.part, RT.SLIDE_MASTER)
+    rId = master.part.relate_to(part, RT.SLIDE_LAYOUT)
+    used = [int(i) for i in prs.part._element.xpath(".//p:sldMasterId/@id")]
+    used += [int(i) for i in master._element.xpath(".//p:sldLayoutId/@id")]
+    sldLayoutId = OxmlElement("p:sldLayoutId")
+    sldLayoutId.set("id", str(max(used) + 1))
+    sldLayoutId.set(qn("r:id"), rId)
+    master._element.get_or_add_sldLayoutIdLst().append(sldLayoutId)
+
+    layout = part.slide_layout
+    canvas = SimpleNamespace(background=layout.background,
+                             shapes=SlideShapes(spTree, layout))
+    render.add_background(canvas, WHITE)
+    render.add_navy_header_bar(canvas)
+    render.add_green_accent_line(canvas)
+    render.add_footer_line(canvas)
+    add_slide_number_field(canvas, total)
+    return layout
+
+
+def add_slide_number_field(slide, total=None):
+    """우측 하단 슬라이드 번호 - slidenum 필드 (+ " / total")"""
+    txBox = slide.shapes.add_textbox(
+        Inches(12.0), Inches(7.0), Inches(1.2), Inches(0.4)
+    )
+    p = txBox.text_frame.paragraphs[0]
+    p.alignment = PP_ALIGN.RIGHT
+    rPr = run_properties(12, False, MEDIUM_GRAY, FONT_NAME)
+    fld = OxmlElement("a:fld")
+    fld.set("id", SLIDENUM_FIELD_ID)
+    fld.set("type", "slidenum")
+    fld.append(deepcopy(rPr))
+    t = OxmlElement("a:t")
+    t.text = "\u2039#\u203a"
+    fld.append(t)
+    p._p.append(fld)
+    if total is not None:
+        run = p.add_run()
+        run.text = f" / {total}"
+        run._r.insert(0, deepcopy(rPr))
+    return txBox
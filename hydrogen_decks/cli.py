@@ -0,0 +1,437 @@
+"""
+hydrogen-decks 명령줄 (python -m hydrogen_decks <명령>)
+- build: 세 발표자료 전체 또는 일부를 한 프로세스에서 동시에 빌드
+- make: 문서 → 표 → 슬라이드 → 덱 → README 의존 그래프 빌드 (--explain)
+- serve / stop: 빌드 서버 실행·종료 (build --server가 서버에 요청)
+- retheme: 완성된 .pptx(디렉터리째)의 색상·글꼴을 매핑 표대로 바꿈
+- list-slides / show-slide / validate-spec: 생성 스크립트를 실행하지 않고 정적 목록
+  (catalog)으로 슬라이드 메타데이터 조회·검증 — python-pptx를 import하지 않음
+- 무거운 모듈(python-pptx, socketserver 등)은 명령 실행 시점에 import
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from . import catalog
+
+DEFAULT_CACHE_MB = 256
+
+
+# ── build ─────────────────────────────────────────────
+def _print_results(results, cached, seconds, jobs):
+    print(f"{'덱':<30}{'슬라이드':>8}{'시간(s)':>10}{'캐시':>10}  출력")
+    for r in results:
+        hits = f"{r['hits']}/{r['hits'] + r['misses']}" if cached else "-"
+        print(f"{r['name']:<30}{r['slides']:>8}{r['seconds']:>10.2f}{hits:>10}  {r['output']}")
+    print(f"전체 {seconds:.2f}s (워커 {jobs}개)")
+
+
+def _selection(args):
+    """(덱 이름 목록, 슬라이드 범위)
+
+    --section / --tag는 정적 목록(catalog)으로 덱별 범위를 만들어서
+    고른 슬라이드가 없는 덱은 생성 스크립트를 import하지 않는다.
+    """
+    if not (args.section or args.tag):
+        return catalog.resolve(args.decks), args.slides
+    if args.slides:
+        raise ValueError("--slides와 --section/--tag는 함께 쓸 수 없음")
+    ranges = {}
+    for deck in catalog.load(args.decks):
+        numbers = deck.select(args.section, args.tag)
+        if numbers:
+            ranges[deck.name] = catalog.range_text(numbers)
+    if not ranges:
+        raise ValueError("섹션·태그 조건에 맞는 슬라이드 없음")
+    return list(ranges), ranges
+
+
+def _build_on_server(args):
+    from .daemon import ServerError, request
+
+    try:
+        names, slide_range = _selection(args)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+    jobs = args.jobs or 1
+    payload = {"command": "build", "decks": names, "slides": slide_range,
+               "jobs": jobs, "no_cache": args.no_cache, "backend": args.backend,
+               "compression": args.compression,
+               "out_dir": os.path.abspath(args.out_dir) if args.out_dir else None}
+    start = time.perf_counter()
+    try:
+        reply, _ = request(payload, args.socket)
+    except OSError:
+        print(f"오류: 빌드 서버 없음 ({args.socket}) — python -m hydrogen_decks serve",
+              file=sys.stderr)
+        return 2
+    except ServerError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    _print_results(reply["results"], not args.no_cache, time.perf_counter() - start, jobs)
+    return 0
+
+
+def _watch(args, names, slide_range, cache_dir):
+    from . import decks
+
+    print(f"감시 중 (Ctrl+C로 종료): {', '.join(names)}", flush=True)
+    seen = set()
+    try:
+        for event in decks.watch(names, args.interval, args.out_dir, slide_range,
+                                 cache_dir, args.cache_size * 1024 * 1024, args.backend,
+                                 args.compression or "fast"):
+            stamp = time.strftime("%H:%M:%S")
+            if event.error:
+                print(f"[{stamp}] {event.name}: 빌드 실패 — {event.error}", flush=True)
+                continue
+            r = event.result
+            if event.name in seen:
+                what = f"슬라이드 {', '.join(map(str, event.changed))} 변경"
+            else:
+                what = f"{r.slides}장 빌드"
+                seen.add(event.name)
+            print(f"[{stamp}] {r.name}: {what}, {r.misses}장 렌더링 "
+                  f"({r.seconds:.2f}s) → {r.output}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    except decks.PackageChanged as e:
+        # 고친 패키지 모듈은 이 프로세스에 다시 불러올 수 없으므로 새 프로세스로 교체
+        print(f"[{time.strftime('%H:%M:%S')}] 패키지 소스 변경 ({e}) — 감시 다시 시작",
+              flush=True)
+        os.execv(sys.executable, [sys.executable, "-m", __package__] + sys.argv[1:])
+    return 0
+
+
+def cmd_build(args):
+    if args.server:
+        return _build_on_server(args)
+    if args.watch and args.no_cache:
+        print("오류: --watch는 슬라이드 캐시로 바뀐 슬라이드만 렌더링하므로 --no-cache와 함께 쓸 수 없음",
+              file=sys.stderr)
+        return 2
+
+    from . import decks
+    from .cache import DEFAULT_CACHE_DIR
+
+    try:
+        names, slide_range = _selection(args)
+        decks.deck_jobs(names, slide_range)  # 범위 검사 (빌드 전에 오류 보고)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+    jobs = args.jobs or min(len(names), os.cpu_count() or 1)
+    cache_dir = None if args.no_cache else args.cache_dir or DEFAULT_CACHE_DIR
+    if args.watch:
+        return _watch(args, names, slide_range, cache_dir)
+
+    sampler = None
+    if args.profile:
+        from .sampler import Sampler
+        sampler = Sampler()
+        jobs = 1  # 워커 프로세스는 샘플링하지 않으므로 직렬
+
+    start = time.perf_counter()
+    if sampler:
+        sampler.start()
+    results = [r._asdict() for r in decks.build_decks(
+        names, jobs=jobs, out_dir=args.out_dir, slide_range=slide_range,
+        cache_dir=cache_dir, cache_bytes=args.cache_size * 1024 * 1024,
+        backend=args.backend, compression=args.compression)]
+    if sampler:
+        sampler.stop()
+    _print_results(results, cache_dir, time.perf_counter() - start, jobs)
+    if sampler:
+        print()
+        sampler.print_summary()
+        sampler.write_collapsed(args.profile)
+        print(f"collapsed stack: {args.profile}")
+    return 0
+
+
+# ── make ──────────────────────────────────────────────
+def cmd_make(args):
+    from . import dag
+    from .cache import DEFAULT_CACHE_DIR
+
+    try:
+        names = catalog.resolve(args.decks)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+
+    def explain(node_id, rebuilt, reason):
+        print(f"{'빌드' if rebuilt else '건너뜀':<6}{node_id:<48}{reason}", flush=True)
+
+    start = time.perf_counter()
+    graph = dag.Graph(names, out_dir=args.out_dir,
+                      cache_dir=args.cache_dir or DEFAULT_CACHE_DIR,
+                      cache_bytes=args.cache_size * 1024 * 1024,
+                      readme=not args.no_readme)
+    report = dag.run(graph, jobs=args.jobs or os.cpu_count() or 1,
+                     state_path=args.state or dag.DEFAULT_STATE,
+                     explain=explain if args.explain else None)
+    rebuilt = [nid for nid, (done, _, _) in report.items() if done]
+    kinds = {}
+    for nid in rebuilt:
+        kind = nid.split(":", 1)[0]
+        kinds[kind] = kinds.get(kind, 0) + 1
+    summary = ", ".join(f"{kind} {count}" for kind, count in kinds.items()) or "없음"
+    print(f"노드 {len(report)}개 중 {len(rebuilt)}개 빌드 ({summary}) — "
+          f"{time.perf_counter() - start:.2f}s")
+    return 0
+
+
+# ── serve / stop ──────────────────────────────────────
+def cmd_serve(args):
+    from .daemon import ServerError, serve
+
+    print(f"빌드 서버 시작: {args.socket}", flush=True)
+    try:
+        serve(args.socket, args.cache_dir, args.cache_size * 1024 * 1024)
+    except ServerError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    print("빌드 서버 종료")
+    return 0
+
+
+def cmd_stop(args):
+    from .daemon import ServerError, request
+
+    try:
+        request({"command": "shutdown"}, args.socket, timeout=5)
+    except (OSError, ServerError):
+        print(f"실행 중인 빌드 서버 없음: {args.socket}", file=sys.stderr)
+        return 1
+    return 0
+
+
+# ── 메타데이터 (pptx 없이) ────────────────────────────
+def _deck_infos(names):
+    try:
+        return catalog.load(names)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return None
+
+
+def cmd_list_slides(args):
+    infos = _deck_infos(args.decks)
+    if infos is None:
+        return 2
+    if args.json:
+        import json
+        print(json.dumps([{"name": d.name, "path": os.path.relpath(d.path, catalog.ROOT),
+                           "slides": [s._asdict() for s in d.slides
+                                      if s.number in d.select(args.section, args.tag)]}
+                          for d in infos],
+                         ensure_ascii=False, indent=1))
+        return 0
+    for deck in infos:
+        selected = set(deck.select(args.section, args.tag))
+        if not selected:
+            continue
+        print(f"{deck.name} ({os.path.relpath(deck.path, catalog.ROOT)}, {len(deck.slides)}장)")
+        section = None
+        for s in deck.slides:
+            if s.number not in selected:
+                continue
+            if s.section != section:
+                section = s.section
+                print(f"  [{section}]")
+            tags = f"  #{' #'.join(s.tags)}" if s.tags else ""
+            print(f"{s.number:>4}  {s.name:<36}{s.title}{tags}")
+    return 0
+
+
+def cmd_show_slide(args):
+    *names, number = args.target
+    try:
+        number = int(number)
+    except ValueError:
+        print(f"오류: 슬라이드 번호가 아님: {number!r}", file=sys.stderr)
+        return 2
+    infos = _deck_infos(names)
+    if infos is None:
+        return 2
+    shown = 0
+    for deck in infos:
+        if not 1 <= number <= len(deck.slides):
+            continue
+        s = deck.slides[number - 1]
+        if shown:
+            print()
+        print(f"{deck.name} {number}/{len(deck.slides)}  {s.title}")
+        print(f"  함수: {s.name} ({os.path.relpath(deck.path, catalog.ROOT)}:{s.line}-{s.end_line})")
+        print(f"  섹션: {s.section}" + (f"  태그: {', '.join(s.tags)}" if s.tags else ""))
+        if s.doc and s.doc != s.title:
+            print(f"  설명: {s.doc}")
+        if s.documents:
+            print(f"  연구 문서: {', '.join(s.documents)}")
+        shown += 1
+    if not shown:
+        print(f"오류: {number}번 슬라이드 없음", file=sys.stderr)
+        return 2
+    return 0
+
+
+SPEC_EXTENSIONS = (".json", ".toml", ".yaml", ".yml")
+
+
+def cmd_validate_spec(args):
+    specs = [t for t in args.targets if t.endswith(SPEC_EXTENSIONS) and os.path.isfile(t)]
+    names = [t for t in args.targets if t not in specs]
+    infos = _deck_infos(names) if names or not specs else []
+    if infos is None:
+        return 2
+    failed = 0
+    for deck in infos:
+        found = catalog.problems(deck)
+        print(f"{deck.name}: {'문제 ' + str(len(found)) + '개' if found else '이상 없음'} "
+              f"({len(deck.slides)}장)")
+        for problem in found:
+            print(f"  {problem}")
+        failed += bool(found)
+    if specs:
+        from .spec import SpecError, load_compiled  # 색상·길이 해석에 python-pptx 필요
+
+        for path in specs:
+            try:
+                compiled = load_compiled(path)
+            except SpecError as e:
+                print(f"{path}: {e}")
+                failed += 1
+                continue
+            print(f"{path}: 이상 없음 ({len(compiled['slides'])}장)")
+    return 1 if failed else 0
+
+
+# ── retheme ───────────────────────────────────────────
+def cmd_retheme(args):
+    from . import retheme
+
+    try:
+        table = retheme.mapping(args.color, args.font, args.map)
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+    if not table.colors and not table.fonts:
+        print("오류: 바꿀 색상(--color)이나 글꼴(--font), 매핑 파일(--map)이 필요함",
+              file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    count = changed = 0
+    for result in retheme.retheme_all(args.paths, table, out_dir=args.out_dir,
+                                      jobs=args.jobs or os.cpu_count() or 1,
+                                      compression=args.compression):
+        count += 1
+        changed += bool(result.changes)
+        print(f"{result.output:<56}{result.rewritten:>4}/{result.parts:<4} 파트"
+              f"{result.changes:>7}곳{result.seconds:>9.2f}s", flush=True)
+    print(f"{count}개 중 {changed}개 변경 — {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+# ── 진입점 ────────────────────────────────────────────
+def parser():
+    p = argparse.ArgumentParser(prog="hydrogen-decks", description="수소 발표자료 빌드 도구")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("build", help="발표자료 빌드 (기본: 세 덱 모두)")
+    b.add_argument("decks", nargs="*", metavar="DECK",
+                   help="덱 이름 또는 앞부분 (수소에너지, 연료전지, 수소자동차)")
+    b.add_argument("-j", "--jobs", type=int, default=0,
+                   help="동시에 빌드할 덱 수 (0 = 덱 수와 CPU 코어 수 중 작은 값)")
+    b.add_argument("--slides", metavar="RANGE",
+                   help="일부 슬라이드만 빌드 (예: 10-15, 1-3,22) — 출력에 _slides 접미사, "
+                        "중간이 빠지면 이어지는 구간마다 따로")
+    b.add_argument("--section", help="이 섹션(앞부분 일치, 예: \"Part 5\")의 슬라이드만 빌드")
+    b.add_argument("--tag", help="이 태그(예: 한국, 표)가 붙은 슬라이드만 빌드")
+    b.add_argument("--out-dir", help="출력 디렉터리 (기본: 각 스크립트 옆)")
+    b.add_argument("--no-cache", action="store_true", help="슬라이드 캐시 없이 전체 재빌드")
+    b.add_argument("--cache-dir", help="슬라이드 캐시 디렉터리 (기본: ~/.cache/hydrogen_decks/slides)")
+    b.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_MB,
+                   help="슬라이드 캐시 상한 (MB)")
+    b.add_argument("--backend", choices=["pptx", "xml"],
+                   default=os.environ.get("HYDROGEN_DECKS_BACKEND", "pptx"),
+                   help="기본 도형 렌더링 백엔드")
+    b.add_argument("--compression", choices=["fast", "zip", "max"],
+                   help="zip 압축 정책 (기본: max, --watch는 fast)")
+    b.add_argument("--profile", metavar="PATH",
+                   help="빌드 전체를 샘플링해 collapsed stack 저장 (flame graph용, 직렬 빌드)")
+    b.add_argument("--watch", action="store_true",
+                   help="생성 스크립트·연구 문서가 바뀔 때마다 바뀐 슬라이드만 다시 빌드")
+    b.add_argument("--interval", type=float, default=0.5, help="--watch 폴링 간격 (초)")
+    b.add_argument("--server", action="store_true",
+                   help="실행 중인 빌드 서버(serve)에 요청 — import 없이 바로 빌드")
+    b.add_argument("--socket", help="빌드 서버 소켓 경로")
+    b.set_defaults(func=cmd_build)
+
+    m = sub.add_parser("make", help="의존 그래프 빌드 (문서 → 표 → 슬라이드 → 덱 → README)")
+    m.add_argument("decks", nargs="*", metavar="DECK", help="덱 이름 또는 앞부분")
+    m.add_argument("-j", "--jobs", type=int, default=0,
+                   help="슬라이드 렌더링 워커 수 (0 = CPU 코어 수)")
+    m.add_argument("--explain", action="store_true", help="노드마다 빌드/건너뜀 이유 출력")
+    m.add_argument("--out-dir", help="출력 디렉터리 (지정하면 README는 갱신하지 않음, 일부 덱만 빌드할 때도)")
+    m.add_argument("--no-readme", action="store_true", help="README 발표자료 표 갱신 안 함")
+    m.add_argument("--state", help="그래프 상태 파일 (기본: ~/.cache/hydrogen_decks/dag.json)")
+    m.add_argument("--cache-dir", help="슬라이드 캐시 디렉터리")
+    m.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_MB,
+                   help="슬라이드 캐시 상한 (MB)")
+    m.set_defaults(func=cmd_make)
+
+    s = sub.add_parser("serve", help="빌드 서버 실행 (모듈·템플릿을 미리 로드해 두고 대기)")
+    s.add_argument("--socket", help="Unix 소켓 경로 (기본: $XDG_RUNTIME_DIR/hydrogen_decks-UID.sock)")
+    s.add_argument("--cache-dir", help="슬라이드 캐시 디렉터리")
+    s.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_MB,
+                   help="슬라이드 캐시 상한 (MB)")
+    s.set_defaults(func=cmd_serve)
+
+    t = sub.add_parser("stop", help="빌드 서버 종료")
+    t.add_argument("--socket", help="Unix 소켓 경로")
+    t.set_defaults(func=cmd_stop)
+
+    r = sub.add_parser("retheme", help="완성된 .pptx의 색상·글꼴을 매핑 표대로 바꿈 (디렉터리는 병렬)")
+    r.add_argument("paths", nargs="+", metavar="PATH", help=".pptx 파일 또는 디렉터리 (하위까지)")
+    r.add_argument("--color", action="append", default=[], metavar="OLD=NEW",
+                   help="색상 매핑 (예: 1B3A5C=0F2A4A, 여러 번 지정 가능)")
+    r.add_argument("--font", action="append", default=[], metavar="OLD=NEW",
+                   help="글꼴 매핑 (예: \"맑은 고딕=나눔고딕\")")
+    r.add_argument("--map", metavar="FILE",
+                   help='JSON 매핑 파일 ({"colors": {"1B3A5C": "0F2A4A"}, "fonts": {...}})')
+    r.add_argument("--out-dir", help="출력 디렉터리 (기본: 제자리에서 교체)")
+    r.add_argument("-j", "--jobs", type=int, default=0, help="동시에 처리할 파일 수 (0 = CPU 코어 수)")
+    r.add_argument("--compression", choices=["fast", "zip", "max"],
+                   help="바뀐 파트의 zip 압축 정책 (기본: max)")
+    r.set_defaults(func=cmd_retheme)
+
+    ls = sub.add_parser("list-slides", help="슬라이드 번호·함수·제목 목록 (pptx 없이)")
+    ls.add_argument("decks", nargs="*", metavar="DECK", help="덱 이름 또는 앞부분")
+    ls.add_argument("--section", help="이 섹션(앞부분 일치)의 슬라이드만")
+    ls.add_argument("--tag", help="이 태그가 붙은 슬라이드만")
+    ls.add_argument("--json", action="store_true", help="JSON으로 출력")
+    ls.set_defaults(func=cmd_list_slides)
+
+    sh = sub.add_parser("show-slide", help="슬라이드 하나의 함수·위치·연구 문서 (pptx 없이)")
+    sh.add_argument("target", nargs="+", metavar="[DECK] NUMBER",
+                    help="슬라이드 번호 (덱을 빼면 번호가 있는 모든 덱)")
+    sh.set_defaults(func=cmd_show_slide)
+
+    v = sub.add_parser("validate-spec",
+                       help="SLIDES 목록·함수 번호·총 장수·제목·연구 문서 검증 (pptx 없이)")
+    v.add_argument("targets", nargs="*", metavar="DECK|SPEC",
+                   help="덱 이름 또는 선언형 명세 파일 (.toml 등, 명세 검증은 pptx를 import)")
+    v.set_defaults(func=cmd_validate_spec)
+    return p
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    if getattr(args, "socket", "") is None:
+        from .daemon import DEFAULT_SOCKET
+        args.socket = DEFAULT_SOCKET
+    return args.func(args)
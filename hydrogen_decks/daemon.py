@@ -0,0 +1,178 @@
+"""
+빌드 서버 (python -m hydrogen_decks serve)
+- python-pptx·생성 스크립트·기본 템플릿을 한 번 로드해 둔 채 Unix 소켓으로 빌드 요청을 받음
+- 요청·응답은 한 줄 JSON, bytes 요청이면 응답 줄 뒤에 .pptx 바이트가 덱 순서대로 이어짐
+- 생성 스크립트는 mtime이 바뀌면 다시 import (build.load_generator),
+  hydrogen_decks 패키지 자체를 고쳤으면 빌드를 거절 (옛 모듈로 렌더링한 슬라이드가
+  새 소스의 캐시 키로 저장되지 않도록) → stop 후 serve로 다시 시작
+- 요청의 backend·compression은 그 요청에만 적용 (build_decks가 바꾼 모듈 전역과
+  HYDROGEN_DECKS_BACKEND를 요청이 끝나면 되돌림)
+- 클라이언트 쪽(request)은 python-pptx를 import하지 않음
+
+요청 예:
+    {"command": "build", "decks": ["연료전지"], "slides": "10-15", "bytes": false}
+    {"command": "ping"}
+    {"command": "shutdown"}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import time
+
+from .catalog import resolve
+
+DEFAULT_SOCKET = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+    f"hydrogen_decks-{os.getuid()}.sock")
+BACKEND_ENV = "HYDROGEN_DECKS_BACKEND"  # build_decks가 워커용으로 설정
+
+
+class ServerError(RuntimeError):
+    """서버가 요청을 처리하지 못함 (응답의 error 메시지)"""
+
+
+# ── 클라이언트 ────────────────────────────────────────
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ServerError("응답이 중간에 끊김")
+    return data
+
+
+def request(payload, socket_path=DEFAULT_SOCKET, timeout=None):
+    """요청 하나 보내고 (응답, [.pptx 바이트, ...]) 반환"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(payload, ensure_ascii=False).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+            if not line:
+                raise ServerError("서버가 응답 없이 연결을 닫음")
+            reply = json.loads(line)
+            if not reply.get("ok"):
+                raise ServerError(reply.get("error", "알 수 없는 오류"))
+            blobs = [_read_exact(f, r["size"]) for r in reply.get("results", [])
+                     if "size" in r]
+    return reply, blobs
+
+
+def running(socket_path=DEFAULT_SOCKET):
+    """소켓에 응답하는 서버가 있으면 True"""
+    try:
+        request({"command": "ping"}, socket_path, timeout=1)
+    except (OSError, ServerError):
+        return False
+    return True
+
+
+# ── 서버 ──────────────────────────────────────────────
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        blobs = []
+        try:
+            payload = json.loads(line)
+            command = payload.get("command")
+            if command == "build":
+                reply, blobs = self.server.build(payload)
+            elif command == "ping":
+                reply = {"pid": os.getpid(), "builds": self.server.builds,
+                         "uptime": time.time() - self.server.started}
+            elif command == "shutdown":
+                self.server.stopping = True
+                reply = {}
+            else:
+                raise ValueError(f"알 수 없는 명령 {command!r}")
+        except Exception as e:  # 서버는 요청 하나가 실패해도 계속 떠 있음
+            reply, blobs = {"ok": False, "error": f"{type(e).__name__}: {e}"}, []
+        else:
+            reply["ok"] = True
+        self.wfile.write(json.dumps(reply, ensure_ascii=False).encode() + b"\n")
+        for blob in blobs:
+            self.wfile.write(blob)
+
+
+class BuildServer(socketserver.UnixStreamServer):
+    """요청을 하나씩 순서대로 빌드 (덱 단위 병렬은 요청의 jobs로 워커 fork)"""
+
+    def __init__(self, socket_path, cache_dir=None, cache_bytes=None):
+        from . import decks
+        from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, KeyBuilder
+
+        self.decks = decks
+        self.key_builder = KeyBuilder
+        self.keys = None
+        self.signature = None
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.cache_bytes = cache_bytes or DEFAULT_MAX_BYTES
+        self.compression = decks.package.COMPRESSION  # 요청에 없으면 서버 시작 때 기본값
+        self.builds = 0
+        self.started = time.time()
+        self.stopping = False
+        decks.warm(list(decks.DECKS))
+        super().__init__(socket_path, _Handler)
+
+    def build(self, payload):
+        names = resolve(payload.get("decks"))
+        want_bytes = payload.get("bytes", False)
+        cache_dir = None if payload.get("no_cache") else self.cache_dir
+        changed = self.decks.package_changed()
+        if changed:
+            raise self.decks.PackageChanged(
+                f"서버 시작 후 패키지 소스가 바뀜 ({', '.join(changed)}) — "
+                "stop 후 serve로 다시 시작")
+        signature = self.decks.source_signature()
+        if signature != self.signature:
+            # 소스가 바뀌었으면 캐시 키 메모를 버림 (그대로면 키 계산 생략)
+            self.keys, self.signature = self.key_builder(), signature
+        render, package = self.decks.render, self.decks.package
+        saved = render.BACKEND, package.COMPRESSION, os.environ.get(BACKEND_ENV)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                results = list(self.decks.build_decks(
+                    names, jobs=payload.get("jobs", 1),
+                    out_dir=tmp if want_bytes else payload.get("out_dir"),
+                    slide_range=payload.get("slides"), cache_dir=cache_dir,
+                    cache_bytes=self.cache_bytes, backend=payload.get("backend"),
+                    keys=self.keys,
+                    compression=payload.get("compression") or self.compression))
+                blobs = []
+                if want_bytes:
+                    for r in results:
+                        with open(r.output, "rb") as f:
+                            blobs.append(f.read())
+        finally:
+            render.BACKEND, package.COMPRESSION, backend_env = saved
+            if backend_env is None:
+                os.environ.pop(BACKEND_ENV, None)
+            else:
+                os.environ[BACKEND_ENV] = backend_env
+        self.builds += 1
+        reply = [r._asdict() for r in results]
+        for r, blob in zip(reply, blobs):
+            r["output"] = os.path.basename(r["output"])
+            r["size"] = len(blob)
+        return {"results": reply}, blobs
+
+
+def serve(socket_path=DEFAULT_SOCKET, cache_dir=None, cache_bytes=None):
+    """서버 실행 (shutdown 요청이나 Ctrl+C까지)"""
+    if os.path.exists(socket_path):
+        if running(socket_path):
+            raise ServerError(f"이미 실행 중: {socket_path}")
+        os.unlink(socket_path)  # 죽은 서버가 남긴 소켓
+    server = BuildServer(socket_path, cache_dir, cache_bytes)
+    try:
+        while not server.stopping:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
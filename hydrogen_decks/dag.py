@@ -0,0 +1,331 @@
+"""
+빌드 의존 그래프 (python -m hydrogen_decks make)
+- 노드: md(연구 문서) → facts(문서의 표) → slide(슬라이드 함수) → deck(.pptx) → readme(요약 표)
+- 노드마다 입력 해시 = 자기 레시피(코드) + 의존 노드의 출력 해시(내용 해시)
+- 입력 해시가 지난번과 같고 출력이 남아 있으면 건너뜀
+  → 표가 없는 문단만 고친 문서는 facts 출력이 그대로라 슬라이드까지 내려가지 않음
+- 슬라이드 렌더링은 워커 프로세스(fork)에서 병렬, 나머지는 부모에서 실행
+- 상태는 ~/.cache/hydrogen_decks/dag.json, 슬라이드 결과는 슬라이드 캐시에 입력 해시로 저장
+- explain: 노드마다 빌드/건너뜀 이유
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from . import build, decks, fields, mdtables, package
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, KeyBuilder, SlideCache, _global_names
+
+DEFAULT_STATE = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "dag.json")
+README = os.path.join(decks.ROOT, "README.md")
+README_BEGIN = "<!-- hydrogen_decks:decks:begin -->"
+README_END = "<!-- hydrogen_decks:decks:end -->"
+
+
+def _sha(*chunks):
+    h = hashlib.sha256()
+    for chunk in chunks:
+        h.update(chunk if isinstance(chunk, bytes) else str(chunk).encode())
+    return h.hexdigest()
+
+
+def _file_hash(path):
+    try:
+        with open(path, "rb") as f:
+            return _sha(f.read())
+    except FileNotFoundError:
+        return None
+
+
+class _CodeKeys(KeyBuilder):
+    """문서는 mtime 대신 경로만 해시 (내용은 facts 노드 간선으로 전달)"""
+
+    def _value(self, value, owner):
+        if isinstance(value, mdtables.Document):
+            return f"Document:{value.path}".encode()
+        return super()._value(value, owner)
+
+
+def documents(fn, seen=None):
+    """슬라이드 함수(와 같은 모듈 도우미)가 참조하는 mdtables.Document 목록"""
+    seen = set() if seen is None else seen
+    if fn in seen:
+        return []
+    seen.add(fn)
+    found = []
+    for name in sorted(_global_names(fn.__code__)):
+        value = fn.__globals__.get(name)
+        if isinstance(value, mdtables.Document):
+            found.append(value)
+        elif callable(value) and getattr(value, "__module__", None) == fn.__module__ \
+                and hasattr(value, "__code__"):
+            found.extend(documents(value, seen))
+    return list({doc.path: doc for doc in found}.values())
+
+
+# ── 노드 ──────────────────────────────────────────────
+class Node:
+    """recipe: 자기 입력, deps: 의존 노드 id, pooled: 워커 프로세스에서 실행"""
+    pooled = False
+
+    def __init__(self, id, deps=(), recipe=""):
+        self.id = id
+        self.deps = list(deps)
+        self.recipe = recipe
+
+    def valid(self, output):
+        """기록된 출력 해시의 결과물이 아직 있는지"""
+        return True
+
+    def run(self, graph):
+        """실행 → 출력 해시"""
+        raise NotImplementedError
+
+
+class MarkdownNode(Node):
+    def __init__(self, path):
+        super().__init__(f"md:{os.path.relpath(path, decks.ROOT)}")
+        self.path = path
+
+    def run(self, graph):
+        return _file_hash(self.path)
+
+
+class FactsNode(Node):
+    def __init__(self, path, md_id):
+        super().__init__(f"facts:{os.path.relpath(path, decks.ROOT)}", [md_id],
+                         _file_hash(mdtables.__file__))
+        self.path = path
+
+    def run(self, graph):
+        return _sha(repr([t[1:] for t in mdtables.parse_file(self.path)]))
+
+
+class SlideNode(Node):
+    pooled = True
+
+    def __init__(self, deck, number, fn, code_key, deps, cache):
+        super().__init__(f"slide:{deck}:{number:02d}", deps, code_key)
+        self.fn = fn
+        self.cache = cache
+        self.parts = None
+
+    def valid(self, output):
+        return os.path.exists(self.cache._path(self.input))
+
+    def task(self):
+        return _render_slide, (self.fn.__code__.co_filename, self.fn.__name__)
+
+    def finish(self, parts):
+        self.parts = parts
+        self.cache.put(self.input, parts)
+        return _sha(*(f"{layout}:".encode() + blob for layout, blob in parts))
+
+    def run(self, graph):
+        return self.finish(build.render_slides([self.fn])[0])
+
+    def result(self):
+        """렌더링 결과 (valid() 확인 뒤 캐시 LRU로 지워졌으면 다시 렌더링해 캐시에 넣음)"""
+        parts = self.parts if self.parts is not None else self.cache.get(self.input)
+        if parts is None:
+            self.finish(build.render_slides([self.fn])[0])
+            parts = self.parts
+        return parts
+
+
+def _render_slide(path, name):
+    """워커: 슬라이드 함수 하나 렌더링"""
+    return build.render_slides([getattr(build.load_generator(path), name)])[0]
+
+
+class DeckNode(Node):
+    def __init__(self, name, output, slide_ids, field_values, recipe):
+        super().__init__(f"deck:{name}", slide_ids, recipe + repr(field_values).encode())
+        self.name = name
+        self.output = output
+        self.field_values = field_values
+
+    def valid(self, output):
+        return _file_hash(self.output) == output
+
+    def run(self, graph):
+        prs = build.new_presentation(self.field_values["total"])
+        resolve = fields.Resolver(self.field_values)
+        for slide_id in self.deps:
+            parts = graph.nodes[slide_id].result()
+            for layout_idx, blob in parts:
+                build.splice_slide(prs, layout_idx, blob)
+        resolve(prs)
+        package.save_atomic(prs, self.output)
+        return _file_hash(self.output)
+
+
+class ReadmeNode(Node):
+    """README의 표시 블록 안 발표자료 표 갱신 (블록이 없으면 건드리지 않음)"""
+
+    def __init__(self, deck_nodes):
+        super().__init__("readme", [n.id for n in deck_nodes])
+        self.deck_nodes = deck_nodes
+
+    def table(self):
+        lines = [README_BEGIN, "| 덱 | 슬라이드 | 생성 스크립트 |", "|---|---|---|"]
+        for node in self.deck_nodes:
+            script = decks.DECKS[node.name]
+            output = os.path.join(os.path.dirname(script), f"{node.name}.pptx")
+            lines.append(f"| [{node.name}]({output}) | {len(node.deps)}장 "
+                         f"| [{os.path.basename(script)}]({script}) |")
+        lines.append(README_END)
+        return "\n".join(lines)
+
+    def valid(self, output):
+        return _file_hash(README) == output
+
+    def run(self, graph):
+        with open(README, encoding="utf-8") as f:
+            text = f.read()
+        pattern = re.compile(re.escape(README_BEGIN) + ".*?" + re.escape(README_END), re.S)
+        if pattern.search(text):
+            new = pattern.sub(lambda m: self.table(), text)
+            if new != text:
+                with open(README, "w", encoding="utf-8") as f:
+                    f.write(new)
+        return _file_hash(README)
+
+
+# ── 그래프 ────────────────────────────────────────────
+class Graph:
+    def __init__(self, names, out_dir=None, cache_dir=DEFAULT_CACHE_DIR,
+                 cache_bytes=DEFAULT_MAX_BYTES, readme=True):
+        self.nodes = {}
+        self.cache = SlideCache(cache_dir, cache_bytes)
+        keys = _CodeKeys()
+        deck_recipe = keys._module(build)
+        deck_nodes = []
+        for name in names:
+            slides, numbers, total = decks.select(name)
+            slide_ids = []
+            for fn, number in zip(slides, numbers):
+                deps = [self._facts(doc.path) for doc in documents(fn)]
+                node = self.add(SlideNode(name, number, fn, keys.key(fn), deps, self.cache))
+                slide_ids.append(node.id)
+            deck_nodes.append(self.add(DeckNode(
+                name, decks.output_path(name, out_dir), slide_ids,
+                fields.table(slides, total), deck_recipe)))
+        # README 표는 모든 덱의 행이므로 일부 덱만 빌드할 때는 건드리지 않음
+        if readme and not out_dir and set(names) == set(decks.DECKS):
+            order = list(decks.DECKS)
+            self.add(ReadmeNode(sorted(deck_nodes, key=lambda n: order.index(n.name))))
+
+    def add(self, node):
+        self.nodes[node.id] = node
+        return node
+
+    def _facts(self, path):
+        md = self.add(MarkdownNode(path))
+        facts_id = f"facts:{os.path.relpath(path, decks.ROOT)}"
+        if facts_id not in self.nodes:
+            self.add(FactsNode(path, md.id))
+        return facts_id
+
+
+def _load_state(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(path, state):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _reason(node, old, dep_outputs):
+    """빌드 이유 (None이면 건너뜀)"""
+    if old is None:
+        return "처음 빌드"
+    if old.get("recipe") != _sha(node.recipe):
+        return "코드 변경"
+    changed = [dep for dep, h in dep_outputs.items() if old["deps"].get(dep) != h]
+    if changed:
+        more = f" 외 {len(changed) - 3}개" if len(changed) > 3 else ""
+        return "의존 변경: " + ", ".join(changed[:3]) + more
+    if not node.valid(old["output"]):
+        return "출력 없음"
+    return None
+
+
+def run(graph, jobs=1, state_path=DEFAULT_STATE, explain=None):
+    """그래프 실행 → {노드 id: (빌드 여부, 이유, 초)}
+
+    explain(node_id, rebuilt, reason)이 있으면 노드가 끝날 때마다 호출.
+    md 노드는 내용 해시가 곧 출력이라 항상 다시 해시한다.
+    """
+    state = _load_state(state_path)
+    outputs, report = {}, {}
+    waiting = {nid: set(node.deps) for nid, node in graph.nodes.items()}
+    dependents = {}
+    for nid, node in graph.nodes.items():
+        for dep in node.deps:
+            dependents.setdefault(dep, []).append(nid)
+
+    def done(nid, output, rebuilt, reason, seconds):
+        node = graph.nodes[nid]
+        outputs[nid] = output
+        state[nid] = {"recipe": _sha(node.recipe), "output": output,
+                      "deps": {dep: outputs[dep] for dep in node.deps}}
+        report[nid] = (rebuilt, reason, seconds)
+        if explain:
+            explain(nid, rebuilt, reason)
+        for child in dependents.get(nid, []):
+            waiting[child].discard(nid)
+            if not waiting[child]:
+                ready.append(child)
+
+    ready = [nid for nid, deps in waiting.items() if not deps]
+    pool = None
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs,
+                                   mp_context=multiprocessing.get_context("fork"))
+    running = {}
+    try:
+        while ready or running:
+            while ready:
+                nid = ready.pop(0)
+                node = graph.nodes[nid]
+                node.input = _sha(node.recipe, *(outputs[d] for d in node.deps))
+                old = state.get(nid)
+                if isinstance(node, MarkdownNode):
+                    output = node.run(graph)
+                    changed = old is None or old["output"] != output
+                    done(nid, output, changed, "내용 변경" if changed else "내용 동일", 0.0)
+                    continue
+                reason = _reason(node, old, {d: outputs[d] for d in node.deps})
+                if reason is None:
+                    done(nid, old["output"], False, "최신 (입력 해시 동일)", 0.0)
+                elif pool and node.pooled:
+                    fn, args = node.task()
+                    running[pool.submit(fn, *args)] = (nid, reason, time.perf_counter())
+                else:
+                    start = time.perf_counter()
+                    output = node.run(graph)
+                    done(nid, output, True, reason, time.perf_counter() - start)
+            if running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    nid, reason, start = running.pop(future)
+                    output = graph.nodes[nid].finish(future.result())
+                    done(nid, output, True, reason, time.perf_counter() - start)
+    finally:
+        if pool:
+            pool.shutdown()
+        _save_state(state_path, state)
+    return report
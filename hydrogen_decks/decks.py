@@ -0,0 +1,231 @@
+"""
+여러 덱 일괄 빌드
+- 세 발표자료 생성 스크립트를 이름으로 등록하고 전체 또는 일부를 빌드
+- python-pptx·생성 스크립트·기본 템플릿을 부모 프로세스에서 한 번만 로드한 뒤
+  덱마다 워커를 fork하므로 워커는 import 없이 바로 빌드
+- 덱마다 빌드 시간(로드 제외, 저장 포함)과 캐시 적중 수를 돌려줌
+- watch: 소스가 바뀔 때마다 캐시 키가 달라진 슬라이드만 다시 렌더링
+"""
+
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+from . import build, fields, package, render
+from .cache import KeyBuilder, SlideCache
+from .catalog import DECKS, ROOT
+
+
+class DeckResult(NamedTuple):
+    name: str
+    output: str
+    slides: int
+    seconds: float
+    hits: int
+    misses: int
+
+
+class WatchEvent(NamedTuple):
+    """watch 재빌드 한 번 (changed: 다시 렌더링한 슬라이드 번호, error: 실패 메시지)"""
+    name: str
+    result: Optional[DeckResult]
+    changed: list
+    error: str = ""
+
+
+def generator(name):
+    return build.load_generator(os.path.join(ROOT, DECKS[name]))
+
+
+def warm(names):
+    """생성 스크립트 import + 기본 템플릿·콘텐츠 레이아웃 한 번 생성"""
+    for name in names:
+        generator(name)
+    build.new_presentation()
+
+
+def output_path(name, out_dir=None, slide_range=None):
+    path = generator(name).OUTPUT_PATH
+    if out_dir:
+        path = os.path.join(out_dir, os.path.basename(path))
+    if slide_range:
+        path = build.partial_output(path, slide_range)
+    return path
+
+
+def _signature(dirs, extensions):
+    signature = []
+    for directory in sorted(dirs):
+        for entry in os.scandir(directory):
+            if entry.name.endswith(extensions):
+                signature.append((entry.path, entry.stat().st_mtime_ns))
+    return sorted(signature)
+
+
+def source_signature():
+    """생성 스크립트·연구 문서의 (경로, mtime) 목록
+
+    값이 그대로면 슬라이드 캐시 키도 그대로이므로 KeyBuilder를 재사용할 수 있다.
+    생성 스크립트는 build.load_generator가 mtime을 보고 다시 import하므로
+    이 목록이 바뀌면 같은 프로세스에서 다시 빌드해도 된다.
+    """
+    dirs = {os.path.dirname(os.path.join(ROOT, path)) for path in DECKS.values()}
+    return _signature(dirs, (".py", ".md"))
+
+
+def package_signature():
+    """hydrogen_decks 패키지 소스의 (경로, mtime) 목록"""
+    return _signature([os.path.dirname(os.path.abspath(__file__))], (".py",))
+
+
+# 렌더링 모듈(build·render 등)을 import한 직후의 패키지 소스.
+# 캐시 키는 디스크의 소스를 해시하므로, 이후 패키지를 고치면 이 프로세스는 옛 모듈로
+# 렌더링한 결과를 새 소스의 키로 저장하게 된다 → package_changed()면 빌드하지 말 것
+LOADED_PACKAGE = package_signature()
+
+
+class PackageChanged(RuntimeError):
+    """import한 뒤 hydrogen_decks 패키지 소스가 바뀜 (프로세스를 다시 시작해야 함)"""
+
+
+def package_changed():
+    """import한 뒤 바뀐 패키지 파일 이름 목록 (없으면 빈 목록)"""
+    loaded, current = dict(LOADED_PACKAGE), dict(package_signature())
+    return sorted(os.path.basename(path) for path in loaded.keys() | current.keys()
+                  if loaded.get(path) != current.get(path))
+
+
+def _range(slide_range, name):
+    """slide_range가 dict면 덱별 범위 (build --section / --tag)"""
+    return slide_range.get(name) if isinstance(slide_range, dict) else slide_range
+
+
+def deck_jobs(names, slide_range=None):
+    """빌드할 (덱 이름, 범위) 목록 — 중간이 빠진 범위는 이어지는 구간마다 따로
+
+    부분 덱의 쪽 번호는 firstSlideNum부터 이어지므로 "1-3,22"를 한 덱으로 만들면
+    22쪽이 4로 표시된다. 구간마다 덱을 나누면 모든 번호가 전체 덱과 같다.
+    """
+    jobs = []
+    for name in names:
+        deck_range = _range(slide_range, name)
+        if not deck_range:
+            jobs.append((name, None))
+            continue
+        runs = build.slide_runs(deck_range, len(generator(name).SLIDES))
+        jobs.extend((name, run) for run in runs)
+    return jobs
+
+
+def select(name, slide_range=None):
+    """덱의 (슬라이드 함수, 슬라이드 번호, 전체 장수) — slide_range는 "10-15" 형식"""
+    slides = generator(name).SLIDES
+    total = len(slides)
+    indices = build.parse_slide_range(slide_range, total) if slide_range else range(total)
+    return [slides[i] for i in indices], [i + 1 for i in indices], total
+
+
+def build_deck(name, output, slide_range=None, cache_dir=None, cache_bytes=None,
+               keys=None):
+    """덱 하나 빌드 → DeckResult (출력 파일은 원자적으로 교체)"""
+    start = time.perf_counter()
+    slides, numbers, total = select(name, slide_range)
+    cache = SlideCache(cache_dir, cache_bytes, keys) if cache_dir else None
+    prs = build.build_presentation(slides, cache=cache, total=total,
+                                   numbers=numbers,
+                                   field_values=fields.table(generator(name).SLIDES))
+    package.save_atomic(prs, output)
+    return DeckResult(name, output, len(prs.slides), time.perf_counter() - start,
+                      cache.hits if cache else 0, cache.misses if cache else 0)
+
+
+def build_decks(names, jobs=1, out_dir=None, slide_range=None,
+                cache_dir=None, cache_bytes=None, backend=None, keys=None,
+                compression=None):
+    """여러 덱을 jobs개 워커로 동시에 빌드 → 요청 순서대로 DeckResult를 내놓음
+
+    slide_range는 모든 덱에 같은 범위 문자열 또는 {덱 이름: 범위}.
+    중간이 빠진 범위는 구간마다 부분 덱 하나씩 (deck_jobs).
+    compression은 package.POLICIES의 이름 (없으면 package.COMPRESSION).
+    """
+    if backend:
+        render.BACKEND = os.environ["HYDROGEN_DECKS_BACKEND"] = backend
+    if compression:
+        package.COMPRESSION = compression
+    warm(names)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    args = [(name, output_path(name, out_dir, deck_range), deck_range, cache_dir,
+             cache_bytes, keys) for name, deck_range in deck_jobs(names, slide_range)]
+    if jobs <= 1 or len(args) <= 1:
+        for arg in args:
+            yield build_deck(*arg)
+        return
+    # fork: 워커가 부모의 import·템플릿을 그대로 물려받음
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        futures = [pool.submit(build_deck, *arg) for arg in args]
+        for future in futures:
+            yield future.result()
+
+
+def _changed(old, new, numbers):
+    """이전·현재 캐시 키를 비교해 바뀐 슬라이드 번호"""
+    if old is None:
+        return list(numbers)
+    return [num for num, a, b in itertools.zip_longest(numbers, old, new)
+            if num is not None and a != b]
+
+
+def watch(names, interval=0.5, out_dir=None, slide_range=None,
+          cache_dir=None, cache_bytes=None, backend=None, compression="fast"):
+    """소스(생성 스크립트·연구 문서·패키지)를 폴링하며 바뀐 덱만 다시 빌드
+
+    바뀐 파일이 있으면 슬라이드마다 캐시 키를 다시 계산해 이전과 다른 덱만
+    빌드하고, 키가 같은 슬라이드는 캐시에서 가져온다. 편집 중 스크립트에
+    오류가 있으면 error가 담긴 WatchEvent를 내놓고 계속 감시한다.
+    패키지 소스가 바뀌면 옛 모듈로는 다시 빌드할 수 없으므로 PackageChanged
+    (호출한 쪽이 프로세스를 다시 실행).
+    저장은 기본으로 "fast" 압축 (편집 중 미리보기라 크기보다 지연이 중요).
+    """
+    if backend:
+        render.BACKEND = os.environ["HYDROGEN_DECKS_BACKEND"] = backend
+    if compression:
+        package.COMPRESSION = compression
+    warm(names)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    signature = None
+    previous = {}
+    while True:
+        changed_files = package_changed()
+        if changed_files:
+            raise PackageChanged(", ".join(changed_files))
+        current = source_signature()
+        if current != signature:
+            signature = current
+            keys = KeyBuilder()
+            for name in names:
+                try:
+                    runs = deck_jobs([name], slide_range)
+                except Exception as e:  # 편집 중 오류는 보고만 하고 감시 계속
+                    yield WatchEvent(name, None, [], f"{type(e).__name__}: {e}")
+                    continue
+                for _, deck_range in runs:
+                    try:
+                        slides, numbers, _ = select(name, deck_range)
+                        new = [keys.key(fn) for fn in slides]
+                        if new == previous.get((name, deck_range)):
+                            continue
+                        result = build_deck(name, output_path(name, out_dir, deck_range),
+                                            deck_range, cache_dir, cache_bytes, keys)
+                    except Exception as e:
+                        yield WatchEvent(name, None, [], f"{type(e).__name__}: {e}")
+                        continue
+                    changed = _changed(previous.get((name, deck_range)), new, numbers)
+                    previous[(name, deck_range)] = new
+                    yield WatchEvent(name, result, changed)
+        time.sleep(interval)
@@ -0,0 +1,120 @@
+"""
+지연 필드 (슬라이드 번호 · 총 장수 · 섹션 시작 쪽 · 상호 참조)
+- 슬라이드 함수는 번호를 모른 채 자리표시 문자열만 씀
+    PAGE "{{page}}", TOTAL "{{total}}",
+    section("Part 2") "{{section:Part 2}}" (섹션 이름 앞부분 일치, 첫 쪽 —
+      "Part 1"은 "Part 1 수소 기초"와 맞고 "Part 10"과는 안 맞음),
+    ref(slide_22_...) "{{ref:slide_22_...}}" (그 슬라이드의 쪽)
+- 값은 전체 덱 순서(SLIDES, 등록부 섹션)로 한 번 계산하고, build_presentation이
+  슬라이드 함수가 끝날 때마다 새로 추가된 슬라이드만 훑어 바꿈
+  → 덱 전체에 한 번의 선형 스캔, 스트리밍 저장에서도 기록 전에 처리
+- 슬라이드 XML에 번호가 박히지 않으므로 순서를 바꾸거나 일부만 빌드해도
+  슬라이드 캐시가 그대로 맞음
+- 캐시에서 이어 붙인 슬라이드(바이트 그대로 보관)는 파싱하지 않고 바이트에서 치환
+- page는 전체 덱 기준 실제 쪽 번호 (build_presentation의 numbers), 부분 덱은 이어지는
+  구간만 만들므로 slidenum 필드(firstSlideNum + 덱 안 순서)와 같음
+"""
+
+import itertools
+import re
+from xml.sax.saxutils import unescape
+
+from pptx.oxml.ns import qn
+
+PAGE = "{{page}}"
+TOTAL = "{{total}}"
+
+_FIELD = re.compile(r"\{\{(page|total|section|ref)(?::([^}]*))?\}\}")
+_FIELD_BYTES = re.compile(_FIELD.pattern.encode())
+_T = qn("a:t")
+_XML_ENTITIES = {"&quot;": '"', "&apos;": "'"}  # &amp; &lt; &gt;는 unescape 기본
+
+
+class FieldError(ValueError):
+    """값을 정할 수 없는 자리표시 (없는 섹션·슬라이드 이름)"""
+
+
+def section(name):
+    return "{{section:%s}}" % name
+
+
+def ref(slide_fn):
+    """슬라이드 함수(또는 이름)의 쪽 번호 자리표시"""
+    return "{{ref:%s}}" % getattr(slide_fn, "__name__", slide_fn)
+
+
+def table(slides, total=None):
+    """전체 덱 순서의 슬라이드 함수 → 필드 값 {"total", "ref:이름", "section:섹션"}"""
+    values = {"total": total or len(slides)}
+    for number, fn in enumerate(slides, start=1):
+        values[f"ref:{fn.__name__}"] = number
+        name = getattr(fn, "section", None)
+        if name is not None:
+            values.setdefault(f"section:{name}", number)
+    return values
+
+
+def _lookup(values, kind, arg, page):
+    if kind == "page":
+        return page
+    if kind == "total":
+        return values["total"]
+    key = f"{kind}:{arg}"
+    if key in values:
+        return values[key]
+    if kind == "section":
+        starts = [number for k, number in values.items()
+                  if k.startswith(key) and not k[len(key):][:1].isalnum()]
+        if starts:
+            return min(starts)
+    raise FieldError(f"{page}쪽: 값을 정할 수 없는 필드 {{{{{key}}}}}")
+
+
+def _unescape(arg):
+    """바이트 경로의 인자 → 객체 경로(t.text)와 같은 문자열 (XML 엔티티 해제)"""
+    return unescape((arg or b"").decode(), _XML_ENTITIES)
+
+
+def resolve_slide(part, values, page):
+    """슬라이드 파트 하나의 자리표시를 값으로 바꿈"""
+    raw = getattr(part, "_raw", None)
+    if raw is not None:  # build.SplicedSlidePart (아직 파싱하지 않은 바이트)
+        if b"{{" in raw:
+            part._raw = _FIELD_BYTES.sub(
+                lambda m: str(_lookup(values, m[1].decode(), _unescape(m[2]), page)).encode(),
+                raw)
+        return
+    for t in part._element.iter(_T):
+        if t.text and "{{" in t.text:
+            t.text = _FIELD.sub(lambda m: str(_lookup(values, m[1], m[2], page)), t.text)
+
+
+class Resolver:
+    """덱에 새로 추가된 슬라이드만 처리 (슬라이드 함수가 끝날 때마다 호출)
+
+    마지막으로 처리한 sldId에서 이어 가므로 슬라이드마다 한 번씩만 보고,
+    StreamWriter가 이미 기록한 슬라이드는 건드리지 않는다.
+    numbers는 추가되는 슬라이드마다의 전체 덱 기준 쪽 번호 (기본 1, 2, 3, ...),
+    슬라이드가 numbers보다 많으면 마지막 번호 다음부터 이어 센다.
+    """
+
+    def __init__(self, values, numbers=None):
+        numbers = list(numbers or [])
+        self.values = values
+        after = numbers[-1] + 1 if numbers else 1
+        self.numbers = itertools.chain(numbers, itertools.count(after))
+        self._last = None
+
+    def __call__(self, prs):
+        sldIdLst = prs.slides._sldIdLst
+        if self._last is not None:
+            sldId = self._last.getnext()
+        elif len(sldIdLst):
+            sldId = sldIdLst[0]
+        else:
+            return
+        rels = prs.part.rels
+        while sldId is not None:
+            resolve_slide(rels[sldId.rId].target_part, self.values, next(self.numbers))
+            self._last = sldId
+            sldId = sldId.getnext()
@@ -0,0 +1,110 @@
+"""
+슬라이드별 빌드 계측 (생성 스크립트 --instrument)
+- 슬라이드 함수마다 벽시계·CPU 시간, tracemalloc 최대 할당량,
+  만든 도형·텍스트 런·표 셀 수, 직렬화한 슬라이드 XML 크기를 기록
+- 결과는 JSON/CSV로 저장하고 느린 슬라이드 상위 N개를 표로 출력
+- tracemalloc은 파이썬 객체 할당만 보므로 lxml 트리(C 메모리)는 빠짐,
+  시간에는 tracemalloc 추적 비용이 포함됨 (슬라이드끼리 상대 비교용)
+"""
+
+import csv
+import json
+import time
+import tracemalloc
+from typing import NamedTuple
+
+from pptx.oxml.ns import qn
+
+_SHAPE_TAGS = {qn(tag) for tag in ("p:sp", "p:graphicFrame", "p:cxnSp", "p:pic", "p:grpSp")}
+_RUN_TAGS = {qn("a:r"), qn("a:fld")}
+_CELL_TAG = qn("a:tc")
+
+
+class SlideStats(NamedTuple):
+    number: int
+    name: str
+    wall_ms: float
+    cpu_ms: float
+    peak_kb: float
+    shapes: int
+    runs: int
+    cells: int
+    xml_bytes: int
+
+
+def count_elements(spTree):
+    """(도형, 텍스트 런, 표 셀) 수"""
+    shapes = runs = cells = 0
+    for el in spTree.iter():
+        if el.tag in _SHAPE_TAGS:
+            shapes += 1
+        elif el.tag in _RUN_TAGS:
+            runs += 1
+        elif el.tag == _CELL_TAG:
+            cells += 1
+    return shapes, runs, cells
+
+
+class Recorder:
+    """슬라이드 함수를 감싸 실행할 때마다 SlideStats를 쌓음"""
+
+    def __init__(self):
+        self.stats = []
+
+    def wrap(self, slide_fn, number):
+        def measured(prs):
+            start = len(prs.slides)
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            wall, cpu = time.perf_counter(), time.process_time()
+            slide_fn(prs)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            peak = tracemalloc.get_traced_memory()[1] - base
+            shapes = runs = cells = xml_bytes = 0
+            for slide in list(prs.slides)[start:]:
+                s, r, c = count_elements(slide.shapes._spTree)
+                shapes, runs, cells = shapes + s, runs + r, cells + c
+                xml_bytes += len(slide.part.blob)
+            self.stats.append(SlideStats(number, slide_fn.__name__, wall * 1000,
+                                         cpu * 1000, peak / 1024, shapes, runs, cells,
+                                         xml_bytes))
+
+        measured.__name__ = slide_fn.__name__
+        return measured
+
+    def wrap_all(self, slides, numbers):
+        return [self.wrap(fn, number) for fn, number in zip(slides, numbers)]
+
+    def start(self):
+        tracemalloc.start()
+
+    def stop(self):
+        tracemalloc.stop()
+
+
+# ── 출력 ──────────────────────────────────────────────
+def write(stats, path):
+    """확장자(.json / .csv)에 따라 저장"""
+    rows = [s._asdict() for s in stats]
+    if path.endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=SlideStats._fields)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=1)
+
+
+def print_top(stats, n=10):
+    """벽시계 시간 기준 느린 슬라이드 상위 n개 + 합계"""
+    print(f"{'#':>3} {'슬라이드 함수':<36}{'ms':>8}{'CPU ms':>8}{'최대 KB':>9}"
+          f"{'도형':>6}{'런':>6}{'셀':>6}{'XML KB':>8}")
+    for s in sorted(stats, key=lambda s: s.wall_ms, reverse=True)[:n]:
+        print(f"{s.number:>3} {s.name:<36}{s.wall_ms:>8.1f}{s.cpu_ms:>8.1f}{s.peak_kb:>9.0f}"
+              f"{s.shapes:>6}{s.runs:>6}{s.cells:>6}{s.xml_bytes / 1024:>8.1f}")
+    total = sum(s.wall_ms for s in stats)
+    print(f"    {'합계 (' + str(len(stats)) + '장)':<36}{total:>8.1f}"
+          f"{sum(s.cpu_ms for s in stats):>8.1f}{'':>9}{sum(s.shapes for s in stats):>6}"
+          f"{sum(s.runs for s in stats):>6}{sum(s.cells for s in stats):>6}"
+          f"{sum(s.xml_bytes for s in stats) / 1024:>8.1f}")
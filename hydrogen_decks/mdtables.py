@@ -0,0 +1,258 @@
+"""
+마크다운 표 추출 엔진
+- 연구 문서(.md)를 한 줄씩 읽으며 표마다 (문서, 제목 경로, 머리행, 캡션, 행)을 색인
+- 슬라이드 함수는 숫자를 다시 적지 않고 앵커(제목·머리행·캡션)로 표를 찾아 행을 가져옴
+- 파싱 결과는 파일 mtime·크기로 캐시 (프로세스 안 메모리 + 디스크 pickle)
+- Document의 repr에 mtime·크기가 들어가므로 문서를 참조하는 슬라이드는
+  문서가 바뀌면 슬라이드 캐시(cache.py) 키도 바뀐다
+
+예:
+    KOREA = mdtables.Document("한국_연료전지_연구현황_종합분석.md")
+    table = KOREA.table("4.1 분야별 달성률 종합표")
+    rows = table.select("분야", "2022년 목표", "달성률")
+"""
+
+import hashlib
+import os
+import re
+from typing import NamedTuple
+
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, SlideCache
+
+DEFAULT_TABLE_CACHE_DIR = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "tables")
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_SEPARATOR = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_EMPHASIS = re.compile(r"(\*\*|__)(.+?)\1")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+
+_parsed = {}  # 절대 경로 → (mtime_ns, 크기, 표 목록)
+_disk_cache = None
+
+
+class Table(NamedTuple):
+    """문서 안의 표 하나 (셀은 강조·링크 표기를 걷어 낸 평문)"""
+    doc: str
+    headings: tuple
+    header: tuple
+    rows: tuple
+    caption: str
+    line: int
+
+    def column(self, name):
+        """머리행 이름 → 열 인덱스"""
+        try:
+            return self.header.index(name)
+        except ValueError:
+            raise KeyError(f"{self.where()}: 열 {name!r} 없음 (열: {', '.join(self.header)})")
+
+    def select(self, *names):
+        """지정한 열만 골라 행 목록으로 (이름 없이 부르면 모든 열)"""
+        if not names:
+            return [list(row) for row in self.rows]
+        idx = [self.column(name) for name in names]
+        return [[row[i] if i < len(row) else "" for i in idx] for row in self.rows]
+
+    def row(self, key, column=0):
+        """column 열 값이 key인 첫 행"""
+        for row in self.rows:
+            if row[column] == key:
+                return list(row)
+        raise KeyError(f"{self.where()}: {key!r} 행 없음")
+
+    def records(self):
+        """행마다 {열 이름: 값}"""
+        return [dict(zip(self.header, row)) for row in self.rows]
+
+    def where(self):
+        path = " > ".join(self.headings) or "(제목 없음)"
+        return f"{os.path.basename(self.doc)}:{self.line} [{path}]"
+
+
+# ── 파서 ──────────────────────────────────────────────
+def plain(text):
+    """셀 텍스트에서 **강조**·[링크](url)·`코드` 표기 제거"""
+    text = _LINK.sub(r"\1", text)
+    text = _EMPHASIS.sub(r"\2", text)
+    return text.replace("`", "").replace("<br>", "\n").strip()
+
+
+def _cells(line):
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    cells = re.split(r"(?<!\\)\|", line)
+    return tuple(plain(cell.replace("\\|", "|")) for cell in cells)
+
+
+def iter_tables(lines, doc=""):
+    """줄 단위로 읽으며 표가 끝날 때마다 Table을 내놓음 (코드 블록 안은 무시)"""
+    headings = []
+    caption = ""
+    prev = None
+    table = None
+    in_fence = False
+    for lineno, line in enumerate(lines, start=1):
+        line = line.rstrip("\n")
+        if table is not None:
+            if line.lstrip().startswith("|"):
+                table["rows"].append(_cells(line))
+                continue
+            yield Table(doc, tuple(headings), table["header"], tuple(table["rows"]),
+                        table["caption"], table["line"])
+            table = None
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            heading = _HEADING.match(line)
+            if heading:
+                level = len(heading.group(1))
+                del headings[level - 1:]
+                headings.extend([""] * (level - 1 - len(headings)))
+                headings.append(plain(heading.group(2)))
+                caption = ""
+            elif (_SEPARATOR.match(line) and prev is not None
+                    and prev[1].lstrip().startswith("|")):
+                table = {"header": _cells(prev[1]), "rows": [],
+                         "caption": caption, "line": prev[0]}
+            elif line.strip() and not line.lstrip().startswith("|"):
+                caption = plain(line.lstrip("> "))
+        prev = (lineno, line)
+    if table is not None:
+        yield Table(doc, tuple(headings), table["header"], tuple(table["rows"]),
+                    table["caption"], table["line"])
+
+
+# ── 캐시 ──────────────────────────────────────────────
+def _cache():
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = SlideCache(DEFAULT_TABLE_CACHE_DIR, DEFAULT_MAX_BYTES)
+    return _disk_cache
+
+
+def _cache_key(path, st):
+    with open(__file__, "rb") as f:
+        h = hashlib.sha256(f.read())
+    h.update(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode())
+    return h.hexdigest()
+
+
+def parse_file(path, disk_cache=True):
+    """문서의 표 목록 (mtime·크기가 같으면 캐시 재사용)"""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    hit = _parsed.get(path)
+    if hit and hit[:2] == (st.st_mtime_ns, st.st_size):
+        return hit[2]
+    key = _cache_key(path, st) if disk_cache else None
+    tables = _cache().get(key) if disk_cache else None
+    if tables is None:
+        with open(path, encoding="utf-8") as f:
+            tables = list(iter_tables(f, path))
+        if disk_cache:
+            _cache().put(key, tables)
+    _parsed[path] = (st.st_mtime_ns, st.st_size, tables)
+    return tables
+
+
+# ── 색인 · 조회 ───────────────────────────────────────
+def slug(text):
+    """GitHub 방식 제목 앵커 (#4-수소경제-로드맵-달성률-분석)"""
+    text = re.sub(r"[^\w\- ]", "", plain(text).lower())
+    return text.replace(" ", "-")
+
+
+def _matches(table, heading, header, caption):
+    if heading is not None:
+        anchor = heading.lstrip("#")
+        if not any(heading == h or anchor == slug(h) for h in table.headings):
+            return False
+    if header is not None and not all(name in table.header for name in header):
+        return False
+    if caption is not None and caption not in table.caption:
+        return False
+    return True
+
+
+class Document:
+    """마크다운 문서 하나의 표 색인"""
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+
+    def __repr__(self):
+        st = os.stat(self.path)
+        return f"Document({self.path!r}, mtime_ns={st.st_mtime_ns}, size={st.st_size})"
+
+    @property
+    def tables(self):
+        return parse_file(self.path)
+
+    def find(self, heading=None, header=None, caption=None):
+        """앵커에 맞는 표 목록
+
+        heading: 제목 경로 중 하나와 같은 제목 텍스트 또는 "#앵커"
+        header: 모두 포함해야 하는 머리행 이름들
+        caption: 표 바로 앞 문단에 들어 있는 문자열
+        """
+        return [t for t in self.tables if _matches(t, heading, header, caption)]
+
+    def table(self, heading=None, header=None, caption=None):
+        """앵커에 맞는 표 하나 (없거나 여럿이면 LookupError)"""
+        found = self.find(heading, header, caption)
+        if len(found) != 1:
+            anchor = ", ".join(f"{k}={v!r}" for k, v in
+                               (("heading", heading), ("header", header),
+                                ("caption", caption)) if v is not None)
+            detail = "; ".join(t.where() for t in found) or "없음"
+            raise LookupError(f"{os.path.basename(self.path)}: {anchor} 표 "
+                              f"{len(found)}개 ({detail})")
+        return found[0]
+
+
+class Corpus:
+    """디렉터리 아래 모든 .md 문서의 표 색인 (문서·제목 앵커·머리행별)"""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.documents = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(".md"):
+                    path = os.path.join(dirpath, name)
+                    self.documents[os.path.relpath(path, self.root)] = Document(path)
+
+    def __repr__(self):
+        return f"Corpus({self.root!r}, {sorted(self.documents.values(), key=repr)!r})"
+
+    def tables(self):
+        for doc in self.documents.values():
+            yield from doc.tables
+
+    def index(self):
+        """{"heading": {앵커: [표]}, "header": {머리행: [표]}}"""
+        by_heading, by_header = {}, {}
+        for table in self.tables():
+            for h in table.headings:
+                if h:
+                    by_heading.setdefault(slug(h), []).append(table)
+            by_header.setdefault(table.header, []).append(table)
+        return {"heading": by_heading, "header": by_header}
+
+    def document(self, name):
+        """상대 경로 또는 파일 이름으로 문서 조회"""
+        if name in self.documents:
+            return self.documents[name]
+        found = [d for rel, d in self.documents.items() if os.path.basename(rel) == name]
+        if len(found) != 1:
+            raise LookupError(f"{self.root}: 문서 {name!r} {len(found)}개")
+        return found[0]
+
+    def find(self, heading=None, header=None, caption=None):
+        return [t for doc in self.documents.values()
+                for t in doc.find(heading, header, caption)]
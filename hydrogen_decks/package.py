@@ -0,0 +1,264 @@
+"""
+.pptx 패키지 저장
+- python-pptx PackageWriter와 같은 순서로 기록
+- 모든 zip 항목에 고정 타임스탬프·권한·생성 시스템 → 같은 내용이면 어느 머신에서나 같은 바이트
+  (출력 파일 해시를 그대로 내용 해시로 쓸 수 있음)
+- 파트별 압축 정책(Compression): 작은 .rels는 압축 없이 저장할 수 있고, 슬라이드 XML과
+  나머지 파트는 각자 레벨로 deflate. 기본은 최종 산출물용 "max", watch는 "fast".
+  환경 변수 HYDROGEN_DECKS_COMPRESSION 또는 --compression으로 선택
+- 압축은 스레드 풀에서 (zlib은 GIL을 놓음), 직렬화와 기록은 호출 스레드에서 순서대로
+- copy_member(): 다른 zip의 항목을 압축된 바이트 그대로 옮김 (retheme에서 안 바뀐 파트)
+- 스트리밍 저장(StreamWriter): 슬라이드를 완성되는 대로 기록하고 객체를 해제,
+  presentation.xml·관계·나머지 파트는 마지막에 기록
+- clone(): 파싱해 둔 프레젠테이션을 zip·XML 파싱 없이 복제 (XML 파트는 트리 deepcopy,
+  바이트 파트는 같은 bytes를 공유 — 바꾸면 새 bytes로 갈아 끼우므로 원본은 그대로)
+"""
+
+import itertools
+import os
+import re
+import struct
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import NamedTuple
+
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import Part, XmlPart, _Relationship
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+WORKERS = min(8, os.cpu_count() or 1)
+MIN_PARALLEL = 8  # 이보다 항목이 적으면 스레드 풀을 만들지 않음
+
+_SLIDE_XML = re.compile(r"ppt/slides/slide\d+\.xml$")
+
+
+# ── 압축 정책 ─────────────────────────────────────────
+class Compression(NamedTuple):
+    """파트별 deflate 레벨 (0 = 압축 없이 저장)"""
+    store_rels_below: int  # 이보다 작은 .rels는 저장 (수백 바이트라 줄어드는 양이 미미)
+    slide_level: int       # ppt/slides/slideN.xml
+    level: int             # 나머지 파트
+
+    def level_for(self, membername, size):
+        if membername.endswith(".rels") and size < self.store_rels_below:
+            return 0
+        if _SLIDE_XML.match(membername):
+            return self.slide_level
+        return self.level
+
+
+POLICIES = {
+    "fast": Compression(512, 1, 1),  # watch·미리보기: 압축 시간 최소
+    "zip": Compression(0, 6, 6),     # zipfile 기본값 (정책 도입 전과 같은 바이트)
+    "max": Compression(0, 9, 9),     # 최종 산출물: 가장 작게 (저장한 .rels는 오히려 커짐)
+}
+COMPRESSION = os.environ.get("HYDROGEN_DECKS_COMPRESSION", "max")
+
+
+def _zipinfo(membername, like=None):
+    """새 항목 머리 (like가 있으면 그 ZipInfo의 시각·만든 시스템·속성을 그대로)"""
+    if like is not None:
+        info = zipfile.ZipInfo(membername, date_time=like.date_time)
+        info.create_system = like.create_system
+        info.create_version = like.create_version
+        info.external_attr = like.external_attr
+        info.internal_attr = like.internal_attr
+        info.comment = like.comment
+        return info
+    info = zipfile.ZipInfo(membername, date_time=ZIP_TIMESTAMP)
+    info.create_system = 3  # 유닉스로 고정 (윈도에서 저장해도 같은 머리)
+    info.external_attr = 0o600 << 16
+    return info
+
+
+def _compress(membername, blob, level, like=None):
+    """항목 하나 압축 → (ZipInfo, 기록할 바이트) — 스레드 풀에서 실행"""
+    info = _zipinfo(membername, like)
+    info.file_size = len(blob)
+    info.CRC = zlib.crc32(blob)
+    if level:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        data = compressor.compress(blob) + compressor.flush()
+        info.compress_type = zipfile.ZIP_DEFLATED
+    else:
+        data = blob
+        info.compress_type = zipfile.ZIP_STORED
+    info.compress_size = len(data)
+    return info, data
+
+
+def _write_raw(zipf, info, data):
+    """미리 압축한 항목 기록 (ZipFile.writestr와 같은 머리·같은 내부 상태 갱신)"""
+    if zipf._seekable:
+        zipf.fp.seek(zipf.start_dir)
+    info.header_offset = zipf.fp.tell()
+    zipf._writecheck(info)
+    zipf._didModify = True
+    zipf.fp.write(info.FileHeader())
+    zipf.fp.write(data)
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(info)
+    zipf.NameToInfo[info.filename] = info
+
+
+def write_members(zipf, members, policy=None):
+    """(zip 항목 이름, 바이트)들을 정책대로 압축해 주어진 순서로 기록
+
+    직렬화(lxml)는 GIL을 잡고 있으므로 먼저 모두 바이트로 만든 뒤 압축만 나눠 맡긴다.
+    항목이 몇 개 안 되면 (스트리밍 저장의 슬라이드 하나 등) 스레드 없이 처리.
+    """
+    policy = policy or POLICIES[COMPRESSION]
+    jobs = [(name, blob, policy.level_for(name, len(blob))) for name, blob in members]
+    if WORKERS <= 1 or len(jobs) < MIN_PARALLEL:
+        for job in jobs:
+            _write_raw(zipf, *_compress(*job))
+        return
+    with ThreadPoolExecutor(WORKERS) as pool:
+        for info, data in pool.map(lambda job: _compress(*job), jobs):
+            _write_raw(zipf, info, data)
+
+
+def write_member(zipf, membername, blob, policy=None, like=None):
+    """zip 항목 하나 기록 (고정 타임스탬프, like가 있으면 그 항목의 시각·속성)"""
+    policy = policy or POLICIES[COMPRESSION]
+    level = policy.level_for(membername, len(blob))
+    _write_raw(zipf, *_compress(membername, blob, level, like))
+
+
+def copy_member(target, source, info):
+    """source zip의 항목을 압축을 풀지 않고 target에 그대로 옮김 (CRC·크기·압축 방식·시각·속성 유지)"""
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(zipfile.sizeFileHeader)
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    source.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+    new = _zipinfo(info.filename, info)
+    new.compress_type = info.compress_type
+    new.CRC = info.CRC
+    new.file_size = info.file_size
+    new.compress_size = info.compress_size
+    _write_raw(target, new, source.fp.read(info.compress_size))
+
+
+def _part_members(parts):
+    """파트(와 그 관계) → (항목 이름, 바이트), PackageWriter 순서"""
+    for part in parts:
+        yield part.partname.membername, part.blob
+        if part._rels:
+            yield part.partname.rels_uri.membername, part.rels.xml
+
+
+def _package_members(package, parts):
+    yield CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts))
+    yield PACKAGE_URI.rels_uri.membername, package._rels.xml
+
+
+def save(prs, pkg_file, policy=None):
+    """프레젠테이션을 결정적 .pptx로 저장 (경로 또는 파일 객체)"""
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    with zipfile.ZipFile(pkg_file, "w") as zipf:
+        write_members(zipf, itertools.chain(_package_members(package, parts),
+                                            _part_members(parts)), policy)
+
+
+def save_atomic(prs, path, policy=None):
+    """같은 디렉터리의 임시 파일에 저장한 뒤 교체 (열어 둔 뷰어가 반쯤 쓴 파일을 보지 않음)"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        save(prs, tmp, policy)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+# ── 복제 ──────────────────────────────────────────────
+def _copy_rels(source, target, parts):
+    """관계를 rId·순서 그대로 복사 (대상 파트는 parts로 복제본에 연결)"""
+    for rId, rel in source.items():
+        to = rel.target_ref if rel.is_external else parts[rel.target_part]
+        target._rels[rId] = _Relationship(target._base_uri, rId, rel.reltype,
+                                          rel._target_mode, to)
+
+
+def clone(prs):
+    """프레젠테이션 복제 → 새 Presentation (원본은 건드리지 않음)
+
+    파트 이름·rId·XML이 원본과 같으므로 복제본을 저장하면 원본을 저장한 것과
+    같은 바이트가 된다.
+    """
+    package = prs.part.package
+    copy = type(package)(None)
+    parts = {}
+    for part in package.iter_parts():
+        if isinstance(part, XmlPart):
+            parts[part] = type(part)(part.partname, part.content_type, copy,
+                                     deepcopy(part._element))
+        else:
+            parts[part] = type(part)(part.partname, part.content_type, copy, part.blob)
+    _copy_rels(package._rels, copy._rels, parts)
+    for part, new in parts.items():
+        _copy_rels(part.rels, new.rels, parts)
+    return copy.main_document_part.presentation
+
+
+class WrittenPart(Part):
+    """이미 zip에 기록된 파트의 자리표시 (파트 이름·콘텐츠 형식만 보관)"""
+
+
+class StreamWriter:
+    """슬라이드 단위 스트리밍 저장기
+
+    flush(prs)는 아직 기록하지 않은 슬라이드 파트를 zip에 쓰고, 프레젠테이션의
+    관계를 WrittenPart로 바꿔 슬라이드 XML 트리를 해제한다. close(prs)는
+    [Content_Types].xml, 패키지 관계, 나머지 파트를 기록하고 파일을 닫는다.
+    기록한 슬라이드는 다시 열 수 없으므로 flush 이후 prs.slides[i] 접근은 불가.
+    """
+
+    def __init__(self, pkg_file, policy=None):
+        self._zipf = zipfile.ZipFile(pkg_file, "w")
+        self._policy = policy
+        self._last = None
+        self.written = 0
+
+    def flush(self, prs):
+        """새로 추가된 슬라이드를 기록하고 해제"""
+        sldIdLst = prs.slides._sldIdLst
+        if self._last is not None:
+            sldId = self._last.getnext()
+        elif len(sldIdLst):
+            sldId = sldIdLst[0]
+        else:
+            return
+        rels = prs.part.rels
+        new = []
+        while sldId is not None:
+            new.append(sldId)
+            sldId = sldId.getnext()
+        write_members(self._zipf, _part_members(rels[s.rId].target_part for s in new),
+                      self._policy)
+        for sldId in new:
+            part = rels[sldId.rId].target_part
+            stub = WrittenPart(part.partname, part.content_type, part.package)
+            rels._rels[sldId.rId] = _Relationship(
+                rels._base_uri, sldId.rId, rels[sldId.rId].reltype,
+                RTM.INTERNAL, stub,
+            )
+            self._last = sldId
+            self.written += 1
+
+    def close(self, prs):
+        """남은 슬라이드와 나머지 파트를 기록하고 zip 닫기"""
+        self.flush(prs)
+        package = prs.part.package
+        parts = tuple(package.iter_parts())
+        rest = (part for part in parts if not isinstance(part, WrittenPart))
+        write_members(self._zipf, itertools.chain(_package_members(package, parts),
+                                                  _part_members(rest)), self._policy)
+        self._zipf.close()
@@ -0,0 +1,50 @@
+"""
+슬라이드 등록부
+- 생성 스크립트는 슬라이드 함수를 @REGISTRY.slide("Part 1 ...", tags=(...))로 등록하고
+  SLIDES = REGISTRY.slides()로 순서 목록을 얻음 (손으로 맞추던 SLIDES 목록·총 장수 대신)
+- 순서는 정의 순서(1, 2, ...), order=로 옮길 수 있고 같은 값이면 정의 순서
+- catalog가 같은 데코레이터 인자를 ast로 읽으므로, 섹션·태그로 슬라이드를 고를 때
+  고른 슬라이드가 있는 덱의 스크립트만 import됨
+- python-pptx를 import하지 않음
+"""
+
+from typing import NamedTuple
+
+
+class Entry(NamedTuple):
+    fn: object
+    order: float
+    section: str
+    tags: tuple
+
+
+class Registry:
+    """스크립트 하나의 슬라이드 함수 등록부"""
+
+    def __init__(self):
+        self._entries = []
+
+    def slide(self, section, tags=(), order=None):
+        """슬라이드 함수 데코레이터 (함수는 section 속성만 달아 그대로 돌려줌)"""
+        def register(fn):
+            position = len(self._entries) + 1 if order is None else order
+            self._entries.append(Entry(fn, position, section, tuple(tags)))
+            fn.section = section  # fields.table이 섹션 시작 쪽 계산에 사용
+            return fn
+        return register
+
+    def entries(self, section=None, tag=None):
+        """order 순 등록 항목 (section은 앞부분 일치, tag는 포함 여부로 거름)"""
+        return [e for e in sorted(self._entries, key=lambda e: e.order)
+                if (section is None or e.section.startswith(section))
+                and (tag is None or tag in e.tags)]
+
+    def slides(self, section=None, tag=None):
+        return [e.fn for e in self.entries(section, tag)]
+
+    def sections(self):
+        """섹션 이름 → 첫 슬라이드 번호 (전체 순서 기준)"""
+        starts = {}
+        for number, e in enumerate(self.entries(), start=1):
+            starts.setdefault(e.section, number)
+        return starts
@@ -0,0 +1,225 @@
+"""
+발표자료 공용 렌더링 헬퍼
+- 세 생성 스크립트(create_ppt, create_fuelcell_ppt, create_hydrogen_car_ppt)가 공유
+- 콘텐츠 슬라이드 공통 장식은 레이아웃에 한 번만 (chrome.py)
+- BACKEND = "xml"이면 기본 도형을 미리 만든 XML 템플릿 복사로 그림 (xmlshapes.py,
+  결과는 python-pptx 경로와 동일). 환경 변수 HYDROGEN_DECKS_BACKEND로 선택
+- 공용 색상·맑은 고딕은 테마 색·테마 글꼴 참조로 기록 (theme.py)
+- 폰트/셀 스타일은 (크기, 굵기, 색상, 폰트) 조합마다 한 번만 만들어 두고 복사
+  (templates.py), 테이블 행은 table.py로 일괄 교체
+"""
+
+import os
+from copy import deepcopy
+
+from pptx.util import Inches, Pt, Emu
+from pptx.enum.text import PP_ALIGN
+from pptx.enum.shapes import MSO_SHAPE
+
+from .style import (
+    NAVY, WHITE, GREEN, DARK_GRAY, MEDIUM_GRAY, FONT_NAME, SLIDE_WIDTH,
+)
+from .chrome import content_layout
+from .table import CellStyle, band_fill, fill_row, header_style
+from .templates import apply_font, new_tc, run_properties
+from .theme import set_color
+from . import xmlshapes
+
+BLANK_LAYOUT = 0  # 최소 템플릿(basetemplate)의 유일한 기본 레이아웃
+# 렌더링 백엔드: "pptx" = python-pptx 프록시, "xml" = 도형 XML 템플릿 복사
+BACKEND = os.environ.get("HYDROGEN_DECKS_BACKEND", "pptx")
+
+
+# ── 유틸리티 함수 ─────────────────────────────────────
+def set_font(run, size=18, bold=False, color=DARK_GRAY, name=FONT_NAME):
+    """run에 폰트 스타일 적용 (새 run이면 템플릿 a:rPr 복사)"""
+    r = run._r
+    if r.rPr is not None:
+        apply_font(run, size, bold, color, name)
+        return
+    r.insert(0, deepcopy(run_properties(size, bold, color, name)))
+
+
+def add_background(slide, color=WHITE):
+    """슬라이드 배경색 설정"""
+    bg = slide.background
+    fill = bg.fill
+    fill.solid()
+    set_color(fill.fore_color, color)
+
+
+def add_rect(slide, left, top, width, height, color):
+    """단색 직사각형 (테두리 없음)"""
+    if BACKEND == "xml":
+        return xmlshapes.add_rect(slide, left, top, width, height, color)
+    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
+    shape.fill.solid()
+    set_color(shape.fill.fore_color, color)
+    shape.line.fill.background()
+    return shape
+
+
+def add_navy_header_bar(slide):
+    """상단 남색 바"""
+    if BACKEND == "xml":
+        return xmlshapes.add_navy_header_bar(slide)
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, Emu(0), Emu(0), SLIDE_WIDTH, Inches(1.2)
+    )
+    shape.fill.solid()
+    set_color(shape.fill.fore_color, NAVY)
+    shape.line.fill.background()
+
+
+def add_green_accent_line(slide, top=Inches(1.2)):
+    """녹색 포인트 라인"""
+    if BACKEND == "xml":
+        return xmlshapes.add_green_accent_line(slide, top)
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, Emu(0), top, SLIDE_WIDTH, Inches(0.06)
+    )
+    shape.fill.solid()
+    set_color(shape.fill.fore_color, GREEN)
+    shape.line.fill.background()
+
+
+def add_slide_number(slide, num, total):
+    """우측 하단 슬라이드 번호 (num / total)"""
+    if BACKEND == "xml":
+        return xmlshapes.add_slide_number(slide, num, total)
+    txBox = slide.shapes.add_textbox(
+        Inches(12.0), Inches(7.0), Inches(1.2), Inches(0.4)
+    )
+    tf = txBox.text_frame
+    p = tf.paragraphs[0]
+    p.alignment = PP_ALIGN.RIGHT
+    run = p.add_run()
+    run.text = f"{num} / {total}"
+    set_font(run, size=12, color=MEDIUM_GRAY)
+
+
+def add_footer_line(slide):
+    """하단 남색 가는 선"""
+    if BACKEND == "xml":
+        return xmlshapes.add_footer_line(slide)
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE,
+        Inches(0.5), Inches(7.1), Inches(12.333), Inches(0.02)
+    )
+    shape.fill.solid()
+    set_color(shape.fill.fore_color, NAVY)
+    shape.line.fill.background()
+
+
+def add_title_text(slide, title_text, left=Inches(0.6), top=Inches(0.2),
+                   width=Inches(12), height=Inches(0.9)):
+    """헤더 바 위에 제목 텍스트"""
+    if BACKEND == "xml":
+        return xmlshapes.add_title_text(slide, title_text, left, top, width, height)
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.alignment = PP_ALIGN.LEFT
+    run = p.add_run()
+    run.text = title_text
+    set_font(run, size=34, bold=True, color=WHITE)
+    return txBox
+
+
+def add_body_textbox(slide, left=Inches(0.8), top=Inches(1.6),
+                     width=Inches(11.7), height=Inches(5.2)):
+    """본문 텍스트박스 생성"""
+    if BACKEND == "xml":
+        return xmlshapes.add_body_textbox(slide, left, top, width, height)
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    return tf
+
+
+def add_bullet(tf, text, level=0, size=16, bold=False, color=DARK_GRAY,
+               space_after=Pt(6), first=False):
+    """불릿 포인트 추가"""
+    if BACKEND == "xml":
+        p = xmlshapes.add_bullet(tf, text, level, size, bold, color,
+                                 space_after, first)
+        if p is not None:
+            return p
+    if first:
+        p = tf.paragraphs[0]
+    else:
+        p = tf.add_paragraph()
+    p.level = level
+    p.space_after = space_after
+    p.alignment = PP_ALIGN.LEFT
+    run = p.add_run()
+    run.text = text
+    set_font(run, size=size, bold=bold, color=color)
+    return p
+
+
+def create_table(slide, rows, cols, left, top, width, height):
+    """테이블 생성 후 shape 반환"""
+    table_shape = slide.shapes.add_table(rows, cols, left, top, width, height)
+    table = table_shape.table
+    return table_shape, table
+
+
+def set_cell(table, row, col, text, size=12, bold=False, color=DARK_GRAY,
+             alignment=PP_ALIGN.LEFT, fill_color=None, name=FONT_NAME):
+    """셀 텍스트 및 스타일 설정 (조합별 a:tc 템플릿으로 셀 전체 교체)"""
+    tc = table._tbl.tc(row, col)
+    new = new_tc(text, size, bold, color, alignment, fill_color, name)
+    for key, value in tc.attrib.items():
+        new.set(key, value)
+    tc.getparent().replace(tc, new)
+
+
+def style_header_row(table, headers, size=14):
+    """테이블 헤더 행 스타일 (행 단위 일괄 교체)"""
+    tr = table._tbl.tr_lst[0]
+    fill_row(tr, headers, [header_style(size)] * len(headers))
+
+
+def style_data_rows(table, data, start_row=1, size=13):
+    """테이블 데이터 행 스타일 (짝수 행 음영, 행 단위 일괄 교체)"""
+    trs = table._tbl.tr_lst
+    for r_idx, row_data in enumerate(data):
+        row_num = start_row + r_idx
+        style = CellStyle(size, fill=band_fill(row_num))
+        fill_row(trs[row_num], row_data, [style] * len(row_data))
+
+
+def setup_slide(prs, title_text):
+    """표준 콘텐츠 슬라이드 설정 (배경·헤더바·라인·번호는 레이아웃, 제목만 슬라이드)"""
+    slide = prs.slides.add_slide(content_layout(prs))
+    add_title_text(slide, title_text)
+    return slide
+
+
+def add_colored_box(slide, left, top, width, height, fill_color, text,
+                    text_size=13, text_color=WHITE, bold=True):
+    """둥근 색상 박스 + 가운데 정렬 텍스트"""
+    if BACKEND == "xml":
+        return xmlshapes.add_colored_box(slide, left, top, width, height,
+                                         fill_color, text, text_size,
+                                         text_color, bold)
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height
+    )
+    shape.fill.solid()
+    set_color(shape.fill.fore_color, fill_color)
+    shape.line.fill.background()
+    tf = shape.text_frame
+    tf.word_wrap = True
+    tf.margin_left = Inches(0.1)
+    tf.margin_right = Inches(0.1)
+    tf.margin_top = Inches(0.05)
+    tf.margin_bottom = Inches(0.05)
+    p = tf.paragraphs[0]
+    p.alignment = PP_ALIGN.CENTER
+    run = p.add_run()
+    run.text = text
+    set_font(run, size=text_size, bold=bold, color=text_color)
+    return shape
@@ -0,0 +1,222 @@
+"""
+완성된 .pptx 일괄 재테마 (python-pptx 객체를 만들지 않음)
+- 매핑 표(색상 RGB → RGB, 글꼴 이름 → 이름)대로 a:srgbClr@val과
+  a:latin/a:ea/a:cs/a:sym/a:font@typeface를 바꿈
+- 슬라이드·레이아웃·마스터·노트·테마 XML만 대상이고, 압축을 푼 바이트에 바꿀 값이
+  하나도 없으면 건드리지 않음. 바꿀 값이 있으면 DrawingML 요소의 시작 태그 안에서 속성 값
+  바이트만 바꿈 (다시 직렬화하지 않으므로 XML 선언·빈 요소 표기·공백은 원본 그대로)
+- 바뀐 파트만 다시 압축하고 나머지는 압축된 바이트 그대로 복사 (package.copy_member).
+  zip 항목의 시각·속성도 원본 그대로라, 역매핑을 적용하면 압축을 푼 내용과 항목 머리는
+  원본과 같음 (다시 압축한 파트의 압축 바이트는 압축 정책에 따라 다를 수 있음)
+- 테마 색·글꼴을 참조하는 덱(theme.py 이후)은 테마 파트 하나만 바뀜.
+  그 전 덱은 슬라이드마다 srgbClr·글꼴 이름이 있어 슬라이드 파트도 고침
+- 디렉터리는 하위의 .pptx를 모두 찾아 프로세스 풀에서 파일 단위로 병렬 처리
+"""
+
+import json
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+from xml.sax.saxutils import unescape
+
+from pptx.oxml.ns import nsuri
+
+from . import package
+
+FONT_TAGS = (b"latin", b"ea", b"cs", b"sym", b"font")
+TARGETS = re.compile(
+    r"ppt/(slides|slideLayouts|slideMasters|notesSlides|notesMasters|theme)/[^/]+\.xml$"
+)
+
+_HEX = re.compile(r"#?([0-9A-Fa-f]{6})$")
+_DML = re.compile(rb"xmlns(?::([\w.-]+))?\s*=\s*[\"']%s[\"']"
+                  % re.escape(nsuri("a").encode()))  # DrawingML 접두사 선언
+_VAL = re.compile(rb"(\s+val\s*=\s*)([\"'])(.*?)\2")
+_TYPEFACE = re.compile(rb"(\s+typeface\s*=\s*)([\"'])(.*?)\2")
+_XML_ENTITIES = {"&quot;": '"', "&apos;": "'"}  # &amp; &lt; &gt;는 unescape 기본
+
+
+class Mapping(NamedTuple):
+    """바꿀 값 표 (colors: "1B3A5C" → "0F2A4A", fonts: "맑은 고딕" → "나눔고딕")"""
+    colors: dict
+    fonts: dict
+
+
+class RethemeResult(NamedTuple):
+    path: str
+    output: str
+    parts: int      # 전체 zip 항목 수
+    rewritten: int  # 다시 압축한 항목 수
+    changes: int    # 바꾼 속성 수
+    seconds: float
+
+
+# ── 매핑 표 ───────────────────────────────────────────
+def hex_color(value):
+    """#1b3a5c, 1B3A5C 등 → 대문자 RRGGBB (아니면 ValueError)"""
+    match = _HEX.match(value.strip())
+    if not match:
+        raise ValueError(f"색상은 RRGGBB 16진수여야 함: {value!r}")
+    return match.group(1).upper()
+
+
+def _pairs(items, what):
+    pairs = {}
+    for item in items:
+        old, sep, new = item.partition("=")
+        if not sep or not old or not new:
+            raise ValueError(f"{what} 매핑은 OLD=NEW 형식이어야 함: {item!r}")
+        pairs[old] = new
+    return pairs
+
+
+def mapping(colors=(), fonts=(), path=None):
+    """--color/--font의 OLD=NEW 목록과 JSON 매핑 파일({"colors": {}, "fonts": {}})을 합침"""
+    color_map, font_map = {}, {}
+    if path:
+        with open(path, encoding="utf-8") as f:
+            table = json.load(f)
+        if not isinstance(table, dict):
+            raise ValueError(f"{path}: 매핑 파일은 {{\"colors\": {{}}, \"fonts\": {{}}}} 객체여야 함")
+        color_map.update(_table(table, "colors", path))
+        font_map.update(_table(table, "fonts", path))
+    color_map.update(_pairs(colors, "색상"))
+    font_map.update(_pairs(fonts, "글꼴"))
+    return Mapping({hex_color(old): hex_color(new) for old, new in color_map.items()},
+                   font_map)
+
+
+def _table(table, key, path):
+    """매핑 파일의 "colors"/"fonts" 항목 (문자열 → 문자열 객체인지 확인)"""
+    pairs = table.get(key, {})
+    if not isinstance(pairs, dict) or not all(
+            isinstance(old, str) and isinstance(new, str) for old, new in pairs.items()):
+        raise ValueError(f"{path}: {key}는 문자열 → 문자열 객체여야 함")
+    return pairs
+
+
+def _needles(table):
+    """압축을 푼 XML에서 바꿀 값이 있는지 먼저 훑어볼 바이트 패턴"""
+    values = [f'"{color}"' for color in table.colors]
+    values += [f'"{color.lower()}"' for color in table.colors]
+    values += [f'"{_escape(font)}"' for font in table.fonts]
+    return [value.encode() for value in values]
+
+
+def _escape(text, quote='"'):
+    text = text.replace("&", "&amp;").replace("<", "&lt;")
+    return text.replace(quote, "&quot;" if quote == '"' else "&apos;")
+
+
+# ── 파트 고치기 ───────────────────────────────────────
+def _tags(data):
+    """파트의 DrawingML 접두사로 색상·글꼴 요소 시작 태그를 찾는 패턴 (선언이 없으면 None)"""
+    prefixes = {m[1] for m in _DML.finditer(data)}
+    if not prefixes:
+        return None
+    names = b"|".join((re.escape(p) + b":") if p else b"" for p in prefixes)
+    return re.compile(rb"<(?:%s)(srgbClr|%s)(?=[\s/>])[^>]*>" % (names, b"|".join(FONT_TAGS)))
+
+
+def rewrite_part(data, table):
+    """XML 바이트의 색상·글꼴 속성 값을 바꿈 → (새 바이트, 바꾼 수) (안 바뀌면 원래 바이트)"""
+    tags = _tags(data)
+    if tags is None:
+        return data, 0
+    changes = 0
+
+    def attr(match, lookup):
+        nonlocal changes
+        old = unescape(match[3].decode(), _XML_ENTITIES)
+        new = lookup(old)
+        if new is None or new == old:
+            return match[0]
+        changes += 1
+        quote = match[2]
+        return match[1] + quote + _escape(new, quote.decode()).encode() + quote
+
+    def element(match):
+        if match[1] == b"srgbClr":
+            return _VAL.sub(lambda m: attr(m, lambda v: table.colors.get(v.upper())),
+                            match[0], count=1)
+        return _TYPEFACE.sub(lambda m: attr(m, table.fonts.get), match[0], count=1)
+
+    data = tags.sub(element, data)
+    return data, changes
+
+
+def retheme(path, output, table, policy=None):
+    """.pptx 하나 재테마 → RethemeResult (output이 path면 임시 파일에 쓴 뒤 교체)"""
+    start = time.perf_counter()
+    policy = policy or package.POLICIES[package.COMPRESSION]
+    needles = _needles(table)
+    tmp = f"{output}.{os.getpid()}.tmp"
+    rewritten = changes = 0
+    try:
+        with zipfile.ZipFile(path) as source, zipfile.ZipFile(tmp, "w") as target:
+            infos = source.infolist()
+            for info in infos:
+                data, count = None, 0
+                if TARGETS.match(info.filename):
+                    blob = source.read(info)
+                    if any(needle in blob for needle in needles):
+                        data, count = rewrite_part(blob, table)
+                if not count:
+                    package.copy_member(target, source, info)
+                    continue
+                package.write_member(target, info.filename, data, policy, like=info)
+                rewritten += 1
+                changes += count
+        if changes or output != path:
+            os.replace(tmp, output)
+        else:
+            os.unlink(tmp)  # 제자리 재테마인데 바뀐 게 없으면 원본을 건드리지 않음
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return RethemeResult(path, output, len(infos), rewritten, changes,
+                         time.perf_counter() - start)
+
+
+# ── 여러 파일 ─────────────────────────────────────────
+def find_decks(paths):
+    """파일·디렉터리 목록 → (.pptx 경로, 출력 기준 상대 경로) (디렉터리는 하위까지)"""
+    found = []
+    for path in paths:
+        if not os.path.isdir(path):
+            found.append((path, os.path.basename(path)))
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(".pptx") and not name.startswith("~$"):
+                    full = os.path.join(dirpath, name)
+                    found.append((full, os.path.relpath(full, path)))
+    return found
+
+
+def retheme_all(paths, table, out_dir=None, jobs=1, compression=None):
+    """파일·디렉터리의 .pptx를 jobs개 워커로 재테마 → 입력 순서대로 RethemeResult
+
+    out_dir가 없으면 제자리에서 바꾸고, 있으면 디렉터리 구조를 그대로 두고 그 아래에 씀.
+    """
+    policy = package.POLICIES[compression or package.COMPRESSION]
+    args = []
+    for path, rel in find_decks(paths):
+        output = path
+        if out_dir:
+            output = os.path.join(out_dir, rel)
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+        args.append((path, output, table, policy))
+    if jobs <= 1 or len(args) <= 1:
+        for arg in args:
+            yield retheme(*arg)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(retheme, *arg) for arg in args]
+        for future in futures:
+            yield future.result()
@@ -0,0 +1,123 @@
+"""
+샘플링 프로파일러 (생성 스크립트·build 명령의 --profile)
+- SIGPROF 타이머(CPU 시간 기준)로 주기마다 메인 스레드 스택을 한 번씩 기록하고,
+  다른 스레드(package.write_members의 압축 스레드 풀 등)가 일하는 중이면 그 스택도
+  sys._current_frames()로 기록. 메인 스레드가 결과를 기다리는 중이면 그 샘플의 CPU 시간은
+  일하는 스레드들에 나눠 줌 (신호 처리는 메인 스레드에서만 실행되므로)
+- 커널 타이머 해상도(보통 4 ms)에 따라 요청 간격보다 드물게 올 수 있으므로
+  샘플마다 직전 샘플 이후 실제 CPU 시간으로 가중
+- 결과는 flame graph 도구(flamegraph.pl, speedscope, inferno)가 읽는
+  collapsed stack 형식: "모듈:함수;모듈:함수;... CPU 마이크로초"
+- 요약: 가장 안쪽 프레임 기준 분류(우리 코드 / python-pptx / lxml 직렬화 / zip 압축 / 기타)와
+  우리 함수별 포함 시간 상위 목록
+- C 코드(lxml, zlib) 안에서 받은 신호는 호출한 파이썬 프레임으로 기록됨 (Unix 전용)
+"""
+
+import collections
+import signal
+import sys
+import threading
+import time
+
+DEFAULT_INTERVAL = 0.002  # 초 (CPU 시간)
+
+_OURS = ("hydrogen_decks", "create_", "__main__")
+_SERIALIZE = {("pptx.opc.oxml", "serialize_part_xml"), ("pptx.oxml", "serialize_for_reading")}
+_COMPRESS = {("hydrogen_decks.package", "_compress")}  # zlib(C)을 부르는 파이썬 프레임
+_WAITING = ("threading", "queue", "concurrent.futures")  # 가장 안쪽이 여기면 대기 중
+
+
+def category(stack):
+    """가장 안쪽 프레임 기준 분류 (stack은 바깥 → 안쪽 (모듈, 함수) 목록)"""
+    module, func = stack[-1]
+    if module.startswith(("zipfile", "zlib")) or (module, func) in _COMPRESS:
+        return "zip 압축"
+    if (module, func) in _SERIALIZE:
+        return "lxml 직렬화"
+    if module.startswith("pptx"):
+        return "python-pptx"
+    if module.startswith(_OURS):
+        return "우리 코드"
+    return "기타"
+
+
+def _stack(frame):
+    """프레임 → 바깥 → 안쪽 (모듈, 함수) 튜플"""
+    stack = []
+    while frame is not None:
+        stack.append((frame.f_globals.get("__name__", "?"), frame.f_code.co_name))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+def _waiting(stack):
+    return stack[-1][0].startswith(_WAITING)
+
+
+class Sampler:
+    """start()~stop() 사이 스택 샘플 (스택 튜플 → CPU 초)"""
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.samples = collections.Counter()
+        self.count = 0
+        self._previous = None
+        self._last = None
+
+    def _sample(self, signum, frame):
+        now = time.process_time()
+        stacks = [_stack(frame)]
+        if threading.active_count() > 1:
+            main = threading.main_thread().ident
+            busy = [_stack(f) for ident, f in sys._current_frames().items()
+                    if ident != main]
+            busy = [stack for stack in busy if not _waiting(stack)]
+            if busy:
+                stacks = busy if _waiting(stacks[0]) else stacks + busy
+        for stack in stacks:
+            self.samples[stack] += (now - self._last) / len(stacks)
+        self.count += 1
+        self._last = now
+
+    def start(self):
+        self._last = time.process_time()
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous or signal.SIG_DFL)
+
+    # ── 출력 ──────────────────────────────────────────
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, seconds in sorted(self.samples.items()):
+                f.write(";".join(f"{m}:{fn}" for m, fn in stack)
+                        + f" {round(seconds * 1e6)}\n")
+
+    def summary(self, top=10):
+        """(분류별 CPU 초, 우리 함수별 포함 CPU 초 상위 top)
+
+        모든 샘플에 들어 있는 진입점(main 등)은 함수 목록에서 뺀다.
+        """
+        categories = collections.Counter()
+        inclusive = collections.Counter()
+        for stack, seconds in self.samples.items():
+            categories[category(stack)] += seconds
+            for frame in set(stack):
+                if frame[0].startswith(_OURS):
+                    inclusive[frame] += seconds
+        total = sum(self.samples.values())
+        ours = [(frame, seconds) for frame, seconds in inclusive.most_common()
+                if seconds < total * 0.995]
+        return categories, ours[:top]
+
+    def print_summary(self, top=10):
+        total = sum(self.samples.values()) or 1
+        categories, ours = self.summary(top)
+        print(f"샘플 {self.count}개, CPU {total * 1000:.0f} ms")
+        for name, seconds in categories.most_common():
+            print(f"  {name:<14}{seconds / total:>7.1%}")
+        print("우리 함수 (포함 시간)")
+        for (module, func), seconds in ours:
+            print(f"  {module + ':' + func:<56}{seconds / total:>7.1%}")
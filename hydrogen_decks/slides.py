@@ -0,0 +1,54 @@
+"""
+O(1) 슬라이드 추가
+- python-pptx Slides.add_slide는 슬라이드마다 presentation 관계 전체(_get_matching)와
+  sldId 전체(xpath)를 훑어 덱이 커질수록 제곱으로 느려진다
+- DeckSlides는 파트 이름 번호와 슬라이드 id를 카운터로 들고 관계를 바로 추가
+- 새 슬라이드의 도형 트리는 turbo 모드(최대 도형 id 캐시)로 켜서 add_shape/
+  add_textbox/add_table마다 spTree 전체를 훑지 않음
+"""
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+from pptx.slide import Slides
+
+MIN_SLIDE_ID = 256
+
+
+class DeckSlides(Slides):
+    """카운터로 파트 이름·rId·슬라이드 id를 할당하는 Slides"""
+
+    def __init__(self, sldIdLst, prs):
+        super().__init__(sldIdLst, prs)
+        ids = [int(sldId.get("id")) for sldId in sldIdLst]
+        self._count = len(ids)
+        self._next_id = max(ids, default=MIN_SLIDE_ID - 1) + 1
+
+    def next_partname(self):
+        """다음 슬라이드 파트 이름 (/ppt/slides/slideN.xml)"""
+        return PackURI("/ppt/slides/slide%d.xml" % (self._count + 1))
+
+    def append_part(self, slide_part):
+        """슬라이드 파트를 presentation 관계와 sldIdLst 끝에 추가"""
+        rId = self.part.rels._add_relationship(RT.SLIDE, slide_part)
+        self._sldIdLst._add_sldId(id=self._next_id, rId=rId)
+        self._count += 1
+        self._next_id += 1
+        return rId
+
+    def add_slide(self, slide_layout):
+        """slide_layout을 따르는 새 슬라이드 (Slides.add_slide와 같은 결과)"""
+        slide_part = SlidePart.new(self.next_partname(), self.part.package,
+                                   slide_layout.part)
+        slide = slide_part.slide
+        slide.shapes.turbo_add_enabled = True
+        slide.shapes.clone_layout_placeholders(slide_layout)
+        self.append_part(slide_part)
+        return slide
+
+
+def install(prs):
+    """prs.slides를 DeckSlides로 교체 (슬라이드가 없는 새 프레젠테이션용)"""
+    sldIdLst = prs._element.get_or_add_sldIdLst()
+    prs.__dict__["slides"] = DeckSlides(sldIdLst, prs)
+    return prs.slides
@@ -0,0 +1,366 @@
+"""
+선언형 덱 명세 (JSON / TOML / YAML)
+- 슬라이드마다 레이아웃(content/blank), 제목, 배경, 쪽 번호, 요소 목록을 적는다
+- 쪽 번호 number는 원래 덱의 일부만 옮긴 명세(1, 2, 22, 27번 등)용. 없으면 명세 안 순서.
+  콘텐츠 레이아웃의 번호는 slidenum 필드(명세 안 순서)라, 순서와 다른 number를 준
+  콘텐츠 슬라이드는 빈 레이아웃에 장식을 직접 그리고 번호를 글자로 씀
+- compile_spec: 검증하고 좌표(인치 → EMU)·색상 이름·정렬을 한 번만 해석해
+  렌더링 연산 목록으로 만든다
+- 컴파일 결과는 명세 바이트 + 컴파일러(이 모듈과 공용 모듈) 소스 해시로 캐시
+  → 내용만 바뀐 명세는 파싱·검증만 다시 하고, 생성 스크립트는 import하지 않음
+
+요소 (좌표는 인치, 폭에 "full"이면 슬라이드 전체 폭, 색상은 style 상수 이름 또는 "#RRGGBB"):
+  rect          box, fill
+  box           box, fill, text, [text_size, text_color, bold]        - add_colored_box
+  text          box, paragraphs=[{runs=[{text, size, bold, color}], align}], [wrap]
+  bullets       box, items=[{text, level, size, bold, color}]          - add_body_textbox + add_bullet
+  table         box, rows, [header, col_widths, size, header_size, banded]  - table.add_table
+  slide_number  [number] (슬라이드 번호 / 총 장수, 기본은 슬라이드의 쪽 번호)
+
+실행: python -m hydrogen_decks.spec 명세.toml [-o 출력.pptx] [--stream]
+"""
+
+import argparse
+import copyreg
+import hashlib
+import json
+import os
+import sys
+import time
+import tomllib
+
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from . import package, render, style, table
+from .build import new_presentation
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, KeyBuilder, SlideCache
+
+SPEC_VERSION = 2
+DEFAULT_SPEC_CACHE_DIR = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "specs")
+
+ALIGNMENTS = {
+    "left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT, "justify": PP_ALIGN.JUSTIFY,
+}
+_REQUIRED = object()
+
+# 컴파일 결과는 pickle로 캐시하므로 길이는 EMU 정수로 보관 (Inches·Pt는 int 하위
+# 클래스라 그대로 pickle하면 복원 시 단위가 다시 곱해짐). RGBColor(r, g, b)는
+# tuple 하위 클래스라 기본 pickle로는 복원되지 않아 reducer 등록
+copyreg.pickle(RGBColor, lambda color: (RGBColor, tuple(color)))
+
+
+class SpecError(ValueError):
+    """명세 형식 오류 (위치 경로 포함)"""
+
+
+# ── 읽기 ──────────────────────────────────────────────
+def load_spec(path):
+    """명세 파일 → (dict, 원본 바이트)"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return parse_spec(raw, path), raw
+
+
+def parse_spec(raw, path):
+    """명세 바이트 → dict. 형식은 확장자로 판단"""
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == ".json":
+            data = json.loads(raw)
+        elif ext == ".toml":
+            data = tomllib.loads(raw.decode("utf-8"))
+        elif ext in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise SpecError(f"{path}: YAML 명세에는 PyYAML이 필요합니다")
+            data = yaml.safe_load(raw)
+        else:
+            raise SpecError(f"{path}: 지원하지 않는 명세 형식 {ext}")
+    except (ValueError, UnicodeDecodeError) as e:
+        if isinstance(e, SpecError):
+            raise
+        raise SpecError(f"{path}: {e}") from e
+    return data
+
+
+# ── 검증 · 해석 ───────────────────────────────────────
+def _get(obj, key, kind, where, default=_REQUIRED):
+    if not isinstance(obj, dict):
+        raise SpecError(f"{where}: 객체여야 합니다")
+    if key not in obj:
+        if default is _REQUIRED:
+            raise SpecError(f"{where}.{key}: 필수 항목입니다")
+        return default
+    value = obj[key]
+    if kind is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, kind) or (kind is not bool and isinstance(value, bool)):
+        raise SpecError(f"{where}.{key}: {kind.__name__} 형식이어야 합니다")
+    return value
+
+
+def _color(value, where):
+    if isinstance(value, str):
+        if value.startswith("#") and len(value) == 7:
+            try:
+                return RGBColor.from_string(value[1:].upper())
+            except ValueError:
+                pass
+        color = getattr(style, value, None)
+        if isinstance(color, RGBColor):
+            return color
+    raise SpecError(f"{where}: 알 수 없는 색상 {value!r}")
+
+
+def _opt_color(obj, key, where, default):
+    value = obj.get(key)
+    return default if value is None else _color(value, f"{where}.{key}")
+
+
+def _length(value, where, full=None):
+    if value == "full" and full is not None:
+        return int(full)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise SpecError(f"{where}: 인치 단위 숫자여야 합니다")
+    return int(Inches(value))
+
+
+def _box(obj, where):
+    box = _get(obj, "box", list, where)
+    if len(box) != 4:
+        raise SpecError(f"{where}.box: [left, top, width, height] 4개 값이어야 합니다")
+    left, top, width, height = box
+    return (_length(left, f"{where}.box[0]"), _length(top, f"{where}.box[1]"),
+            _length(width, f"{where}.box[2]", style.SLIDE_WIDTH),
+            _length(height, f"{where}.box[3]"))
+
+
+def _align(obj, where):
+    value = obj.get("align")
+    if value is None:
+        return None
+    if value not in ALIGNMENTS:
+        raise SpecError(f"{where}.align: {', '.join(ALIGNMENTS)} 중 하나여야 합니다")
+    return ALIGNMENTS[value]
+
+
+def _font(obj, where, size=18, bold=False, color=style.DARK_GRAY):
+    return (_get(obj, "size", float, where, size), _get(obj, "bold", bool, where, bold),
+            _opt_color(obj, "color", where, color))
+
+
+def _texts(values, where):
+    if not isinstance(values, list) or not all(
+            isinstance(v, (str, int, float)) for v in values):
+        raise SpecError(f"{where}: 문자열 목록이어야 합니다")
+    return tuple(str(v) for v in values)
+
+
+def _compile_element(el, where):
+    kind = _get(el, "type", str, where)
+    if kind == "rect":
+        return ("rect", *_box(el, where), _color(_get(el, "fill", str, where), f"{where}.fill"))
+    if kind == "box":
+        return ("box", *_box(el, where),
+                _color(_get(el, "fill", str, where), f"{where}.fill"),
+                _get(el, "text", str, where), _get(el, "text_size", float, where, 13),
+                _opt_color(el, "text_color", where, style.WHITE),
+                _get(el, "bold", bool, where, True))
+    if kind == "text":
+        paragraphs = []
+        for i, para in enumerate(_get(el, "paragraphs", list, where)):
+            pwhere = f"{where}.paragraphs[{i}]"
+            runs = tuple(
+                (_get(run, "text", str, f"{pwhere}.runs[{j}]"),
+                 *_font(run, f"{pwhere}.runs[{j}]"))
+                for j, run in enumerate(_get(para, "runs", list, pwhere))
+            )
+            paragraphs.append((_align(para, pwhere), runs))
+        return ("text", *_box(el, where), _get(el, "wrap", bool, where, True),
+                tuple(paragraphs))
+    if kind == "bullets":
+        items = []
+        for i, item in enumerate(_get(el, "items", list, where)):
+            iwhere = f"{where}.items[{i}]"
+            items.append((_get(item, "text", str, iwhere), _get(item, "level", int, iwhere, 0),
+                          *_font(item, iwhere, size=16),
+                          int(Pt(_get(item, "space_after", float, iwhere, 6)))))
+        return ("bullets", *_box(el, where), tuple(items))
+    if kind == "table":
+        header = el.get("header")
+        header = _texts(header, f"{where}.header") if header is not None else None
+        rows = tuple(_texts(row, f"{where}.rows[{i}]")
+                     for i, row in enumerate(_get(el, "rows", list, where)))
+        if not rows and not header:
+            raise SpecError(f"{where}.rows: 행이 하나 이상 있거나 header가 있어야 합니다")
+        n_cols = len(header) if header else len(rows[0])
+        if not n_cols:
+            raise SpecError(f"{where}: 열이 하나 이상 있어야 합니다")
+        for i, row in enumerate(rows):
+            if len(row) != n_cols:
+                raise SpecError(f"{where}.rows[{i}]: 열 {len(row)}개 — 다른 행과 같은 "
+                                f"{n_cols}개여야 합니다")
+        widths = el.get("col_widths")
+        return ("table", *_box(el, where), header, rows,
+                tuple(_length(w, f"{where}.col_widths[{i}]") for i, w in enumerate(widths))
+                if widths is not None else None,
+                _get(el, "size", float, where, 13), _get(el, "header_size", float, where, 14),
+                _get(el, "banded", bool, where, True))
+    if kind == "slide_number":
+        return ("slide_number", _get(el, "number", int, where, None))
+    raise SpecError(f"{where}.type: 알 수 없는 요소 {kind!r}")
+
+
+def compile_spec(data):
+    """명세 dict → {"total": 총 장수, "slides": [(layout, 제목, 배경, 쪽 번호, 연산들), ...]}"""
+    slides = []
+    for i, sl in enumerate(_get(data, "slides", list, "spec")):
+        where = f"slides[{i}]"
+        layout = _get(sl, "layout", str, where, "content")
+        if layout not in ("content", "blank"):
+            raise SpecError(f"{where}.layout: content 또는 blank여야 합니다")
+        title = _get(sl, "title", str, where, None if layout == "blank" else _REQUIRED)
+        background = _opt_color(sl, "background", where, None)
+        number = _get(sl, "number", int, where, i + 1)
+        if number < 1:
+            raise SpecError(f"{where}.number: 1 이상이어야 합니다")
+        ops = tuple(_compile_element(el, f"{where}.elements[{j}]")
+                    for j, el in enumerate(_get(sl, "elements", list, where, [])))
+        slides.append((layout, title, background, number, ops))
+    total = _get(data, "total", int, "spec", len(slides))
+    return {"total": total, "slides": slides}
+
+
+# ── 컴파일 캐시 ───────────────────────────────────────
+def spec_key(raw):
+    """명세 바이트 + 컴파일러 소스 해시"""
+    h = hashlib.sha256(f"spec:{SPEC_VERSION}:".encode())
+    h.update(KeyBuilder()._module(sys.modules[__name__]))
+    h.update(raw)
+    return h.hexdigest()
+
+
+def load_compiled(path, cache=None):
+    """명세 파일을 컴파일 (cache가 있으면 해시 적중 시 파싱도 건너뜀)"""
+    if cache is None:
+        return compile_spec(load_spec(path)[0])
+    with open(path, "rb") as f:
+        raw = f.read()
+    key = spec_key(raw)
+    compiled = cache.get(key)
+    if compiled is None:
+        compiled = compile_spec(parse_spec(raw, path))
+        cache.put(key, compiled)
+    return compiled
+
+
+# ── 렌더링 ────────────────────────────────────────────
+def _text(slide, left, top, width, height, wrap, paragraphs):
+    tf = slide.shapes.add_textbox(left, top, width, height).text_frame
+    if wrap:
+        tf.word_wrap = True
+    for i, (align, runs) in enumerate(paragraphs):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        if align is not None:
+            p.alignment = align
+        for text, size, bold, color in runs:
+            run = p.add_run()
+            run.text = text
+            render.set_font(run, size=size, bold=bold, color=color)
+
+
+def _numbered_slide(prs, title, number, total):
+    """레이아웃의 slidenum 필드 없이 그린 콘텐츠 슬라이드 (번호는 글자)"""
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
+    render.add_background(slide, style.WHITE)
+    render.add_navy_header_bar(slide)
+    render.add_green_accent_line(slide)
+    render.add_title_text(slide, title)
+    render.add_footer_line(slide)
+    render.add_slide_number(slide, number, total)
+    return slide
+
+
+def render_slide(prs, compiled_slide, position, total):
+    """컴파일된 슬라이드 하나를 prs 끝에 추가 (position은 덱 안 순서)"""
+    layout, title, background, number, ops = compiled_slide
+    if layout == "content" and number != position:
+        slide = _numbered_slide(prs, title, number, total)
+    elif layout == "content":
+        slide = render.setup_slide(prs, title)
+    else:
+        slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
+    if background is not None:
+        render.add_background(slide, background)
+    for op, *args in ops:
+        if op == "rect":
+            render.add_rect(slide, *args)
+        elif op == "box":
+            render.add_colored_box(slide, *args)
+        elif op == "text":
+            _text(slide, *args)
+        elif op == "bullets":
+            left, top, width, height, items = args
+            tf = render.add_body_textbox(slide, left, top, width, height)
+            for i, (text, level, size, bold, color, space_after) in enumerate(items):
+                render.add_bullet(tf, text, level, size, bold, color, space_after,
+                                  first=i == 0)
+        elif op == "table":
+            left, top, width, height, header, rows, widths, size, header_size, banded = args
+            table.add_table(slide, rows, left, top, width, height, header=header,
+                            col_widths=widths, size=size, header_size=header_size,
+                            banded=banded)
+        elif op == "slide_number":
+            render.add_slide_number(slide, args[0] or number, total)
+    return slide
+
+
+def build_presentation(compiled, after_slide=None):
+    """컴파일된 명세로 덱 생성"""
+    total = compiled["total"]
+    prs = new_presentation(total)
+    for position, compiled_slide in enumerate(compiled["slides"], start=1):
+        render_slide(prs, compiled_slide, position, total)
+        if after_slide:
+            after_slide(prs)
+    return prs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="선언형 명세로 발표자료 PPT 생성")
+    parser.add_argument("spec", help="명세 파일 (.json / .toml / .yaml)")
+    parser.add_argument("-o", "--output", help="출력 .pptx 경로 (기본: 명세 이름.pptx)")
+    parser.add_argument("--no-cache", action="store_true", help="컴파일 캐시 사용 안 함")
+    parser.add_argument("--cache-dir", default=DEFAULT_SPEC_CACHE_DIR,
+                        help="컴파일 캐시 디렉터리")
+    parser.add_argument("--stream", action="store_true",
+                        help="슬라이드를 완성되는 대로 기록·해제")
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.splitext(args.spec)[0] + ".pptx"
+    cache = None if args.no_cache else SlideCache(args.cache_dir, DEFAULT_MAX_BYTES)
+    start = time.perf_counter()
+    try:
+        compiled = load_compiled(args.spec, cache)
+    except (SpecError, OSError) as e:
+        parser.exit(1, f"명세 오류: {e}\n")
+    compile_ms = (time.perf_counter() - start) * 1000
+    if args.stream:
+        writer = package.StreamWriter(output)
+        prs = build_presentation(compiled, after_slide=writer.flush)
+        writer.close(prs)
+    else:
+        prs = build_presentation(compiled)
+        package.save(prs, output)
+    print(f"PPT 생성 완료: {output}")
+    print(f"총 {len(compiled['slides'])}장 슬라이드")
+    status = "캐시 재사용" if cache and cache.hits else "컴파일"
+    print(f"명세 {status}: {compile_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+발표자료 공용 스타일 상수
+- 세 생성 스크립트가 같은 색상·폰트·슬라이드 크기를 공유
+"""
+
+from pptx.util import Inches
+from pptx.dml.color import RGBColor
+
+# ── 색상 ──────────────────────────────────────────────
+NAVY = RGBColor(0x1B, 0x3A, 0x5C)
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+GREEN = RGBColor(0x2E, 0xCC, 0x71)
+LIGHT_GRAY = RGBColor(0xF0, 0xF0, 0xF0)
+DARK_GRAY = RGBColor(0x33, 0x33, 0x33)
+MEDIUM_GRAY = RGBColor(0x66, 0x66, 0x66)
+LIGHT_NAVY = RGBColor(0x2C, 0x5F, 0x8A)
+ACCENT_BLUE = RGBColor(0x34, 0x98, 0xDB)
+ACCENT_RED = RGBColor(0xE7, 0x4C, 0x3C)
+ACCENT_ORANGE = RGBColor(0xF3, 0x9C, 0x12)
+TABLE_HEADER_BG = RGBColor(0x1B, 0x3A, 0x5C)
+TABLE_ROW_ALT = RGBColor(0xE8, 0xF0, 0xF8)
+TABLE_ROW_WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+
+# ── 폰트 · 크기 ───────────────────────────────────────
+FONT_NAME = "맑은 고딕"
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
@@ -0,0 +1,134 @@
+"""
+일괄 테이블 작성기
+- 2차원 값 목록 + 행/열 스타일 규칙으로 a:tbl 전체를 한 번에 작성
+- 셀마다 table.cell()·프록시를 거치지 않고 스타일별 a:tc 템플릿을 복사해 행에 붙임
+- 결과 XML은 create_table + style_header_row + style_data_rows 경로와 동일
+"""
+
+from typing import NamedTuple, Optional
+
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.util import Emu
+
+from .style import (
+    WHITE, DARK_GRAY, TABLE_HEADER_BG, TABLE_ROW_ALT, TABLE_ROW_WHITE,
+    FONT_NAME,
+)
+from .templates import new_tc
+
+
+class CellStyle(NamedTuple):
+    """셀 스타일 규칙 (템플릿 캐시 키)"""
+    size: float = 13
+    bold: bool = False
+    color: RGBColor = DARK_GRAY
+    alignment: PP_ALIGN = PP_ALIGN.LEFT
+    fill: Optional[RGBColor] = None
+
+
+def header_style(size=14):
+    """헤더 행 스타일 - 남색 배경, 흰색 굵은 글씨, 가운데 정렬"""
+    return CellStyle(size, True, WHITE, PP_ALIGN.CENTER, TABLE_HEADER_BG)
+
+
+def band_fill(row_num):
+    """데이터 행 음영 (짝수 행 연한 남색)"""
+    return TABLE_ROW_ALT if row_num % 2 == 0 else TABLE_ROW_WHITE
+
+
+def styled_tc(text, style, name=FONT_NAME):
+    """스타일 템플릿을 복사한 새 a:tc"""
+    return new_tc(text, style.size, style.bold, style.color, style.alignment,
+                  style.fill, name)
+
+
+def fill_row(tr, values, styles):
+    """기존 a:tr의 셀을 값·스타일로 교체 (병합 속성 등 a:tc 속성은 유지)"""
+    for tc, value, style in zip(tr.tc_lst, values, styles):
+        new = styled_tc(value, style)
+        for key, attr in tc.attrib.items():
+            new.set(key, attr)
+        tr.replace(tc, new)
+
+
+def _pad(tr, count):
+    """값이 모자란 행은 python-pptx 기본 빈 셀로 채움"""
+    for _ in range(count):
+        tr.add_tc()
+
+
+def _row_styles(n_cols, base, col_styles, row_rule):
+    styles = []
+    for c in range(n_cols):
+        style = base
+        if col_styles and c in col_styles:
+            style = style._replace(**col_styles[c])
+        if row_rule:
+            style = style._replace(**row_rule)
+        styles.append(style)
+    return styles
+
+
+def add_table(slide, data, left, top, width, height, header=None,
+              col_widths=None, size=13, header_size=14, banded=True,
+              col_styles=None, row_styles=None):
+    """2차원 값 목록으로 테이블 전체를 한 번에 작성하고 graphicFrame 반환
+
+    col_styles / row_styles: {인덱스: {"bold": True, "color": NAVY, ...}} 형태의
+    CellStyle 필드 덮어쓰기. 행 인덱스는 header를 뺀 data 기준이며
+    행 규칙이 열 규칙보다 우선한다. banded=True면 짝수 행 음영.
+    행(header 포함)이나 열이 하나도 없으면 ValueError.
+    """
+    n_rows = len(data) + (1 if header else 0)
+    n_cols = max((len(row) for row in ([header] if header else []) + list(data)),
+                 default=0)
+    if not n_rows or not n_cols:
+        raise ValueError("add_table: 행과 열이 하나 이상 있어야 함 (header 또는 data)")
+
+    shape = slide.shapes.add_table(1, n_cols, left, top, width, height)
+    tbl = shape.table._tbl
+    tbl.remove(tbl.tr_lst[0])
+    if col_widths:
+        for gridCol, w in zip(tbl.tblGrid.gridCol_lst, col_widths):
+            gridCol.w = w
+
+    # python-pptx와 같은 행 높이 분배 (마지막 행이 나머지 흡수)
+    row_h = height // n_rows
+    last_h = height - (n_rows - 1) * row_h
+    row_num = 0
+
+    def new_tr():
+        tr = OxmlElement("a:tr")
+        tr.set("h", str(Emu(last_h if row_num == n_rows - 1 else row_h)))
+        tbl.append(tr)
+        return tr
+
+    if header:
+        tr = new_tr()
+        hstyle = header_style(header_size)
+        for value in header:
+            tr.append(styled_tc(str(value), hstyle))
+        _pad(tr, n_cols - len(header))
+        row_num += 1
+
+    base = CellStyle(size)
+    col_styles = col_styles or {}
+    row_styles = row_styles or {}
+    cache = {}
+    for r_idx, row in enumerate(data):
+        fill = band_fill(row_num) if banded else None
+        rule = row_styles.get(r_idx)
+        key = (fill, r_idx if rule else None)
+        styles = cache.get(key)
+        if styles is None:
+            styles = _row_styles(n_cols, base._replace(fill=fill),
+                                 col_styles, rule)
+            cache[key] = styles
+        tr = new_tr()
+        for value, style in zip(row, styles):
+            tr.append(styled_tc(str(value), style))
+        _pad(tr, n_cols - len(row))
+        row_num += 1
+    return shape
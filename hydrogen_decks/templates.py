@@ -0,0 +1,70 @@
+"""
+스타일 템플릿 캐시
+- (크기, 굵기, 색상, 폰트) 조합별 a:rPr, 셀 스타일별 a:tc를 한 번만 만들어 두고 복사
+- 템플릿 원본은 python-pptx 프록시 호출로 만들므로 결과 XML은 기존과 동일
+- 색·글꼴은 theme.py를 거쳐 테마 슬롯에 있으면 schemeClr·테마 글꼴로 기록
+"""
+
+from copy import deepcopy
+from functools import lru_cache
+
+from pptx.util import Inches, Pt
+from pptx.enum.text import MSO_ANCHOR
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.oxml.table import CT_Table
+from pptx.table import _Cell
+from pptx.text.text import _Run
+
+from .theme import set_color, set_typeface
+
+
+def apply_font(run, size, bold, color, name):
+    """python-pptx 프록시로 폰트 속성을 하나씩 설정"""
+    run.font.size = Pt(size)
+    run.font.bold = bold
+    set_color(run.font.color, color)
+    set_typeface(run.font, name)
+
+
+def _apply_cell_style(cell, size, bold, color, alignment, fill_color, name):
+    """셀 정렬·폰트·마진·배경을 프록시로 설정 (템플릿 원본 생성용)"""
+    cell.text = ""
+    p = cell.text_frame.paragraphs[0]
+    p.alignment = alignment
+    run = p.add_run()
+    apply_font(run, size, bold, color, name)
+    cell.vertical_anchor = MSO_ANCHOR.MIDDLE
+    cell.margin_left = Inches(0.08)
+    cell.margin_right = Inches(0.08)
+    cell.margin_top = Inches(0.04)
+    cell.margin_bottom = Inches(0.04)
+    if fill_color:
+        cell.fill.solid()
+        set_color(cell.fill.fore_color, fill_color)
+
+
+@lru_cache(maxsize=None)
+def run_properties(size, bold, color, name):
+    """조합별 a:rPr 템플릿 (최초 1회 생성 후 재사용)"""
+    r = parse_xml(f"<a:r {nsdecls('a')}><a:t/></a:r>")
+    apply_font(_Run(r, None), size, bold, color, name)
+    return r.rPr
+
+
+@lru_cache(maxsize=None)
+def cell_template(size, bold, color, alignment, fill_color, name):
+    """조합별 a:tc 템플릿 - 빈 run 하나를 가진 완성된 셀"""
+    tbl = CT_Table.new_tbl(1, 1, Inches(1), Inches(1))
+    tc = tbl.tc(0, 0)
+    _apply_cell_style(_Cell(tc, None), size, bold, color, alignment,
+                      fill_color, name)
+    return tc
+
+
+def new_tc(text, size, bold, color, alignment, fill_color, name):
+    """템플릿을 복사해 text를 채운 새 a:tc"""
+    tc = deepcopy(cell_template(size, bold, color, alignment, fill_color, name))
+    # 템플릿 구조: a:tc/a:txBody/(bodyPr, lstStyle, a:p)/(pPr, a:r)
+    tc[0][-1][-1].text = text
+    return tc
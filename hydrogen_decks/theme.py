@@ -0,0 +1,63 @@
+"""
+테마 색·글꼴
+- 공용 색상을 테마 색 슬롯에, 맑은 고딕을 테마 글꼴(제목·본문의 라틴·동아시아)에 둠
+- 도형·텍스트는 srgbClr 대신 schemeClr(tx1, accent2, ...)로 색을 참조하고,
+  테마 글꼴이면 a:latin을 쓰지 않음 (마스터 기본값 +mn-lt를 따름)
+  → 완성된 덱도 테마 파트(ppt/theme/theme1.xml) 하나만 바꾸면 색·글꼴이 함께 바뀜
+- 슬롯에 없는 색(스크립트의 일회성 색 등)은 그대로 srgbClr
+- basetemplate.compact()가 apply()로 최소 템플릿의 테마를 채움
+"""
+
+from lxml import etree
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.oxml.ns import qn
+
+from .style import (
+    NAVY, WHITE, GREEN, DARK_GRAY, MEDIUM_GRAY, LIGHT_NAVY, ACCENT_BLUE,
+    ACCENT_RED, ACCENT_ORANGE, TABLE_ROW_ALT, FONT_NAME,
+)
+
+# (테마 clrScheme 슬롯, 슬라이드에서 참조할 테마 색, 색상)
+# 마스터 clrMap이 bg1=lt1, tx1=dk1, bg2=lt2, tx2=dk2로 잇는다
+SCHEME = (
+    ("dk1", MSO_THEME_COLOR.TEXT_1, DARK_GRAY),
+    ("lt1", MSO_THEME_COLOR.BACKGROUND_1, WHITE),
+    ("dk2", MSO_THEME_COLOR.TEXT_2, NAVY),
+    ("lt2", MSO_THEME_COLOR.BACKGROUND_2, TABLE_ROW_ALT),
+    ("accent1", MSO_THEME_COLOR.ACCENT_1, LIGHT_NAVY),
+    ("accent2", MSO_THEME_COLOR.ACCENT_2, GREEN),
+    ("accent3", MSO_THEME_COLOR.ACCENT_3, ACCENT_BLUE),
+    ("accent4", MSO_THEME_COLOR.ACCENT_4, ACCENT_RED),
+    ("accent5", MSO_THEME_COLOR.ACCENT_5, ACCENT_ORANGE),
+    ("accent6", MSO_THEME_COLOR.ACCENT_6, MEDIUM_GRAY),
+)
+COLORS = {slot: rgb for slot, _, rgb in SCHEME}
+_THEME_COLORS = {rgb: theme_color for _, theme_color, rgb in SCHEME}
+
+
+def set_color(color_format, rgb):
+    """슬롯에 있는 색이면 테마 색으로, 아니면 RGB로 설정 (fore_color·font.color)"""
+    theme_color = _THEME_COLORS.get(rgb)
+    if theme_color is None:
+        color_format.rgb = rgb
+    else:
+        color_format.theme_color = theme_color
+
+
+def set_typeface(font, name):
+    """테마 글꼴이면 a:latin을 지워 테마를 따르게 하고, 아니면 글꼴 이름 지정"""
+    font.name = None if name == FONT_NAME else name
+
+
+def apply(theme, colors=COLORS, font=FONT_NAME):
+    """a:theme 요소의 색 슬롯·제목/본문 글꼴을 바꿈 (colors는 슬롯 → RGB, 일부만 줘도 됨)"""
+    scheme = theme.find(f"{qn('a:themeElements')}/{qn('a:clrScheme')}")
+    for slot, rgb in colors.items():
+        el = scheme.find(qn(f"a:{slot}"))
+        el.clear()
+        etree.SubElement(el, qn("a:srgbClr"), val=str(rgb))
+    fonts = theme.find(f"{qn('a:themeElements')}/{qn('a:fontScheme')}")
+    for face in (qn("a:majorFont"), qn("a:minorFont")):
+        for script in (qn("a:latin"), qn("a:ea")):
+            fonts.find(f"{face}/{script}").set("typeface", font)
+    return theme
@@ -0,0 +1,151 @@
+"""
+XML 템플릿 렌더링 백엔드 (render.BACKEND = "xml")
+- 생성 스크립트가 쓰는 기본 도형(막대, 둥근 색상 박스, 텍스트박스, 불릿)을
+  python-pptx 객체 없이 미리 만든 p:sp / a:p 템플릿 복사로 그림
+- 템플릿 원본은 render의 python-pptx 경로로 한 번 그려 떼어 오므로
+  결과 XML은 python-pptx 경로와 바이트 단위로 동일
+- 복사 후 바꾸는 것은 도형 id·이름, 위치·크기(a:xfrm), 텍스트(a:t)뿐
+- 테이블은 이미 셀 템플릿으로 일괄 작성(table.py)하므로 그대로 사용
+"""
+
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
+
+from pptx import Presentation
+from pptx.oxml.text import CT_RegularTextRun
+from pptx.text.text import _Paragraph
+
+BLANK_LAYOUT = 6  # 스크래치 슬라이드는 python-pptx 기본 템플릿을 그대로 씀
+
+
+# ── 템플릿 ────────────────────────────────────────────
+@contextmanager
+def _proxy_backend():
+    """템플릿 원본을 그리는 동안만 python-pptx 경로 사용"""
+    from . import render
+
+    backend, render.BACKEND = render.BACKEND, "pptx"
+    try:
+        yield render
+    finally:
+        render.BACKEND = backend
+
+
+@lru_cache(maxsize=None)
+def _scratch_slide():
+    """템플릿 원본을 그릴 빈 슬라이드"""
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT])
+
+
+@lru_cache(maxsize=None)
+def shape_template(name, *args):
+    """render.<name>(slide, *args)가 그린 p:sp (인자 조합마다 한 번)"""
+    slide = _scratch_slide()
+    with _proxy_backend() as render:
+        getattr(render, name)(slide, *args)
+    sp = slide.shapes._spTree[-1]
+    sp.getparent().remove(sp)
+    return sp
+
+
+@lru_cache(maxsize=None)
+def bullet_template(level, size, bold, color, space_after):
+    """render.add_bullet가 새 문단으로 추가한 a:p"""
+    tf = shape_template("add_body_textbox")
+    with _proxy_backend() as render:
+        tf = _scratch_slide().shapes._shape_factory(deepcopy(tf)).text_frame
+        render.add_bullet(tf, "", level, size, bold, color, space_after)
+    return tf._txBody[-1]
+
+
+# ── 복사 · 배치 ───────────────────────────────────────
+def _set_text(t, text):
+    t.text = CT_RegularTextRun._escape_ctrl_chars(text)
+
+
+def _place(slide, template, left=None, top=None, width=None, height=None):
+    """템플릿 p:sp를 복사해 새 id·이름(·위치/크기)으로 슬라이드 끝에 추가"""
+    shapes = slide.shapes
+    sp = deepcopy(template)
+    shape_id = shapes._next_shape_id
+    cNvPr = sp[0][0]
+    cNvPr.set("id", str(shape_id))
+    cNvPr.set("name", f"{cNvPr.get('name').rsplit(' ', 1)[0]} {shape_id - 1}")
+    if left is not None:
+        off, ext = sp[1][0]
+        off.set("x", str(left))
+        off.set("y", str(top))
+        ext.set("cx", str(width))
+        ext.set("cy", str(height))
+    shapes._spTree.insert_element_before(sp, "p:extLst")
+    return sp
+
+
+def _shape(slide, sp):
+    return slide.shapes._shape_factory(sp)
+
+
+# ── 기본 도형 ─────────────────────────────────────────
+def add_rect(slide, left, top, width, height, color):
+    sp = _place(slide, shape_template("add_rect", 0, 0, 0, 0, color),
+                left, top, width, height)
+    return _shape(slide, sp)
+
+
+def add_navy_header_bar(slide):
+    _place(slide, shape_template("add_navy_header_bar"))
+
+
+def add_green_accent_line(slide, top):
+    _place(slide, shape_template("add_green_accent_line", top))
+
+
+def add_footer_line(slide):
+    _place(slide, shape_template("add_footer_line"))
+
+
+def add_slide_number(slide, num, total):
+    sp = _place(slide, shape_template("add_slide_number", 0, 0))
+    _set_text(sp[-1][-1][-1][-1], f"{num} / {total}")
+
+
+def add_title_text(slide, title_text, left, top, width, height):
+    sp = _place(slide, shape_template("add_title_text", ""),
+                left, top, width, height)
+    _set_text(sp[-1][-1][-1][-1], title_text)
+    return _shape(slide, sp)
+
+
+def add_body_textbox(slide, left, top, width, height):
+    sp = _place(slide, shape_template("add_body_textbox"),
+                left, top, width, height)
+    return _shape(slide, sp).text_frame
+
+
+def add_colored_box(slide, left, top, width, height, fill_color, text,
+                    text_size, text_color, bold):
+    template = shape_template("add_colored_box", 0, 0, 0, 0, fill_color, "",
+                              text_size, text_color, bold)
+    sp = _place(slide, template, left, top, width, height)
+    _set_text(sp[-1][-1][-1][-1], text)
+    return _shape(slide, sp)
+
+
+def add_bullet(tf, text, level, size, bold, color, space_after, first):
+    """불릿 문단 추가 (first면 비어 있는 첫 a:p를 교체)
+
+    첫 문단에 이미 내용이 있으면 None을 돌려주고 python-pptx 경로에 맡긴다.
+    """
+    txBody = tf._txBody
+    p = deepcopy(bullet_template(level, size, bold, color, space_after))
+    _set_text(p[-1][-1], text)
+    if first:
+        old = txBody.p_lst[0]
+        if len(old) or old.attrib:
+            return None
+        txBody.replace(old, p)
+    else:
+        txBody.append(p)
+    return _Paragraph(p, tf)
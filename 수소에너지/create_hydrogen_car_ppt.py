@@ -6,198 +6,42 @@
 - 데이터 출처: 07_수소자동차_시장_현황과_전망.md
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
+from pptx.util import Inches, Emu
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from hydrogen_decks import build, fields, registry, render
+from hydrogen_decks.render import (
+    set_font, set_color, add_background, add_body_textbox, add_bullet,
+    style_header_row, style_data_rows, add_colored_box, setup_slide,
+)
+from hydrogen_decks.style import (
+    NAVY, WHITE, GREEN, DARK_GRAY, MEDIUM_GRAY, LIGHT_NAVY,
+    ACCENT_BLUE, ACCENT_RED, ACCENT_ORANGE, SLIDE_WIDTH,
+)
 
 # ── 상수 ──────────────────────────────────────────────
-NAVY = RGBColor(0x1B, 0x3A, 0x5C)
-WHITE = RGBColor(0xFF, 0xFF, 0xFF)
-GREEN = RGBColor(0x2E, 0xCC, 0x71)
-LIGHT_GRAY = RGBColor(0xF0, 0xF0, 0xF0)
-DARK_GRAY = RGBColor(0x33, 0x33, 0x33)
-MEDIUM_GRAY = RGBColor(0x66, 0x66, 0x66)
-LIGHT_NAVY = RGBColor(0x2C, 0x5F, 0x8A)
-ACCENT_BLUE = RGBColor(0x34, 0x98, 0xDB)
-ACCENT_RED = RGBColor(0xE7, 0x4C, 0x3C)
-ACCENT_ORANGE = RGBColor(0xF3, 0x9C, 0x12)
-TABLE_HEADER_BG = RGBColor(0x1B, 0x3A, 0x5C)
-TABLE_ROW_ALT = RGBColor(0xE8, 0xF0, 0xF8)
-TABLE_ROW_WHITE = RGBColor(0xFF, 0xFF, 0xFF)
-
-FONT_NAME = "맑은 고딕"
-SLIDE_WIDTH = Inches(13.333)
-SLIDE_HEIGHT = Inches(7.5)
-TOTAL_SLIDES = 28
+REGISTRY = registry.Registry()
 
 OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "수소자동차_시장분석_발표자료.pptx")
 
 
 # ── 유틸리티 함수 ─────────────────────────────────────
-def set_font(run, size=18, bold=False, color=DARK_GRAY, name=FONT_NAME):
-    run.font.size = Pt(size)
-    run.font.bold = bold
-    run.font.color.rgb = color
-    run.font.name = name
-
-
-def add_background(slide, color=WHITE):
-    bg = slide.background
-    fill = bg.fill
-    fill.solid()
-    fill.fore_color.rgb = color
-
-
-def add_navy_header_bar(slide):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Emu(0), Emu(0), SLIDE_WIDTH, Inches(1.2)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = NAVY
-    shape.line.fill.background()
-
-
-def add_green_accent_line(slide, top=Inches(1.2)):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Emu(0), top, SLIDE_WIDTH, Inches(0.06)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
-    shape.line.fill.background()
-
-
-def add_slide_number(slide, num):
-    txBox = slide.shapes.add_textbox(
-        Inches(12.0), Inches(7.0), Inches(1.2), Inches(0.4)
-    )
-    tf = txBox.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.RIGHT
-    run = p.add_run()
-    run.text = f"{num} / {TOTAL_SLIDES}"
-    set_font(run, size=12, color=MEDIUM_GRAY)
-
-
-def add_footer_line(slide):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0.5), Inches(7.1), Inches(12.333), Inches(0.02)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = NAVY
-    shape.line.fill.background()
-
-
-def add_title_text(slide, title_text, left=Inches(0.6), top=Inches(0.2),
-                   width=Inches(12), height=Inches(0.9)):
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.LEFT
-    run = p.add_run()
-    run.text = title_text
-    set_font(run, size=34, bold=True, color=WHITE)
-    return txBox
-
-
-def add_body_textbox(slide, left=Inches(0.8), top=Inches(1.6),
-                     width=Inches(11.7), height=Inches(5.2)):
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    return tf
-
-
-def add_bullet(tf, text, level=0, size=16, bold=False, color=DARK_GRAY,
-               space_after=Pt(6), first=False):
-    if first:
-        p = tf.paragraphs[0]
-    else:
-        p = tf.add_paragraph()
-    p.level = level
-    p.space_after = space_after
-    p.alignment = PP_ALIGN.LEFT
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=size, bold=bold, color=color)
-    return p
-
-
-def set_cell(table, row, col, text, size=12, bold=False, color=DARK_GRAY,
-             alignment=PP_ALIGN.LEFT, fill_color=None):
-    cell = table.cell(row, col)
-    cell.text = ""
-    p = cell.text_frame.paragraphs[0]
-    p.alignment = alignment
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=size, bold=bold, color=color)
-    cell.vertical_anchor = MSO_ANCHOR.MIDDLE
-    cell.margin_left = Inches(0.08)
-    cell.margin_right = Inches(0.08)
-    cell.margin_top = Inches(0.04)
-    cell.margin_bottom = Inches(0.04)
-    if fill_color:
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = fill_color
-
-
-def style_header_row(table, headers, size=14):
-    for i, h in enumerate(headers):
-        set_cell(table, 0, i, h, size=size, bold=True, color=WHITE,
-                 alignment=PP_ALIGN.CENTER, fill_color=TABLE_HEADER_BG)
-
-
-def style_data_rows(table, data, start_row=1, size=13):
-    for r_idx, row_data in enumerate(data):
-        row_num = start_row + r_idx
-        bg = TABLE_ROW_ALT if row_num % 2 == 0 else TABLE_ROW_WHITE
-        for c_idx, val in enumerate(row_data):
-            set_cell(table, row_num, c_idx, val, size=size, fill_color=bg)
-
-
-def setup_slide(prs, title_text, slide_num):
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_background(slide, WHITE)
-    add_navy_header_bar(slide)
-    add_green_accent_line(slide)
-    add_title_text(slide, title_text)
-    add_footer_line(slide)
-    add_slide_number(slide, slide_num)
-    return slide
-
-
-def add_colored_box(slide, left, top, width, height, fill_color, text,
-                    text_size=13, text_color=WHITE, bold=True):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
-    shape.line.fill.background()
-    tf = shape.text_frame
-    tf.word_wrap = True
-    tf.margin_left = Inches(0.1)
-    tf.margin_right = Inches(0.1)
-    tf.margin_top = Inches(0.05)
-    tf.margin_bottom = Inches(0.05)
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=text_size, bold=bold, color=text_color)
-    return shape
+def add_slide_number(slide, num=fields.PAGE):
+    render.add_slide_number(slide, num, fields.TOTAL)
 
 
 # ── 슬라이드 생성 ─────────────────────────────────────
 
+@REGISTRY.slide("도입")
 def slide_01_cover(prs):
     """표지"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
     add_background(slide, NAVY)
 
     # 상단 녹색 라인
@@ -205,7 +49,7 @@ def slide_01_cover(prs):
         MSO_SHAPE.RECTANGLE, Emu(0), Inches(2.0), SLIDE_WIDTH, Inches(0.08)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
+    set_color(shape.fill.fore_color, GREEN)
     shape.line.fill.background()
 
     # 제목
@@ -242,13 +86,14 @@ def slide_01_cover(prs):
         MSO_SHAPE.RECTANGLE, Emu(0), Inches(5.7), SLIDE_WIDTH, Inches(0.08)
     )
     shape2.fill.solid()
-    shape2.fill.fore_color.rgb = GREEN
+    set_color(shape2.fill.fore_color, GREEN)
     shape2.line.fill.background()
 
 
+@REGISTRY.slide("도입")
 def slide_02_toc(prs):
     """목차"""
-    slide = setup_slide(prs, "목차 (Table of Contents)", 2)
+    slide = setup_slide(prs, "목차 (Table of Contents)")
     sections = [
         ("Part 1", "세계 수소차 시장 현황", "글로벌 판매 추이, 국가별 보급, 주요 모델, 충전 인프라"),
         ("Part 2", "시장 전망 및 정책", "시장 전망, 정부 정책, 상용차·기타 모빌리티"),
@@ -269,15 +114,19 @@ def slide_02_toc(prs):
         run = p.add_run()
         run.text = title
         set_font(run, size=20, bold=True, color=DARK_GRAY)
+        page = p.add_run()
+        page.text = f"   p.{fields.section(part)}"
+        set_font(page, size=14, color=MEDIUM_GRAY)
         p2 = tf.add_paragraph()
         run2 = p2.add_run()
         run2.text = desc
         set_font(run2, size=14, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 1 세계 수소차 시장 현황", tags=("시장", "표"))
 def slide_03_global_market(prs):
     """세계 수소차 시장 현황"""
-    slide = setup_slide(prs, "세계 수소자동차 시장 현황", 3)
+    slide = setup_slide(prs, "세계 수소자동차 시장 현황")
 
     # 테이블: 연도별 판매 추이
     tbl_shape = slide.shapes.add_table(7, 5, Inches(0.6), Inches(1.5),
@@ -311,9 +160,10 @@ def slide_03_global_market(prs):
                     text_size=13)
 
 
+@REGISTRY.slide("Part 1 세계 수소차 시장 현황", tags=("시장", "표"))
 def slide_04_country_status(prs):
     """국가별 보급 현황"""
-    slide = setup_slide(prs, "주요 국가별 FCEV 보급 현황 (2025년)", 4)
+    slide = setup_slide(prs, "주요 국가별 FCEV 보급 현황 (2025년)")
 
     # 테이블
     tbl_shape = slide.shapes.add_table(7, 4, Inches(0.6), Inches(1.5),
@@ -344,9 +194,10 @@ def slide_04_country_status(prs):
                size=14, color=ACCENT_RED)
 
 
+@REGISTRY.slide("Part 1 세계 수소차 시장 현황", tags=("모델", "표"))
 def slide_05_key_models(prs):
     """넥쏘 2세대 vs 미라이"""
-    slide = setup_slide(prs, "주요 모델: 현대 넥쏘 2세대 vs 도요타 미라이", 5)
+    slide = setup_slide(prs, "주요 모델: 현대 넥쏘 2세대 vs 도요타 미라이")
 
     # 넥쏘 2세대 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -398,9 +249,10 @@ def slide_05_key_models(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 1 세계 수소차 시장 현황", tags=("모델", "표"))
 def slide_06_other_models(prs):
     """기타 모델 & 중단 사례"""
-    slide = setup_slide(prs, "기타 주요 모델 및 개발 중단/철수 사례", 6)
+    slide = setup_slide(prs, "기타 주요 모델 및 개발 중단/철수 사례")
 
     # 기타 모델 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -452,9 +304,10 @@ def slide_06_other_models(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 1 세계 수소차 시장 현황", tags=("인프라", "표"))
 def slide_07_charging_infra(prs):
     """글로벌 충전 인프라"""
-    slide = setup_slide(prs, "글로벌 수소 충전 인프라 현황", 7)
+    slide = setup_slide(prs, "글로벌 수소 충전 인프라 현황")
 
     # 충전소 현황 테이블
     tbl1 = slide.shapes.add_table(8, 3, Inches(0.6), Inches(1.5),
@@ -503,9 +356,10 @@ def slide_07_charging_infra(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 2 시장 전망 및 정책", tags=("시장", "표"))
 def slide_08_market_outlook(prs):
     """시장 전망"""
-    slide = setup_slide(prs, "세계 수소차 시장 전망", 8)
+    slide = setup_slide(prs, "세계 수소차 시장 전망")
 
     # 연료전지 시장 규모 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -560,9 +414,10 @@ def slide_08_market_outlook(prs):
                     text_size=13)
 
 
+@REGISTRY.slide("Part 2 시장 전망 및 정책", tags=("정책", "표"))
 def slide_09_government_policy(prs):
     """주요국 정책 비교"""
-    slide = setup_slide(prs, "주요국 정부 정책 및 보조금 비교", 9)
+    slide = setup_slide(prs, "주요국 정부 정책 및 보조금 비교")
 
     # 정책 비교 테이블
     tbl_shape = slide.shapes.add_table(6, 4, Inches(0.6), Inches(1.5),
@@ -595,9 +450,10 @@ def slide_09_government_policy(prs):
                level=1, size=13)
 
 
+@REGISTRY.slide("Part 2 시장 전망 및 정책", tags=("상용차", "표"))
 def slide_10_commercial_vehicles(prs):
     """상용차 (트럭/버스)"""
-    slide = setup_slide(prs, "수소 상용차 시장 동향 — 트럭 & 버스", 10)
+    slide = setup_slide(prs, "수소 상용차 시장 동향 — 트럭 & 버스")
 
     # XCIENT 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -639,9 +495,10 @@ def slide_10_commercial_vehicles(prs):
                     text_size=13)
 
 
+@REGISTRY.slide("Part 2 시장 전망 및 정책", tags=("모빌리티",))
 def slide_11_other_mobility(prs):
     """기타 모빌리티"""
-    slide = setup_slide(prs, "기타 수소 모빌리티 — 선박·항공·열차·지게차·잠수함", 11)
+    slide = setup_slide(prs, "기타 수소 모빌리티 — 선박·항공·열차·지게차·잠수함")
 
     items = [
         ("선박", "Viking Libra 수소 크루즈선\n6MW PEM(2026년)\n한화에어로 200kW 선박용 FC", NAVY),
@@ -661,9 +518,10 @@ def slide_11_other_mobility(prs):
                         color, f"■ {title}\n\n{desc}", text_size=13)
 
 
+@REGISTRY.slide("Part 3 핵심 기술 발전", tags=("기술", "표"))
 def slide_12_stack_technology(prs):
     """스택/촉매 기술"""
-    slide = setup_slide(prs, "핵심 기술: 스택 출력밀도 & 촉매 혁신", 12)
+    slide = setup_slide(prs, "핵심 기술: 스택 출력밀도 & 촉매 혁신")
 
     # 스택 출력밀도 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -717,9 +575,10 @@ def slide_12_stack_technology(prs):
     add_bullet(tf, "KAIST: 백금-아연 나노입자로 1/3 절감(2025)", level=1, size=13)
 
 
+@REGISTRY.slide("Part 3 핵심 기술 발전", tags=("기술", "표"))
 def slide_13_cost_storage(prs):
     """비용/저장 기술"""
-    slide = setup_slide(prs, "연료전지 비용 추이 & 수소 저장 기술", 13)
+    slide = setup_slide(prs, "연료전지 비용 추이 & 수소 저장 기술")
 
     # 비용 추이 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -758,9 +617,10 @@ def slide_13_cost_storage(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 4 한국 시장 심층분석", tags=("한국", "시장", "표"))
 def slide_14_korea_market(prs):
     """한국 시장 현황"""
-    slide = setup_slide(prs, "한국 수소자동차 시장 현황", 14)
+    slide = setup_slide(prs, "한국 수소자동차 시장 현황")
 
     # 연도별 판매 테이블
     tbl_shape = slide.shapes.add_table(8, 5, Inches(0.6), Inches(1.5),
@@ -795,9 +655,10 @@ def slide_14_korea_market(prs):
                     text_size=13)
 
 
+@REGISTRY.slide("Part 4 한국 시장 심층분석", tags=("한국", "인프라", "표"))
 def slide_15_korea_infra_crisis(prs):
     """한국 충전 인프라"""
-    slide = setup_slide(prs, "한국 수소 충전 인프라 — 현황 및 수익성 위기", 15)
+    slide = setup_slide(prs, "한국 수소 충전 인프라 — 현황 및 수익성 위기")
 
     # 충전소 현황 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -853,9 +714,10 @@ def slide_15_korea_infra_crisis(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 4 한국 시장 심층분석", tags=("한국", "정책", "표"))
 def slide_16_korea_policy(prs):
     """한국 정책/보조금"""
-    slide = setup_slide(prs, "한국 수소 정책 프레임워크 & 보조금 비교", 16)
+    slide = setup_slide(prs, "한국 수소 정책 프레임워크 & 보조금 비교")
 
     # 정책 프레임워크 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -911,9 +773,10 @@ def slide_16_korea_policy(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 4 한국 시장 심층분석", tags=("한국", "기업", "표"))
 def slide_17_korea_investment(prs):
     """대기업 투자"""
-    slide = setup_slide(prs, "한국 대기업 그룹 수소 투자 규모 (2030년까지)", 17)
+    slide = setup_slide(prs, "한국 대기업 그룹 수소 투자 규모 (2030년까지)")
 
     # 투자 규모 테이블
     tbl_shape = slide.shapes.add_table(7, 3, Inches(0.6), Inches(1.5),
@@ -945,9 +808,10 @@ def slide_17_korea_investment(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 4 한국 시장 심층분석", tags=("한국", "기업", "표"))
 def slide_18_korea_supply_chain(prs):
     """밸류체인/국산화"""
-    slide = setup_slide(prs, "한국 수소차 밸류체인 & 핵심부품 국산화 현황", 18)
+    slide = setup_slide(prs, "한국 수소차 밸류체인 & 핵심부품 국산화 현황")
 
     # 밸류체인 불릿
     tf = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.5), width=Inches(6.0), height=Inches(3.0))
@@ -999,9 +863,10 @@ def slide_18_korea_supply_chain(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 4 한국 시장 심층분석", tags=("한국", "표"))
 def slide_19_korea_global_status(prs):
     """글로벌 위상"""
-    slide = setup_slide(prs, "한국의 글로벌 위상 — 분야별 순위", 19)
+    slide = setup_slide(prs, "한국의 글로벌 위상 — 분야별 순위")
 
     # 순위 테이블
     tbl_shape = slide.shapes.add_table(8, 3, Inches(0.6), Inches(1.5),
@@ -1037,9 +902,10 @@ def slide_19_korea_global_status(prs):
                     text_size=13)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("비교", "표"))
 def slide_20_bev_vs_fcev_specs(prs):
     """사양 비교"""
-    slide = setup_slide(prs, "BEV vs FCEV — 핵심 사양 비교", 20)
+    slide = setup_slide(prs, "BEV vs FCEV — 핵심 사양 비교")
 
     # 비교 테이블
     tbl_shape = slide.shapes.add_table(9, 4, Inches(0.6), Inches(1.5),
@@ -1074,9 +940,10 @@ def slide_20_bev_vs_fcev_specs(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("비교", "표"))
 def slide_21_tco_environment(prs):
     """TCO/환경성"""
-    slide = setup_slide(prs, "TCO(총소유비용) & 환경성 비교", 21)
+    slide = setup_slide(prs, "TCO(총소유비용) & 환경성 비교")
 
     # TCO 비교 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -1132,9 +999,10 @@ def slide_21_tco_environment(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("비교", "표"))
 def slide_22_optimal_applications(prs):
     """용도별 최적 기술"""
-    slide = setup_slide(prs, "용도별 최적 기술 — BEV vs FCEV 역할 분담", 22)
+    slide = setup_slide(prs, "용도별 최적 기술 — BEV vs FCEV 역할 분담")
 
     # 테이블
     tbl_shape = slide.shapes.add_table(10, 3, Inches(0.6), Inches(1.5),
@@ -1166,9 +1034,10 @@ def slide_22_optimal_applications(prs):
                     text_size=14)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("비교", "시장", "표"))
 def slide_23_market_comparison(prs):
     """시장 전망 비교"""
-    slide = setup_slide(prs, "BEV vs FCEV — 글로벌 판매 전망 비교", 23)
+    slide = setup_slide(prs, "BEV vs FCEV — 글로벌 판매 전망 비교")
 
     # 판매 전망 테이블
     tf_label1 = add_body_textbox(slide, left=Inches(0.6), top=Inches(1.35),
@@ -1227,9 +1096,10 @@ def slide_23_market_comparison(prs):
     add_bullet(tf, "BMW(2028 양산), 혼다(150kW FC)", level=1, size=13)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("비교",))
 def slide_24_scenarios(prs):
     """공존/경쟁 시나리오"""
-    slide = setup_slide(prs, "공존 vs 경쟁 시나리오 — BEV & FCEV의 미래", 24)
+    slide = setup_slide(prs, "공존 vs 경쟁 시나리오 — BEV & FCEV의 미래")
 
     # 시나리오 A
     add_colored_box(slide, Inches(0.6), Inches(1.5), Inches(3.9), Inches(5.0),
@@ -1264,9 +1134,10 @@ def slide_24_scenarios(prs):
                     text_size=13)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("표",))
 def slide_25_five_variables(prs):
     """5대 핵심 변수"""
-    slide = setup_slide(prs, "FCEV 성패를 결정할 5대 핵심 변수", 25)
+    slide = setup_slide(prs, "FCEV 성패를 결정할 5대 핵심 변수")
 
     # 5대 변수 테이블
     tbl1 = slide.shapes.add_table(6, 4, Inches(0.6), Inches(1.5),
@@ -1307,9 +1178,10 @@ def slide_25_five_variables(prs):
     style_data_rows(t2, data2, size=12)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("한국", "정책"))
 def slide_26_korea_strategy(prs):
     """한국 전략 권고"""
-    slide = setup_slide(prs, "한국에 대한 전략적 권고 — 5대 핵심 방향", 26)
+    slide = setup_slide(prs, "한국에 대한 전략적 권고 — 5대 핵심 방향")
 
     strategies = [
         ("1. 승용 FCEV\n보조금 점진적 축소",
@@ -1343,9 +1215,10 @@ def slide_26_korea_strategy(prs):
         set_font(run, size=14, color=DARK_GRAY)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론", tags=("수치",))
 def slide_27_key_numbers(prs):
     """핵심 수치 대시보드"""
-    slide = setup_slide(prs, "핵심 수치 대시보드 — 한눈에 보는 수소차 시장", 27)
+    slide = setup_slide(prs, "핵심 수치 대시보드 — 한눈에 보는 수소차 시장")
 
     items = [
         ("글로벌 FCEV 판매\n2024년", "~16,000대\n(BEV의 0.1%)", NAVY),
@@ -1367,9 +1240,10 @@ def slide_27_key_numbers(prs):
                         color, f"{title}\n\n{value}", text_size=14)
 
 
+@REGISTRY.slide("Part 5 BEV vs FCEV 비교 및 결론")
 def slide_28_conclusion(prs):
     """종합 결론"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
     add_background(slide, NAVY)
 
     # 상단 녹색 라인
@@ -1377,7 +1251,7 @@ def slide_28_conclusion(prs):
         MSO_SHAPE.RECTANGLE, Emu(0), Inches(0.6), SLIDE_WIDTH, Inches(0.06)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
+    set_color(shape.fill.fore_color, GREEN)
     shape.line.fill.background()
 
     # 제목
@@ -1440,50 +1314,18 @@ def slide_28_conclusion(prs):
         MSO_SHAPE.RECTANGLE, Emu(0), Inches(6.8), SLIDE_WIDTH, Inches(0.06)
     )
     shape2.fill.solid()
-    shape2.fill.fore_color.rgb = GREEN
+    set_color(shape2.fill.fore_color, GREEN)
     shape2.line.fill.background()
 
-    add_slide_number(slide, TOTAL_SLIDES)
+    add_slide_number(slide)
 
 
 # ── 메인 ──────────────────────────────────────────────
-def main():
-    prs = Presentation()
-    prs.slide_width = SLIDE_WIDTH
-    prs.slide_height = SLIDE_HEIGHT
-
-    slide_01_cover(prs)
-    slide_02_toc(prs)
-    slide_03_global_market(prs)
-    slide_04_country_status(prs)
-    slide_05_key_models(prs)
-    slide_06_other_models(prs)
-    slide_07_charging_infra(prs)
-    slide_08_market_outlook(prs)
-    slide_09_government_policy(prs)
-    slide_10_commercial_vehicles(prs)
-    slide_11_other_mobility(prs)
-    slide_12_stack_technology(prs)
-    slide_13_cost_storage(prs)
-    slide_14_korea_market(prs)
-    slide_15_korea_infra_crisis(prs)
-    slide_16_korea_policy(prs)
-    slide_17_korea_investment(prs)
-    slide_18_korea_supply_chain(prs)
-    slide_19_korea_global_status(prs)
-    slide_20_bev_vs_fcev_specs(prs)
-    slide_21_tco_environment(prs)
-    slide_22_optimal_applications(prs)
-    slide_23_market_comparison(prs)
-    slide_24_scenarios(prs)
-    slide_25_five_variables(prs)
-    slide_26_korea_strategy(prs)
-    slide_27_key_numbers(prs)
-    slide_28_conclusion(prs)
-
-    prs.save(OUTPUT_PATH)
-    print(f"PPT 생성 완료: {OUTPUT_PATH}")
-    print(f"총 {TOTAL_SLIDES}장 슬라이드")
+SLIDES = REGISTRY.slides()
+
+
+def main(argv=None):
+    build.main(SLIDES, OUTPUT_PATH, argv)
 
 
 if __name__ == "__main__":
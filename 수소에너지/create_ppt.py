@@ -5,199 +5,53 @@
 - 슬라이드 16~21: 한국 연료전지 연구현황 (2025~2026)
 """
 
-from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.chart import XL_CHART_TYPE
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from hydrogen_decks import build, fields, registry, render
+from hydrogen_decks.render import (
+    set_font, set_color, add_background, add_body_textbox, add_bullet,
+    create_table, setup_slide,
+)
+from hydrogen_decks.style import (
+    NAVY, WHITE, GREEN, DARK_GRAY, MEDIUM_GRAY, LIGHT_NAVY,
+    SLIDE_WIDTH,
+)
 
 # ── 상수 ──────────────────────────────────────────────
-NAVY = RGBColor(0x1B, 0x3A, 0x5C)
-WHITE = RGBColor(0xFF, 0xFF, 0xFF)
-GREEN = RGBColor(0x2E, 0xCC, 0x71)
-LIGHT_GRAY = RGBColor(0xF0, 0xF0, 0xF0)
-DARK_GRAY = RGBColor(0x33, 0x33, 0x33)
-MEDIUM_GRAY = RGBColor(0x66, 0x66, 0x66)
-LIGHT_NAVY = RGBColor(0x2C, 0x5F, 0x8A)
-TABLE_HEADER_BG = RGBColor(0x1B, 0x3A, 0x5C)
-TABLE_ROW_ALT = RGBColor(0xE8, 0xF0, 0xF8)
-TABLE_ROW_WHITE = RGBColor(0xFF, 0xFF, 0xFF)
-
-FONT_NAME = "맑은 고딕"
-SLIDE_WIDTH = Inches(13.333)
-SLIDE_HEIGHT = Inches(7.5)
+REGISTRY = registry.Registry()
 
 OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "수소에너지_발표자료.pptx")
 
 
 # ── 유틸리티 함수 ─────────────────────────────────────
-def set_font(run, size=18, bold=False, color=DARK_GRAY, name=FONT_NAME):
-    """run에 폰트 스타일 적용"""
-    run.font.size = Pt(size)
-    run.font.bold = bold
-    run.font.color.rgb = color
-    run.font.name = name
-
-
-def add_background(slide, color=WHITE):
-    """슬라이드 배경색 설정"""
-    bg = slide.background
-    fill = bg.fill
-    fill.solid()
-    fill.fore_color.rgb = color
-
-
-def add_navy_header_bar(slide):
-    """상단 남색 바"""
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Emu(0), Emu(0),
-        SLIDE_WIDTH, Inches(1.2)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = NAVY
-    shape.line.fill.background()
-
-
-def add_green_accent_line(slide, top=Inches(1.2)):
-    """녹색 포인트 라인"""
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Emu(0), top,
-        SLIDE_WIDTH, Inches(0.06)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
-    shape.line.fill.background()
-
-
-def add_slide_number(slide, num, total=24):
+def add_slide_number(slide, num=fields.PAGE):
     """슬라이드 번호"""
-    txBox = slide.shapes.add_textbox(
-        Inches(12.0), Inches(7.0), Inches(1.2), Inches(0.4)
-    )
-    tf = txBox.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.RIGHT
-    run = p.add_run()
-    run.text = f"{num} / {total}"
-    set_font(run, size=12, color=MEDIUM_GRAY)
-
-
-def add_footer_line(slide):
-    """하단 남색 가는 선"""
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0.5), Inches(7.1),
-        Inches(12.333), Inches(0.02)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = NAVY
-    shape.line.fill.background()
-
-
-def add_title_text(slide, title_text, left=Inches(0.6), top=Inches(0.2),
-                   width=Inches(12), height=Inches(0.9)):
-    """헤더 바 위에 제목 텍스트"""
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.LEFT
-    run = p.add_run()
-    run.text = title_text
-    set_font(run, size=34, bold=True, color=WHITE)
-    return txBox
-
-
-def add_body_textbox(slide, left=Inches(0.8), top=Inches(1.6),
-                     width=Inches(11.7), height=Inches(5.2)):
-    """본문 텍스트박스 생성"""
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    return tf
-
-
-def add_bullet_point(tf, text, level=0, size=16, bold=False, color=DARK_GRAY,
-                     space_after=Pt(6), first=False):
-    """불릿 포인트 추가"""
-    if first:
-        p = tf.paragraphs[0]
-    else:
-        p = tf.add_paragraph()
-    p.level = level
-    p.space_after = space_after
-    p.alignment = PP_ALIGN.LEFT
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=size, bold=bold, color=color)
-    return p
-
-
-def create_table(slide, rows, cols, left, top, width, height):
-    """테이블 생성 후 shape 반환"""
-    table_shape = slide.shapes.add_table(rows, cols, left, top, width, height)
-    table = table_shape.table
-    return table_shape, table
-
-
-def set_cell(table, row, col, text, size=12, bold=False, color=DARK_GRAY,
-             alignment=PP_ALIGN.LEFT, fill_color=None):
-    """셀 텍스트 및 스타일 설정"""
-    cell = table.cell(row, col)
-    cell.text = ""
-    p = cell.text_frame.paragraphs[0]
-    p.alignment = alignment
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=size, bold=bold, color=color)
-    cell.vertical_anchor = MSO_ANCHOR.MIDDLE
-    # 셀 마진
-    cell.margin_left = Inches(0.08)
-    cell.margin_right = Inches(0.08)
-    cell.margin_top = Inches(0.04)
-    cell.margin_bottom = Inches(0.04)
-    if fill_color:
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = fill_color
+    render.add_slide_number(slide, num, fields.TOTAL)
 
 
 def style_header_row(table, headers, size=16):
     """테이블 헤더 행 스타일"""
-    for i, h in enumerate(headers):
-        set_cell(table, 0, i, h, size=size, bold=True, color=WHITE,
-                 alignment=PP_ALIGN.CENTER, fill_color=TABLE_HEADER_BG)
+    render.style_header_row(table, headers, size=size)
 
 
 def style_data_rows(table, data, start_row=1, size=14):
     """테이블 데이터 행 스타일"""
-    for r_idx, row_data in enumerate(data):
-        row_num = start_row + r_idx
-        bg = TABLE_ROW_ALT if row_num % 2 == 0 else TABLE_ROW_WHITE
-        for c_idx, val in enumerate(row_data):
-            set_cell(table, row_num, c_idx, val, size=size, fill_color=bg)
-
-
-def setup_content_slide(prs, title_text, slide_num):
-    """표준 콘텐츠 슬라이드 설정 (배경 + 헤더바 + 제목 + 번호)"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank
-    add_background(slide, WHITE)
-    add_navy_header_bar(slide)
-    add_green_accent_line(slide)
-    add_title_text(slide, title_text)
-    add_footer_line(slide)
-    add_slide_number(slide, slide_num)
-    return slide
+    render.style_data_rows(table, data, start_row=start_row, size=size)
 
 
 # ── 슬라이드 생성 함수 ───────────────────────────────
 
+@REGISTRY.slide("도입")
 def slide_01_cover(prs):
     """슬라이드 1: 표지"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
     add_background(slide, NAVY)
 
     # 상단 녹색 라인
@@ -207,7 +61,7 @@ def slide_01_cover(prs):
         SLIDE_WIDTH, Inches(0.08)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
+    set_color(shape.fill.fore_color, GREEN)
     shape.line.fill.background()
 
     # 메인 타이틀
@@ -235,7 +89,7 @@ def slide_01_cover(prs):
         SLIDE_WIDTH, Inches(0.08)
     )
     shape2.fill.solid()
-    shape2.fill.fore_color.rgb = GREEN
+    set_color(shape2.fill.fore_color, GREEN)
     shape2.line.fill.background()
 
     # 발표자 정보
@@ -256,37 +110,39 @@ def slide_01_cover(prs):
     set_font(run4, size=18, color=RGBColor(0x99, 0x99, 0x99))
 
 
+@REGISTRY.slide("도입")
 def slide_02_toc(prs):
     """슬라이드 2: 목차"""
-    slide = setup_content_slide(prs, "목차  |  Table of Contents", 2)
+    slide = setup_slide(prs, "목차  |  Table of Contents")
 
+    # (순번, 제목, 해당 슬라이드) — 쪽 번호는 빌드 후 필드 해석
     toc_items = [
-        ("01", "왜 수소인가?"),
-        ("02", "수소의 종류 (색깔별 분류)"),
-        ("03", "수소 가치사슬"),
-        ("04", "생산 기술 (수전해 비교)"),
-        ("05", "저장 · 운송 기술"),
-        ("06", "활용 분야 · 섹터 커플링"),
-        ("07", "수소 vs 배터리"),
-        ("08", "글로벌 수소 시장 전망"),
-        ("09", "미국 수소 전략"),
-        ("10", "유럽 수소 전략"),
-        ("11", "중국 · 중동 수소 전략"),
-        ("12", "한국 수소 정책"),
-        ("13", "한국 기업 투자 현황"),
-        ("14", "연료전지 시장 · 글로벌 위상"),
-        ("15", "연료전지 핵심 기술 동향"),
-        ("16", "연료전지 최신 연구 성과"),
-        ("17", "연료전지 기업 동향"),
-        ("18", "연료전지 정책 · AI 데이터센터"),
-        ("19", "연료전지 종합 평가"),
-        ("20", "수소 경제 핵심 수치"),
-        ("21", "도전과 과제"),
-        ("22", "결론 및 시사점"),
+        ("01", "왜 수소인가?", "slide_03_why_hydrogen"),
+        ("02", "수소의 종류 (색깔별 분류)", "slide_04_hydrogen_types"),
+        ("03", "수소 가치사슬", "slide_05_value_chain"),
+        ("04", "생산 기술 (수전해 비교)", "slide_06_production"),
+        ("05", "저장 · 운송 기술", "slide_07_storage_transport"),
+        ("06", "활용 분야 · 섹터 커플링", "slide_08_applications"),
+        ("07", "수소 vs 배터리", "slide_09_h2_vs_battery"),
+        ("08", "글로벌 수소 시장 전망", "slide_10_global_market"),
+        ("09", "미국 수소 전략", "slide_11_us_strategy"),
+        ("10", "유럽 수소 전략", "slide_12_eu_strategy"),
+        ("11", "중국 · 중동 수소 전략", "slide_13_china_mideast"),
+        ("12", "한국 수소 정책", "slide_14_korea_policy"),
+        ("13", "한국 기업 투자 현황", "slide_15_korea_companies"),
+        ("14", "연료전지 시장 · 글로벌 위상", "slide_16_fc_market"),
+        ("15", "연료전지 핵심 기술 동향", "slide_17_fc_tech"),
+        ("16", "연료전지 최신 연구 성과", "slide_18_fc_research"),
+        ("17", "연료전지 기업 동향", "slide_19_fc_companies"),
+        ("18", "연료전지 정책 · AI 데이터센터", "slide_20_fc_policy_ai"),
+        ("19", "연료전지 종합 평가", "slide_21_fc_assessment"),
+        ("20", "수소 경제 핵심 수치", "slide_22_key_numbers"),
+        ("21", "도전과 과제", "slide_23_challenges"),
+        ("22", "결론 및 시사점", "slide_24_conclusion"),
     ]
 
     # 좌측 11개
-    for i, (num, title) in enumerate(toc_items[:11]):
+    for i, (num, title, target) in enumerate(toc_items[:11]):
         top = Inches(1.6) + Inches(i * 0.47)
         txBox = slide.shapes.add_textbox(Inches(0.8), top, Inches(5.5), Inches(0.45))
         tf = txBox.text_frame
@@ -297,9 +153,12 @@ def slide_02_toc(prs):
         run_title = p.add_run()
         run_title.text = title
         set_font(run_title, size=16, color=DARK_GRAY)
+        run_page = p.add_run()
+        run_page.text = f"   p.{fields.ref(target)}"
+        set_font(run_page, size=13, color=MEDIUM_GRAY)
 
     # 우측 11개
-    for i, (num, title) in enumerate(toc_items[11:]):
+    for i, (num, title, target) in enumerate(toc_items[11:]):
         top = Inches(1.6) + Inches(i * 0.47)
         txBox = slide.shapes.add_textbox(Inches(6.8), top, Inches(5.5), Inches(0.45))
         tf = txBox.text_frame
@@ -310,27 +169,31 @@ def slide_02_toc(prs):
         run_title = p.add_run()
         run_title.text = title
         set_font(run_title, size=16, color=DARK_GRAY)
+        run_page = p.add_run()
+        run_page.text = f"   p.{fields.ref(target)}"
+        set_font(run_page, size=13, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 1 수소 기초")
 def slide_03_why_hydrogen(prs):
     """슬라이드 3: 왜 수소인가?"""
-    slide = setup_content_slide(prs, "왜 수소인가?", 3)
+    slide = setup_slide(prs, "왜 수소인가?")
     tf = add_body_textbox(slide)
 
-    add_bullet_point(tf, "수소(H2)는 우주에서 가장 풍부한 원소이자 궁극의 청정 에너지원", first=True, size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "연소 시 물(H2O)만 생성 — CO2 배출 제로", level=1, size=18)
-    add_bullet_point(tf, "에너지 저장 매체이자 탄소 없는 연료 (이중 역할)", level=1, size=18)
+    add_bullet(tf, "수소(H2)는 우주에서 가장 풍부한 원소이자 궁극의 청정 에너지원", first=True, size=22, bold=True, color=NAVY)
+    add_bullet(tf, "연소 시 물(H2O)만 생성 — CO2 배출 제로", level=1, size=18)
+    add_bullet(tf, "에너지 저장 매체이자 탄소 없는 연료 (이중 역할)", level=1, size=18)
 
-    add_bullet_point(tf, "")
-    add_bullet_point(tf, "재생에너지만으로는 탄소중립 불가능", size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "태양광/풍력은 전력만 담당 — 총 에너지의 50%는 전기화 불가 (중공업, 장거리 수송, 계절저장)", level=1, size=18)
-    add_bullet_point(tf, "배터리 한계: EV 배터리 ~450kg, 대형 트럭용은 ~4,500kg → 적재 불가", level=1, size=18)
-    add_bullet_point(tf, "계절 저장(여름 잉여 → 겨울 수요): 배터리로는 물리적으로 불가능", level=1, size=18)
+    add_bullet(tf, "")
+    add_bullet(tf, "재생에너지만으로는 탄소중립 불가능", size=22, bold=True, color=NAVY)
+    add_bullet(tf, "태양광/풍력은 전력만 담당 — 총 에너지의 50%는 전기화 불가 (중공업, 장거리 수송, 계절저장)", level=1, size=18)
+    add_bullet(tf, "배터리 한계: EV 배터리 ~450kg, 대형 트럭용은 ~4,500kg → 적재 불가", level=1, size=18)
+    add_bullet(tf, "계절 저장(여름 잉여 → 겨울 수요): 배터리로는 물리적으로 불가능", level=1, size=18)
 
-    add_bullet_point(tf, "")
-    add_bullet_point(tf, "수소 + 전기 = '파워 커플'", size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "전기: 가정, 경차량  |  수소: 중공업, 장거리 수송, 계절 저장, 화학 공정", level=1, size=18)
-    add_bullet_point(tf, "섹터 커플링: 전기·수송·산업·난방을 하나로 연결하는 '만능 에너지 캐리어'", level=1, size=18)
+    add_bullet(tf, "")
+    add_bullet(tf, "수소 + 전기 = '파워 커플'", size=22, bold=True, color=NAVY)
+    add_bullet(tf, "전기: 가정, 경차량  |  수소: 중공업, 장거리 수송, 계절 저장, 화학 공정", level=1, size=18)
+    add_bullet(tf, "섹터 커플링: 전기·수송·산업·난방을 하나로 연결하는 '만능 에너지 캐리어'", level=1, size=18)
 
     # 인용문 박스
     quote_box = slide.shapes.add_shape(
@@ -338,7 +201,7 @@ def slide_03_why_hydrogen(prs):
         Inches(1.5), Inches(6.0), Inches(10.3), Inches(0.8)
     )
     quote_box.fill.solid()
-    quote_box.fill.fore_color.rgb = RGBColor(0xE8, 0xF6, 0xEE)
+    set_color(quote_box.fill.fore_color, RGBColor(0xE8, 0xF6, 0xEE))
     quote_box.line.fill.background()
     qtf = quote_box.text_frame
     qtf.word_wrap = True
@@ -349,9 +212,10 @@ def slide_03_why_hydrogen(prs):
     set_font(qrun, size=16, color=NAVY, bold=True)
 
 
+@REGISTRY.slide("Part 1 수소 기초", tags=("표",))
 def slide_04_hydrogen_types(prs):
     """슬라이드 4: 수소의 종류"""
-    slide = setup_content_slide(prs, "수소의 종류  |  색깔별 분류", 4)
+    slide = setup_slide(prs, "수소의 종류  |  색깔별 분류")
 
     headers = ["구분", "생산 방식", "CO2 배출", "현황/전망"]
     data = [
@@ -377,13 +241,14 @@ def slide_04_hydrogen_types(prs):
 
     # 전환 로드맵
     tf = add_body_textbox(slide, top=Inches(5.4), height=Inches(1.5))
-    add_bullet_point(tf, "전환 로드맵 (3권 공통 합의)", first=True, size=20, bold=True, color=NAVY)
-    add_bullet_point(tf, "현재: 그레이 지배(75%)  →  2020~30s: 블루 (다리 역할)  →  2040~50: 그린 전면 확산", level=1, size=17)
+    add_bullet(tf, "전환 로드맵 (3권 공통 합의)", first=True, size=20, bold=True, color=NAVY)
+    add_bullet(tf, "현재: 그레이 지배(75%)  →  2020~30s: 블루 (다리 역할)  →  2040~50: 그린 전면 확산", level=1, size=17)
 
 
+@REGISTRY.slide("Part 1 수소 기초")
 def slide_05_value_chain(prs):
     """슬라이드 5: 수소 가치사슬"""
-    slide = setup_content_slide(prs, "수소 가치사슬  |  Value Chain", 5)
+    slide = setup_slide(prs, "수소 가치사슬  |  Value Chain")
 
     # 4단계 박스
     stages = [
@@ -403,7 +268,7 @@ def slide_05_value_chain(prs):
             left, Inches(1.6), Inches(3.0), Inches(4.14)
         )
         box.fill.solid()
-        box.fill.fore_color.rgb = colors[i]
+        set_color(box.fill.fore_color, colors[i])
         box.line.fill.background()
 
         # 제목
@@ -440,13 +305,14 @@ def slide_05_value_chain(prs):
 
     # 하단 설명
     tf = add_body_textbox(slide, top=Inches(6.22), height=Inches(0.6))
-    add_bullet_point(tf, "2050 글로벌 수소 운송: 파이프라인 55% + 암모니아 해상운송 40%", first=True, size=15, color=MEDIUM_GRAY)
-    add_bullet_point(tf, "수소 저장·운송 시장: $21.7B (2030) → $566B (2050)", size=15, color=MEDIUM_GRAY)
+    add_bullet(tf, "2050 글로벌 수소 운송: 파이프라인 55% + 암모니아 해상운송 40%", first=True, size=15, color=MEDIUM_GRAY)
+    add_bullet(tf, "수소 저장·운송 시장: $21.7B (2030) → $566B (2050)", size=15, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 1 수소 기초", tags=("기술", "표"))
 def slide_06_production(prs):
     """슬라이드 6: 생산 기술"""
-    slide = setup_content_slide(prs, "수전해 생산 기술 비교", 6)
+    slide = setup_slide(prs, "수전해 생산 기술 비교")
 
     headers = ["구분", "AWE (알칼라인)", "PEM (고분자전해질)", "SOEC (고체산화물)"]
     data = [
@@ -470,13 +336,14 @@ def slide_06_production(prs):
     style_data_rows(table, data)
 
     tf = add_body_textbox(slide, top=Inches(6.1), height=Inches(0.8))
-    add_bullet_point(tf, "2024년 글로벌 수전해 설비용량: 2 GW  |  시스템 비용 목표: $250~500/kW", first=True, size=16, color=MEDIUM_GRAY)
-    add_bullet_point(tf, "KAIST: 백금 무함유 PEM 수전해 기술, 단원자 귀금속 AEM 촉매 개발", size=16, color=MEDIUM_GRAY)
+    add_bullet(tf, "2024년 글로벌 수전해 설비용량: 2 GW  |  시스템 비용 목표: $250~500/kW", first=True, size=16, color=MEDIUM_GRAY)
+    add_bullet(tf, "KAIST: 백금 무함유 PEM 수전해 기술, 단원자 귀금속 AEM 촉매 개발", size=16, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 1 수소 기초", tags=("기술", "표"))
 def slide_07_storage_transport(prs):
     """슬라이드 7: 저장·운송 기술"""
-    slide = setup_content_slide(prs, "저장 · 운송 기술 비교", 7)
+    slide = setup_slide(prs, "저장 · 운송 기술 비교")
 
     headers = ["방식", "원리", "장점", "단점"]
     data = [
@@ -500,12 +367,13 @@ def slide_07_storage_transport(prs):
     style_data_rows(table, data)
 
     tf = add_body_textbox(slide, top=Inches(6.3), height=Inches(0.6))
-    add_bullet_point(tf, "Snam(이탈리아): 기존 천연가스 배관의 70%가 수소 호환  |  배관 1km = 수소 12톤 저장 = 4만 가구 1일 전력", first=True, size=16, color=MEDIUM_GRAY)
+    add_bullet(tf, "Snam(이탈리아): 기존 천연가스 배관의 70%가 수소 호환  |  배관 1km = 수소 12톤 저장 = 4만 가구 1일 전력", first=True, size=16, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 1 수소 기초")
 def slide_08_applications(prs):
     """슬라이드 8: 활용 분야"""
-    slide = setup_content_slide(prs, "활용 분야  |  섹터 커플링", 8)
+    slide = setup_slide(prs, "활용 분야  |  섹터 커플링")
 
     sectors = [
         ("수송", [
@@ -545,7 +413,7 @@ def slide_08_applications(prs):
             left, Inches(1.7), Inches(2.9), Inches(0.7)
         )
         title_box.fill.solid()
-        title_box.fill.fore_color.rgb = colors[i]
+        set_color(title_box.fill.fore_color, colors[i])
         title_box.line.fill.background()
         ttf = title_box.text_frame
         tp = ttf.paragraphs[0]
@@ -567,15 +435,16 @@ def slide_08_applications(prs):
 
     # 하단 포인트
     tf = add_body_textbox(slide, top=Inches(6.0), height=Inches(0.8))
-    add_bullet_point(tf, "핵심 개념: 섹터 커플링 — 수소가 전기·수송·산업·난방을 하나로 연결하는 '만능 에너지 캐리어'",
-                     first=True, size=17, bold=True, color=NAVY)
-    add_bullet_point(tf, "장거리 트럭(2040): 최대 단일 수소 수요 분야 (~80 Mtpa)  |  항공(2050): ~50 Mtpa (e-fuel 기반)",
-                     size=16, color=MEDIUM_GRAY)
+    add_bullet(tf, "핵심 개념: 섹터 커플링 — 수소가 전기·수송·산업·난방을 하나로 연결하는 '만능 에너지 캐리어'",
+               first=True, size=17, bold=True, color=NAVY)
+    add_bullet(tf, "장거리 트럭(2040): 최대 단일 수소 수요 분야 (~80 Mtpa)  |  항공(2050): ~50 Mtpa (e-fuel 기반)",
+               size=16, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 1 수소 기초", tags=("비교", "표"))
 def slide_09_h2_vs_battery(prs):
     """슬라이드 9: 수소 vs 배터리"""
-    slide = setup_content_slide(prs, "수소 vs 배터리  |  영역별 적합성", 9)
+    slide = setup_slide(prs, "수소 vs 배터리  |  영역별 적합성")
 
     headers = ["분야", "수소 유리", "배터리/전기 유리", "비고"]
     data = [
@@ -602,13 +471,14 @@ def slide_09_h2_vs_battery(prs):
     style_data_rows(table, data)
 
     tf = add_body_textbox(slide, top=Inches(6.6), height=Inches(0.4))
-    add_bullet_point(tf, "수소와 전기는 경쟁이 아닌 보완 — 전기화 불가 영역에서 수소가 핵심 역할",
-                     first=True, size=18, bold=True, color=NAVY)
+    add_bullet(tf, "수소와 전기는 경쟁이 아닌 보완 — 전기화 불가 영역에서 수소가 핵심 역할",
+               first=True, size=18, bold=True, color=NAVY)
 
 
+@REGISTRY.slide("Part 2 글로벌 수소 전략", tags=("시장", "표"))
 def slide_10_global_market(prs):
     """슬라이드 10: 글로벌 수소 시장"""
-    slide = setup_content_slide(prs, "글로벌 수소 시장  |  규모와 전망", 10)
+    slide = setup_slide(prs, "글로벌 수소 시장  |  규모와 전망")
 
     # 시장 규모 테이블
     headers = ["지표", "수치"]
@@ -663,29 +533,30 @@ def slide_10_global_market(prs):
 
     # 하단 비용 목표
     tf = add_body_textbox(slide, top=Inches(5.7), height=Inches(1.2))
-    add_bullet_point(tf, "주요 비용 목표", first=True, size=18, bold=True, color=NAVY)
-    add_bullet_point(tf, "US DOE: $1/kg (2031)  |  EU: $1.5~3/kg (2030)  |  한국: 3,500원/kg (2030) → 2,500원/kg (2050)", level=1, size=16)
-    add_bullet_point(tf, "Green Hydrogen Catapult (7개 글로벌 기업): $2/kg (2026), 25GW 수전해기, 500만톤/년, $1,100억 투자", level=1, size=16)
+    add_bullet(tf, "주요 비용 목표", first=True, size=18, bold=True, color=NAVY)
+    add_bullet(tf, "US DOE: $1/kg (2031)  |  EU: $1.5~3/kg (2030)  |  한국: 3,500원/kg (2030) → 2,500원/kg (2050)", level=1, size=16)
+    add_bullet(tf, "Green Hydrogen Catapult (7개 글로벌 기업): $2/kg (2026), 25GW 수전해기, 500만톤/년, $1,100억 투자", level=1, size=16)
 
 
+@REGISTRY.slide("Part 2 글로벌 수소 전략", tags=("미국", "정책", "표"))
 def slide_11_us_strategy(prs):
     """슬라이드 11: 미국 수소 전략"""
-    slide = setup_content_slide(prs, "미국 수소 전략  |  IRA와 수소허브", 11)
+    slide = setup_slide(prs, "미국 수소 전략  |  IRA와 수소허브")
     tf = add_body_textbox(slide)
 
-    add_bullet_point(tf, "IRA (인플레이션 감축법) — Section 45V", first=True, size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "청정수소 생산세액공제: CO2 배출량 기준 4단계, 최대 $3/kg", level=1, size=18)
-    add_bullet_point(tf, "10년간 총 ~$130억 규모 지원", level=1, size=18)
-    add_bullet_point(tf, "석유·가스 초강대국에서 수소 초강대국으로의 확장 전략", level=1, size=18)
+    add_bullet(tf, "IRA (인플레이션 감축법) — Section 45V", first=True, size=22, bold=True, color=NAVY)
+    add_bullet(tf, "청정수소 생산세액공제: CO2 배출량 기준 4단계, 최대 $3/kg", level=1, size=18)
+    add_bullet(tf, "10년간 총 ~$130억 규모 지원", level=1, size=18)
+    add_bullet(tf, "석유·가스 초강대국에서 수소 초강대국으로의 확장 전략", level=1, size=18)
 
-    add_bullet_point(tf, "")
-    add_bullet_point(tf, "DOE Hydrogen Shot", size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "목표: $1/kg by 2031 (1-1-1 비전)", level=1, size=18)
+    add_bullet(tf, "")
+    add_bullet(tf, "DOE Hydrogen Shot", size=22, bold=True, color=NAVY)
+    add_bullet(tf, "목표: $1/kg by 2031 (1-1-1 비전)", level=1, size=18)
 
-    add_bullet_point(tf, "")
-    add_bullet_point(tf, "수소허브 프로그램 (H2Hubs)", size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "지역별 생산-저장-활용 통합 생태계 구축", level=1, size=18)
-    add_bullet_point(tf, "생산지-소비지-인프라를 클러스터로 연결", level=1, size=18)
+    add_bullet(tf, "")
+    add_bullet(tf, "수소허브 프로그램 (H2Hubs)", size=22, bold=True, color=NAVY)
+    add_bullet(tf, "지역별 생산-저장-활용 통합 생태계 구축", level=1, size=18)
+    add_bullet(tf, "생산지-소비지-인프라를 클러스터로 연결", level=1, size=18)
 
     # IRA 세액공제 테이블
     headers = ["CO2 배출 (kg CO2/kg H2)", "세액공제 ($/kg)"]
@@ -705,65 +576,68 @@ def slide_11_us_strategy(prs):
     style_data_rows(table, data, size=14)
 
 
+@REGISTRY.slide("Part 2 글로벌 수소 전략", tags=("유럽", "정책"))
 def slide_12_eu_strategy(prs):
     """슬라이드 12: 유럽 수소 전략"""
-    slide = setup_content_slide(prs, "유럽 수소 전략  |  REPowerEU", 12)
+    slide = setup_slide(prs, "유럽 수소 전략  |  REPowerEU")
     tf = add_body_textbox(slide)
 
-    add_bullet_point(tf, "REPowerEU 목표 (2030)", first=True, size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "그린수소 1,000만 톤 자체 생산 + 1,000만 톤 수입", level=1, size=18)
-    add_bullet_point(tf, "수소 프로젝트 총 투자: $1,340억", level=1, size=18)
-    add_bullet_point(tf, "러시아 가스 의존 탈피 + 산업 경쟁력 확보 (이중 동기)", level=1, size=18)
+    add_bullet(tf, "REPowerEU 목표 (2030)", first=True, size=22, bold=True, color=NAVY)
+    add_bullet(tf, "그린수소 1,000만 톤 자체 생산 + 1,000만 톤 수입", level=1, size=18)
+    add_bullet(tf, "수소 프로젝트 총 투자: $1,340억", level=1, size=18)
+    add_bullet(tf, "러시아 가스 의존 탈피 + 산업 경쟁력 확보 (이중 동기)", level=1, size=18)
 
-    add_bullet_point(tf, "")
-    add_bullet_point(tf, "European Hydrogen Backbone (유럽 수소 배관망)", size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "2030: 31,500km  →  2040: 57,600km", level=1, size=18)
-    add_bullet_point(tf, "IPCEI Hy2Infra: 최대 69억 유로 공적 자금", level=1, size=18)
-    add_bullet_point(tf, "독일 단독: 200억 유로 핵심 수소 네트워크 투자", level=1, size=18)
+    add_bullet(tf, "")
+    add_bullet(tf, "European Hydrogen Backbone (유럽 수소 배관망)", size=22, bold=True, color=NAVY)
+    add_bullet(tf, "2030: 31,500km  →  2040: 57,600km", level=1, size=18)
+    add_bullet(tf, "IPCEI Hy2Infra: 최대 69억 유로 공적 자금", level=1, size=18)
+    add_bullet(tf, "독일 단독: 200억 유로 핵심 수소 네트워크 투자", level=1, size=18)
 
-    add_bullet_point(tf, "")
-    add_bullet_point(tf, "SoutH2 Corridor", size=22, bold=True, color=NAVY)
-    add_bullet_point(tf, "북아프리카 → 이탈리아 → 오스트리아 → 독일, 3,300km 파이프라인", level=1, size=18)
-    add_bullet_point(tf, "유럽 에너지 안보의 핵심 인프라로 부상", level=1, size=18)
+    add_bullet(tf, "")
+    add_bullet(tf, "SoutH2 Corridor", size=22, bold=True, color=NAVY)
+    add_bullet(tf, "북아프리카 → 이탈리아 → 오스트리아 → 독일, 3,300km 파이프라인", level=1, size=18)
+    add_bullet(tf, "유럽 에너지 안보의 핵심 인프라로 부상", level=1, size=18)
 
 
+@REGISTRY.slide("Part 2 글로벌 수소 전략", tags=("중국", "정책"))
 def slide_13_china_mideast(prs):
     """슬라이드 13: 중국·중동 수소 전략"""
-    slide = setup_content_slide(prs, "중국 · 중동 수소 전략", 13)
+    slide = setup_slide(prs, "중국 · 중동 수소 전략")
 
     # 중국 섹션
     tf = add_body_textbox(slide, width=Inches(5.5), height=Inches(5.0))
-    add_bullet_point(tf, "중국 — 세계 최대 수소 생산국", first=True, size=21, bold=True, color=NAVY)
-    add_bullet_point(tf, "생산: 3,500만 톤 (2023), 용량 4,900만 톤", level=1, size=17)
-    add_bullet_point(tf, "수소 산업 규모 1조 위안 돌파", level=1, size=17)
-    add_bullet_point(tf, "수전해기: 글로벌 설치용량 65%\n    확정 주문 75% 점유", level=1, size=17)
-    add_bullet_point(tf, "신장 쿠차 프로젝트: 세계 최초\n    대규모 상업 그린수소 (1,000m³/hr)", level=1, size=17)
-    add_bullet_point(tf, "그린수소 프로젝트: 600+건 진행 중", level=1, size=17)
-    add_bullet_point(tf, "FCEV 목표: 2025년 5만 대", level=1, size=17)
+    add_bullet(tf, "중국 — 세계 최대 수소 생산국", first=True, size=21, bold=True, color=NAVY)
+    add_bullet(tf, "생산: 3,500만 톤 (2023), 용량 4,900만 톤", level=1, size=17)
+    add_bullet(tf, "수소 산업 규모 1조 위안 돌파", level=1, size=17)
+    add_bullet(tf, "수전해기: 글로벌 설치용량 65%\n    확정 주문 75% 점유", level=1, size=17)
+    add_bullet(tf, "신장 쿠차 프로젝트: 세계 최초\n    대규모 상업 그린수소 (1,000m³/hr)", level=1, size=17)
+    add_bullet(tf, "그린수소 프로젝트: 600+건 진행 중", level=1, size=17)
+    add_bullet(tf, "FCEV 목표: 2025년 5만 대", level=1, size=17)
 
     # 중동 섹션
     tf2 = add_body_textbox(slide, left=Inches(6.8), width=Inches(5.5), height=Inches(5.0))
-    add_bullet_point(tf2, "중동 — 석유 수출국의 대전환", first=True, size=21, bold=True, color=NAVY)
+    add_bullet(tf2, "중동 — 석유 수출국의 대전환", first=True, size=21, bold=True, color=NAVY)
 
-    add_bullet_point(tf2, "")
-    add_bullet_point(tf2, "사우디아라비아", size=18, bold=True, color=LIGHT_NAVY)
-    add_bullet_point(tf2, "세계 최대 석유 수출국 → 수소 수출국 전환", level=1, size=17)
-    add_bullet_point(tf2, "NEOM Helios: $50억, 세계 최대 그린수소", level=1, size=17)
+    add_bullet(tf2, "")
+    add_bullet(tf2, "사우디아라비아", size=18, bold=True, color=LIGHT_NAVY)
+    add_bullet(tf2, "세계 최대 석유 수출국 → 수소 수출국 전환", level=1, size=17)
+    add_bullet(tf2, "NEOM Helios: $50억, 세계 최대 그린수소", level=1, size=17)
 
-    add_bullet_point(tf2, "")
-    add_bullet_point(tf2, "UAE", size=18, bold=True, color=LIGHT_NAVY)
-    add_bullet_point(tf2, "블루수소 + 암모니아 수출 확대", level=1, size=17)
-    add_bullet_point(tf2, "아부다비: 연 20만톤 암모니아 → 한국 수출", level=1, size=17)
+    add_bullet(tf2, "")
+    add_bullet(tf2, "UAE", size=18, bold=True, color=LIGHT_NAVY)
+    add_bullet(tf2, "블루수소 + 암모니아 수출 확대", level=1, size=17)
+    add_bullet(tf2, "아부다비: 연 20만톤 암모니아 → 한국 수출", level=1, size=17)
 
-    add_bullet_point(tf2, "")
-    add_bullet_point(tf2, "오만", size=18, bold=True, color=LIGHT_NAVY)
-    add_bullet_point(tf2, "그린수소 허브 추진", level=1, size=17)
-    add_bullet_point(tf2, "POSCO 컨소시엄: 47년 독점 개발권 확보", level=1, size=17)
+    add_bullet(tf2, "")
+    add_bullet(tf2, "오만", size=18, bold=True, color=LIGHT_NAVY)
+    add_bullet(tf2, "그린수소 허브 추진", level=1, size=17)
+    add_bullet(tf2, "POSCO 컨소시엄: 47년 독점 개발권 확보", level=1, size=17)
 
 
+@REGISTRY.slide("Part 3 한국 수소 정책·투자", tags=("한국", "정책", "표"))
 def slide_14_korea_policy(prs):
     """슬라이드 14: 한국 수소 정책"""
-    slide = setup_content_slide(prs, "한국 수소 정책  |  로드맵과 목표", 14)
+    slide = setup_slide(prs, "한국 수소 정책  |  로드맵과 목표")
 
     headers = ["정책/지표", "내용"]
     data = [
@@ -791,9 +665,10 @@ def slide_14_korea_policy(prs):
     style_data_rows(table, data, size=14)
 
 
+@REGISTRY.slide("Part 3 한국 수소 정책·투자", tags=("한국", "기업", "표"))
 def slide_15_korea_companies(prs):
     """슬라이드 15: 한국 기업 투자 현황"""
-    slide = setup_content_slide(prs, "한국 기업 수소 투자 현황", 15)
+    slide = setup_slide(prs, "한국 기업 수소 투자 현황")
 
     headers = ["기업/그룹", "2030 투자규모", "주요 수소 사업"]
     data = [
@@ -817,13 +692,14 @@ def slide_15_korea_companies(prs):
     style_data_rows(table, data, size=14)
 
     tf = add_body_textbox(slide, top=Inches(6.5), height=Inches(0.5))
-    add_bullet_point(tf, "5대 그룹 합계: 2030년까지 $380억 (약 43조원) 투자 계획",
-                     first=True, size=18, bold=True, color=NAVY)
+    add_bullet(tf, "5대 그룹 합계: 2030년까지 $380억 (약 43조원) 투자 계획",
+               first=True, size=18, bold=True, color=NAVY)
 
 
+@REGISTRY.slide("Part 4 연료전지", tags=("한국", "시장", "표"))
 def slide_16_fc_market(prs):
     """슬라이드 16: 한국 연료전지 시장 규모 및 글로벌 위상"""
-    slide = setup_content_slide(prs, "한국 연료전지 시장  |  글로벌 위상", 16)
+    slide = setup_slide(prs, "한국 연료전지 시장  |  글로벌 위상")
 
     headers = ["지표", "수치"]
     data = [
@@ -847,15 +723,16 @@ def slide_16_fc_market(prs):
     style_data_rows(table, data)
 
     tf = add_body_textbox(slide, top=Inches(6.1), height=Inches(0.8))
-    add_bullet_point(tf, "한국은 발전용 연료전지 설치 규모와 수소전기차 시장에서 모두 글로벌 1위",
-                     first=True, size=17, bold=True, color=NAVY)
-    add_bullet_point(tf, "핵심 부품·소재의 수입의존도가 높아 독자 기술 확보가 시급한 상황",
-                     size=16, color=MEDIUM_GRAY)
+    add_bullet(tf, "한국은 발전용 연료전지 설치 규모와 수소전기차 시장에서 모두 글로벌 1위",
+               first=True, size=17, bold=True, color=NAVY)
+    add_bullet(tf, "핵심 부품·소재의 수입의존도가 높아 독자 기술 확보가 시급한 상황",
+               size=16, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 4 연료전지", tags=("기술", "표"))
 def slide_17_fc_tech(prs):
     """슬라이드 17: 연료전지 핵심 기술별 연구 동향"""
-    slide = setup_content_slide(prs, "연료전지 핵심 기술  |  PEMFC · SOFC · PAFC", 17)
+    slide = setup_slide(prs, "연료전지 핵심 기술  |  PEMFC · SOFC · PAFC")
 
     headers = ["구분", "PEMFC (고분자전해질)", "SOFC (고체산화물)", "PAFC (인산형)"]
     data = [
@@ -879,13 +756,14 @@ def slide_17_fc_tech(prs):
     style_data_rows(table, data)
 
     tf = add_body_textbox(slide, top=Inches(6.3), height=Inches(0.6))
-    add_bullet_point(tf, "SOEC(고체산화물 전해조): 그린수소 생산용 약 5MW 설비 확충 중  |  61.7% 발전효율 8kW SOFC KGS 인증",
-                     first=True, size=16, color=MEDIUM_GRAY)
+    add_bullet(tf, "SOEC(고체산화물 전해조): 그린수소 생산용 약 5MW 설비 확충 중  |  61.7% 발전효율 8kW SOFC KGS 인증",
+               first=True, size=16, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 4 연료전지", tags=("기술", "표"))
 def slide_18_fc_research(prs):
     """슬라이드 18: 연료전지 최신 연구 성과"""
-    slide = setup_content_slide(prs, "연료전지 최신 연구 성과  |  주요 논문", 18)
+    slide = setup_slide(prs, "연료전지 최신 연구 성과  |  주요 논문")
 
     # KAIST 테이블 제목
     kaist_title = slide.shapes.add_textbox(Inches(0.6), Inches(1.5), Inches(5.0), Inches(0.4))
@@ -915,18 +793,19 @@ def slide_18_fc_research(prs):
 
     # 기타 연구기관
     tf = add_body_textbox(slide, top=Inches(4.8), height=Inches(2.0))
-    add_bullet_point(tf, "기타 연구기관 성과", first=True, size=20, bold=True, color=NAVY)
-    add_bullet_point(tf, "서울과학기술대: 수소 연료전지 트럭 국민 수용성 조사 (1,000가구) — Transport Policy (2025.12)",
-                     level=1, size=16)
-    add_bullet_point(tf, "원광대: SOFC용 금속 기판 소재 연구 / 암모니아 연료 SOFC 페로브스카이트 촉매 연구",
-                     level=1, size=16)
-    add_bullet_point(tf, "공통: 한국연구재단 지원 기반, Nature·ACS Nano 등 탑 저널 게재 성과 다수",
-                     level=1, size=16)
+    add_bullet(tf, "기타 연구기관 성과", first=True, size=20, bold=True, color=NAVY)
+    add_bullet(tf, "서울과학기술대: 수소 연료전지 트럭 국민 수용성 조사 (1,000가구) — Transport Policy (2025.12)",
+               level=1, size=16)
+    add_bullet(tf, "원광대: SOFC용 금속 기판 소재 연구 / 암모니아 연료 SOFC 페로브스카이트 촉매 연구",
+               level=1, size=16)
+    add_bullet(tf, "공통: 한국연구재단 지원 기반, Nature·ACS Nano 등 탑 저널 게재 성과 다수",
+               level=1, size=16)
 
 
+@REGISTRY.slide("Part 4 연료전지", tags=("기업", "표"))
 def slide_19_fc_companies(prs):
     """슬라이드 19: 연료전지 주요 기업 동향"""
-    slide = setup_content_slide(prs, "연료전지 주요 기업 동향  |  2025~2026", 19)
+    slide = setup_slide(prs, "연료전지 주요 기업 동향  |  2025~2026")
 
     headers = ["기업", "핵심 사업", "최신 동향 (2025~2026)"]
     data = [
@@ -952,13 +831,14 @@ def slide_19_fc_companies(prs):
     style_data_rows(table, data)
 
     tf = add_body_textbox(slide, top=Inches(6.3), height=Inches(0.6))
-    add_bullet_point(tf, "AI 데이터센터 전력 수요 급증 → 연료전지 분산전원 핵심 성장 동력으로 부상",
-                     first=True, size=17, bold=True, color=NAVY)
+    add_bullet(tf, "AI 데이터센터 전력 수요 급증 → 연료전지 분산전원 핵심 성장 동력으로 부상",
+               first=True, size=17, bold=True, color=NAVY)
 
 
+@REGISTRY.slide("Part 4 연료전지", tags=("정책", "표"))
 def slide_20_fc_policy_ai(prs):
     """슬라이드 20: 연료전지 정책 환경 및 AI 데이터센터"""
-    slide = setup_content_slide(prs, "연료전지 정책 · AI 데이터센터 성장 동력", 20)
+    slide = setup_slide(prs, "연료전지 정책 · AI 데이터센터 성장 동력")
 
     # 좌측: 정책 환경
     policy_title = slide.shapes.add_textbox(Inches(0.6), Inches(1.5), Inches(5.5), Inches(0.4))
@@ -986,10 +866,10 @@ def slide_20_fc_policy_ai(prs):
     # CHPS 현황
     tf_left = add_body_textbox(slide, left=Inches(0.6), top=Inches(4.2),
                                width=Inches(5.5), height=Inches(2.5))
-    add_bullet_point(tf_left, "청정수소발전의무화제도(CHPS)", first=True, size=18, bold=True, color=NAVY)
-    add_bullet_point(tf_left, "2024년 세계 최초 시행", level=1, size=15)
-    add_bullet_point(tf_left, "계획 물량 대비 11.8% 낙찰 (흥행 실패)", level=1, size=15)
-    add_bullet_point(tf_left, "2025년 입찰 공고 후 취소 (정책 불확실성)", level=1, size=15)
+    add_bullet(tf_left, "청정수소발전의무화제도(CHPS)", first=True, size=18, bold=True, color=NAVY)
+    add_bullet(tf_left, "2024년 세계 최초 시행", level=1, size=15)
+    add_bullet(tf_left, "계획 물량 대비 11.8% 낙찰 (흥행 실패)", level=1, size=15)
+    add_bullet(tf_left, "2025년 입찰 공고 후 취소 (정책 불확실성)", level=1, size=15)
 
     # 우측: AI 데이터센터
     ai_title = slide.shapes.add_textbox(Inches(6.8), Inches(1.5), Inches(5.5), Inches(0.4))
@@ -1016,15 +896,16 @@ def slide_20_fc_policy_ai(prs):
 
     tf_right = add_body_textbox(slide, left=Inches(6.8), top=Inches(4.2),
                                 width=Inches(5.5), height=Inches(2.5))
-    add_bullet_point(tf_right, "온사이트 분산전원의 부상", first=True, size=18, bold=True, color=NAVY)
-    add_bullet_point(tf_right, "송전망 포화 → 현장 발전 필수", level=1, size=15)
-    add_bullet_point(tf_right, "KDCC + 산업계 그린 연료전지 사업 착수", level=1, size=15)
-    add_bullet_point(tf_right, "자가발전·직접전력거래(PPA) 기반", level=1, size=15)
+    add_bullet(tf_right, "온사이트 분산전원의 부상", first=True, size=18, bold=True, color=NAVY)
+    add_bullet(tf_right, "송전망 포화 → 현장 발전 필수", level=1, size=15)
+    add_bullet(tf_right, "KDCC + 산업계 그린 연료전지 사업 착수", level=1, size=15)
+    add_bullet(tf_right, "자가발전·직접전력거래(PPA) 기반", level=1, size=15)
 
 
+@REGISTRY.slide("Part 4 연료전지")
 def slide_21_fc_assessment(prs):
     """슬라이드 21: 연료전지 종합 평가 및 과제"""
-    slide = setup_content_slide(prs, "연료전지 연구  |  종합 평가 및 과제", 21)
+    slide = setup_slide(prs, "연료전지 연구  |  종합 평가 및 과제")
 
     strengths = [
         "발전용 연료전지 설치 규모 세계 1위",
@@ -1047,7 +928,7 @@ def slide_21_fc_assessment(prs):
         Inches(0.4), Inches(1.6), Inches(5.8), Inches(0.55)
     )
     s_title.fill.solid()
-    s_title.fill.fore_color.rgb = NAVY
+    set_color(s_title.fill.fore_color, NAVY)
     s_title.line.fill.background()
     stf = s_title.text_frame
     sp = stf.paragraphs[0]
@@ -1072,7 +953,7 @@ def slide_21_fc_assessment(prs):
         Inches(6.8), Inches(1.6), Inches(5.8), Inches(0.55)
     )
     c_title.fill.solid()
-    c_title.fill.fore_color.rgb = RGBColor(0xCC, 0x33, 0x33)
+    set_color(c_title.fill.fore_color, RGBColor(0xCC, 0x33, 0x33))
     c_title.line.fill.background()
     ctf_t = c_title.text_frame
     cp_t = ctf_t.paragraphs[0]
@@ -1097,7 +978,7 @@ def slide_21_fc_assessment(prs):
         Inches(0.8), Inches(5.6), Inches(11.7), Inches(1.2)
     )
     outlook_box.fill.solid()
-    outlook_box.fill.fore_color.rgb = RGBColor(0xE8, 0xF6, 0xEE)
+    set_color(outlook_box.fill.fore_color, RGBColor(0xE8, 0xF6, 0xEE))
     outlook_box.line.fill.background()
     otf = outlook_box.text_frame
     otf.word_wrap = True
@@ -1115,9 +996,10 @@ def slide_21_fc_assessment(prs):
     set_font(orun2, size=16, color=DARK_GRAY)
 
 
+@REGISTRY.slide("Part 5 결론", tags=("수치", "표"))
 def slide_22_key_numbers(prs):
     """슬라이드 22: 수소 경제 핵심 수치"""
-    slide = setup_content_slide(prs, "수소 경제 핵심 수치  |  Summary Stats", 22)
+    slide = setup_slide(prs, "수소 경제 핵심 수치  |  Summary Stats")
 
     headers = ["분류", "지표", "수치"]
     data = [
@@ -1147,9 +1029,10 @@ def slide_22_key_numbers(prs):
     style_data_rows(table, data, size=14)
 
 
+@REGISTRY.slide("Part 5 결론")
 def slide_23_challenges(prs):
     """슬라이드 23: 도전과 과제"""
-    slide = setup_content_slide(prs, "도전과 과제", 23)
+    slide = setup_slide(prs, "도전과 과제")
 
     # 4개 영역을 2x2 박스로
     challenges = [
@@ -1191,7 +1074,7 @@ def slide_23_challenges(prs):
             left, top, Inches(6.0), Inches(0.55)
         )
         title_shape.fill.solid()
-        title_shape.fill.fore_color.rgb = color
+        set_color(title_shape.fill.fore_color, color)
         title_shape.line.fill.background()
         ttf = title_shape.text_frame
         tp = ttf.paragraphs[0]
@@ -1217,7 +1100,7 @@ def slide_23_challenges(prs):
         Inches(1.5), Inches(6.8), Inches(10.3), Inches(0.5)
     )
     quote_box.fill.solid()
-    quote_box.fill.fore_color.rgb = RGBColor(0xE8, 0xF6, 0xEE)
+    set_color(quote_box.fill.fore_color, RGBColor(0xE8, 0xF6, 0xEE))
     quote_box.line.fill.background()
     qtf = quote_box.text_frame
     qtf.word_wrap = True
@@ -1228,9 +1111,10 @@ def slide_23_challenges(prs):
     set_font(qrun, size=15, color=NAVY, bold=True)
 
 
+@REGISTRY.slide("Part 5 결론")
 def slide_24_conclusion(prs):
     """슬라이드 24: 결론 및 시사점"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
     add_background(slide, NAVY)
 
     # 상단 녹색 라인
@@ -1240,7 +1124,7 @@ def slide_24_conclusion(prs):
         SLIDE_WIDTH, Inches(0.06)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
+    set_color(shape.fill.fore_color, GREEN)
     shape.line.fill.background()
 
     # 제목
@@ -1271,7 +1155,7 @@ def slide_24_conclusion(prs):
             Inches(1.0), top, Inches(0.6), Inches(0.6)
         )
         num_box.fill.solid()
-        num_box.fill.fore_color.rgb = GREEN
+        set_color(num_box.fill.fore_color, GREEN)
         num_box.line.fill.background()
         ntf = num_box.text_frame
         np_ = ntf.paragraphs[0]
@@ -1306,7 +1190,7 @@ def slide_24_conclusion(prs):
         SLIDE_WIDTH, Inches(0.06)
     )
     shape2.fill.solid()
-    shape2.fill.fore_color.rgb = GREEN
+    set_color(shape2.fill.fore_color, GREEN)
     shape2.line.fill.background()
 
     thanks_box = slide.shapes.add_textbox(Inches(1.0), Inches(6.8), Inches(11.3), Inches(0.6))
@@ -1317,46 +1201,15 @@ def slide_24_conclusion(prs):
     trun2.text = "감사합니다  |  Thank You"
     set_font(trun2, size=30, bold=True, color=WHITE)
 
-    add_slide_number(slide, 24)
+    add_slide_number(slide)
 
 
 # ── 메인 실행 ─────────────────────────────────────────
-def main():
-    prs = Presentation()
-    prs.slide_width = SLIDE_WIDTH
-    prs.slide_height = SLIDE_HEIGHT
-
-    # 24장 슬라이드 생성
-    slide_01_cover(prs)
-    slide_02_toc(prs)
-    slide_03_why_hydrogen(prs)
-    slide_04_hydrogen_types(prs)
-    slide_05_value_chain(prs)
-    slide_06_production(prs)
-    slide_07_storage_transport(prs)
-    slide_08_applications(prs)
-    slide_09_h2_vs_battery(prs)
-    slide_10_global_market(prs)
-    slide_11_us_strategy(prs)
-    slide_12_eu_strategy(prs)
-    slide_13_china_mideast(prs)
-    slide_14_korea_policy(prs)
-    slide_15_korea_companies(prs)
-    # 연료전지 연구현황 (신규 6장)
-    slide_16_fc_market(prs)
-    slide_17_fc_tech(prs)
-    slide_18_fc_research(prs)
-    slide_19_fc_companies(prs)
-    slide_20_fc_policy_ai(prs)
-    slide_21_fc_assessment(prs)
-    # 마무리
-    slide_22_key_numbers(prs)
-    slide_23_challenges(prs)
-    slide_24_conclusion(prs)
-
-    prs.save(OUTPUT_PATH)
-    print(f"PPT 생성 완료: {OUTPUT_PATH}")
-    print(f"총 슬라이드 수: {len(prs.slides)}")
+SLIDES = REGISTRY.slides()
+
+
+def main(argv=None):
+    build.main(SLIDES, OUTPUT_PATH, argv)
 
 
 if __name__ == "__main__":
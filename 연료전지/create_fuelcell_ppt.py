@@ -7,198 +7,46 @@
 - FCEV vs BEV 효율 비교, 지정학적 리스크 슬라이드 추가
 """
 
-from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 import os
+import sys
 
-# ── 상수 ──────────────────────────────────────────────
-NAVY = RGBColor(0x1B, 0x3A, 0x5C)
-WHITE = RGBColor(0xFF, 0xFF, 0xFF)
-GREEN = RGBColor(0x2E, 0xCC, 0x71)
-LIGHT_GRAY = RGBColor(0xF0, 0xF0, 0xF0)
-DARK_GRAY = RGBColor(0x33, 0x33, 0x33)
-MEDIUM_GRAY = RGBColor(0x66, 0x66, 0x66)
-LIGHT_NAVY = RGBColor(0x2C, 0x5F, 0x8A)
-ACCENT_BLUE = RGBColor(0x34, 0x98, 0xDB)
-ACCENT_RED = RGBColor(0xE7, 0x4C, 0x3C)
-ACCENT_ORANGE = RGBColor(0xF3, 0x9C, 0x12)
-TABLE_HEADER_BG = RGBColor(0x1B, 0x3A, 0x5C)
-TABLE_ROW_ALT = RGBColor(0xE8, 0xF0, 0xF8)
-TABLE_ROW_WHITE = RGBColor(0xFF, 0xFF, 0xFF)
-
-FONT_NAME = "맑은 고딕"
-SLIDE_WIDTH = Inches(13.333)
-SLIDE_HEIGHT = Inches(7.5)
-TOTAL_SLIDES = 27
-
-OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "연료전지_발표자료.pptx")
-
-
-# ── 유틸리티 함수 ─────────────────────────────────────
-def set_font(run, size=18, bold=False, color=DARK_GRAY, name=FONT_NAME):
-    run.font.size = Pt(size)
-    run.font.bold = bold
-    run.font.color.rgb = color
-    run.font.name = name
-
-
-def add_background(slide, color=WHITE):
-    bg = slide.background
-    fill = bg.fill
-    fill.solid()
-    fill.fore_color.rgb = color
-
-
-def add_navy_header_bar(slide):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Emu(0), Emu(0), SLIDE_WIDTH, Inches(1.2)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = NAVY
-    shape.line.fill.background()
-
-
-def add_green_accent_line(slide, top=Inches(1.2)):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Emu(0), top, SLIDE_WIDTH, Inches(0.06)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
-    shape.line.fill.background()
-
-
-def add_slide_number(slide, num):
-    txBox = slide.shapes.add_textbox(
-        Inches(12.0), Inches(7.0), Inches(1.2), Inches(0.4)
-    )
-    tf = txBox.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.RIGHT
-    run = p.add_run()
-    run.text = f"{num} / {TOTAL_SLIDES}"
-    set_font(run, size=12, color=MEDIUM_GRAY)
-
-
-def add_footer_line(slide):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0.5), Inches(7.1), Inches(12.333), Inches(0.02)
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = NAVY
-    shape.line.fill.background()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
 
+from hydrogen_decks import build, fields, mdtables, registry, render
+from hydrogen_decks.render import (
+    set_font, set_color, add_background, add_body_textbox, add_bullet,
+    style_header_row, style_data_rows, add_colored_box, setup_slide,
+)
+from hydrogen_decks.style import (
+    NAVY, WHITE, GREEN, DARK_GRAY, MEDIUM_GRAY, LIGHT_NAVY,
+    ACCENT_BLUE, ACCENT_RED, ACCENT_ORANGE, SLIDE_WIDTH,
+)
 
-def add_title_text(slide, title_text, left=Inches(0.6), top=Inches(0.2),
-                   width=Inches(12), height=Inches(0.9)):
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.LEFT
-    run = p.add_run()
-    run.text = title_text
-    set_font(run, size=34, bold=True, color=WHITE)
-    return txBox
-
-
-def add_body_textbox(slide, left=Inches(0.8), top=Inches(1.6),
-                     width=Inches(11.7), height=Inches(5.2)):
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    return tf
+# ── 상수 ──────────────────────────────────────────────
+REGISTRY = registry.Registry()
 
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "연료전지_발표자료.pptx")
 
-def add_bullet(tf, text, level=0, size=16, bold=False, color=DARK_GRAY,
-               space_after=Pt(6), first=False):
-    if first:
-        p = tf.paragraphs[0]
-    else:
-        p = tf.add_paragraph()
-    p.level = level
-    p.space_after = space_after
-    p.alignment = PP_ALIGN.LEFT
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=size, bold=bold, color=color)
-    return p
+# 표 수치의 원본 연구 문서
+KOREA_RESEARCH = mdtables.Document(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "한국_연료전지_연구현황_종합분석.md"))
 
 
-def set_cell(table, row, col, text, size=12, bold=False, color=DARK_GRAY,
-             alignment=PP_ALIGN.LEFT, fill_color=None):
-    cell = table.cell(row, col)
-    cell.text = ""
-    p = cell.text_frame.paragraphs[0]
-    p.alignment = alignment
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=size, bold=bold, color=color)
-    cell.vertical_anchor = MSO_ANCHOR.MIDDLE
-    cell.margin_left = Inches(0.08)
-    cell.margin_right = Inches(0.08)
-    cell.margin_top = Inches(0.04)
-    cell.margin_bottom = Inches(0.04)
-    if fill_color:
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = fill_color
-
-
-def style_header_row(table, headers, size=14):
-    for i, h in enumerate(headers):
-        set_cell(table, 0, i, h, size=size, bold=True, color=WHITE,
-                 alignment=PP_ALIGN.CENTER, fill_color=TABLE_HEADER_BG)
-
-
-def style_data_rows(table, data, start_row=1, size=13):
-    for r_idx, row_data in enumerate(data):
-        row_num = start_row + r_idx
-        bg = TABLE_ROW_ALT if row_num % 2 == 0 else TABLE_ROW_WHITE
-        for c_idx, val in enumerate(row_data):
-            set_cell(table, row_num, c_idx, val, size=size, fill_color=bg)
-
-
-def setup_slide(prs, title_text, slide_num):
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_background(slide, WHITE)
-    add_navy_header_bar(slide)
-    add_green_accent_line(slide)
-    add_title_text(slide, title_text)
-    add_footer_line(slide)
-    add_slide_number(slide, slide_num)
-    return slide
-
-
-def add_colored_box(slide, left, top, width, height, fill_color, text,
-                    text_size=13, text_color=WHITE, bold=True):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height
-    )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
-    shape.line.fill.background()
-    tf = shape.text_frame
-    tf.word_wrap = True
-    tf.margin_left = Inches(0.1)
-    tf.margin_right = Inches(0.1)
-    tf.margin_top = Inches(0.05)
-    tf.margin_bottom = Inches(0.05)
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = text
-    set_font(run, size=text_size, bold=bold, color=text_color)
-    return shape
+# ── 유틸리티 함수 ─────────────────────────────────────
+def add_slide_number(slide, num=fields.PAGE):
+    render.add_slide_number(slide, num, fields.TOTAL)
 
 
 # ── 슬라이드 생성 ─────────────────────────────────────
 
+@REGISTRY.slide("도입")
 def slide_01_cover(prs):
     """표지"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
     add_background(slide, NAVY)
 
     # 상단 녹색 라인
@@ -206,7 +54,7 @@ def slide_01_cover(prs):
         MSO_SHAPE.RECTANGLE, Emu(0), Inches(2.0), SLIDE_WIDTH, Inches(0.08)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
+    set_color(shape.fill.fore_color, GREEN)
     shape.line.fill.background()
 
     # 제목
@@ -243,13 +91,14 @@ def slide_01_cover(prs):
         MSO_SHAPE.RECTANGLE, Emu(0), Inches(5.7), SLIDE_WIDTH, Inches(0.08)
     )
     shape2.fill.solid()
-    shape2.fill.fore_color.rgb = GREEN
+    set_color(shape2.fill.fore_color, GREEN)
     shape2.line.fill.background()
 
 
+@REGISTRY.slide("도입")
 def slide_02_toc(prs):
     """목차"""
-    slide = setup_slide(prs, "목차 (Table of Contents)", 2)
+    slide = setup_slide(prs, "목차 (Table of Contents)")
     sections = [
         ("Part 1", "글로벌 연료전지 시장 동향", "시장 규모, 유형별 동향, 응용 분야, 주요국 정책"),
         ("Part 2", "미국 연료전지 산업", "정책, DOE 컨소시엄, 주요 기업, 응용 분야"),
@@ -270,15 +119,19 @@ def slide_02_toc(prs):
         run = p.add_run()
         run.text = title
         set_font(run, size=20, bold=True, color=DARK_GRAY)
+        page = p.add_run()
+        page.text = f"   p.{fields.section(part)}"
+        set_font(page, size=14, color=MEDIUM_GRAY)
         p2 = tf.add_paragraph()
         run2 = p2.add_run()
         run2.text = desc
         set_font(run2, size=14, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 1 글로벌 연료전지 시장 동향", tags=("시장", "표"))
 def slide_03_global_market(prs):
     """글로벌 시장 규모"""
-    slide = setup_slide(prs, "글로벌 연료전지 시장 규모 및 성장 전망", 3)
+    slide = setup_slide(prs, "글로벌 연료전지 시장 규모 및 성장 전망")
 
     tf = add_body_textbox(slide, top=Inches(1.5), height=Inches(1.2))
     add_bullet(tf, "2025년 시장 규모: 약 107.6억~129.4억 달러", first=True, size=18, bold=True)
@@ -307,9 +160,10 @@ def slide_03_global_market(prs):
                     GREEN, "핵심 성장 동인\nAI 데이터센터 + 상용차", text_size=16)
 
 
+@REGISTRY.slide("Part 1 글로벌 연료전지 시장 동향", tags=("기술", "표"))
 def slide_04_fc_types(prs):
     """연료전지 유형별 동향"""
-    slide = setup_slide(prs, "연료전지 유형별 동향", 4)
+    slide = setup_slide(prs, "연료전지 유형별 동향")
 
     tbl_shape = slide.shapes.add_table(5, 4, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(5.0))
@@ -337,9 +191,10 @@ def slide_04_fc_types(prs):
     style_data_rows(table, data, size=12)
 
 
+@REGISTRY.slide("Part 1 글로벌 연료전지 시장 동향")
 def slide_05_applications(prs):
     """응용 분야별 동향"""
-    slide = setup_slide(prs, "주요 응용 분야별 동향", 5)
+    slide = setup_slide(prs, "주요 응용 분야별 동향")
 
     # 고정형 발전
     add_colored_box(slide, Inches(0.6), Inches(1.5), Inches(3.7), Inches(5.0),
@@ -373,9 +228,10 @@ def slide_05_applications(prs):
                     text_size=14, bold=False)
 
 
+@REGISTRY.slide("Part 1 글로벌 연료전지 시장 동향", tags=("정책", "표"))
 def slide_06_global_policy(prs):
     """주요국 정책 — 데이터 업데이트"""
-    slide = setup_slide(prs, "세계 주요국 수소/연료전지 정책 현황", 6)
+    slide = setup_slide(prs, "세계 주요국 수소/연료전지 정책 현황")
 
     tbl_shape = slide.shapes.add_table(6, 3, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(5.2))
@@ -400,9 +256,10 @@ def slide_06_global_policy(prs):
     style_data_rows(table, data, size=13)
 
 
+@REGISTRY.slide("Part 2 미국 연료전지 산업", tags=("미국", "정책"))
 def slide_07_us_policy(prs):
     """미국 연료전지 정책 — DOE 컨소시엄 추가"""
-    slide = setup_slide(prs, "[미국] 수소/연료전지 정책 상세", 7)
+    slide = setup_slide(prs, "[미국] 수소/연료전지 정책 상세")
     tf = add_body_textbox(slide, top=Inches(1.5))
 
     add_bullet(tf, "국가 청정 수소 전략 및 로드맵 (2023)", first=True, size=17, bold=True, color=NAVY)
@@ -427,9 +284,10 @@ def slide_07_us_policy(prs):
                color=ACCENT_RED)
 
 
+@REGISTRY.slide("Part 2 미국 연료전지 산업", tags=("미국", "기업", "표"))
 def slide_08_us_companies(prs):
     """미국 주요 기업"""
-    slide = setup_slide(prs, "[미국] 주요 연료전지 기업", 8)
+    slide = setup_slide(prs, "[미국] 주요 연료전지 기업")
 
     tbl_shape = slide.shapes.add_table(6, 4, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(5.2))
@@ -459,9 +317,10 @@ def slide_08_us_companies(prs):
     style_data_rows(table, data, size=11)
 
 
+@REGISTRY.slide("Part 2 미국 연료전지 산업", tags=("미국",))
 def slide_09_us_applications(prs):
     """미국 응용 분야"""
-    slide = setup_slide(prs, "[미국] 연료전지 응용 분야", 9)
+    slide = setup_slide(prs, "[미국] 연료전지 응용 분야")
     tf = add_body_textbox(slide, top=Inches(1.5))
 
     add_bullet(tf, "물류/지게차 — 가장 상용화된 분야", first=True, size=18, bold=True, color=NAVY)
@@ -480,9 +339,10 @@ def slide_09_us_applications(prs):
                size=16, bold=True, color=ACCENT_RED)
 
 
+@REGISTRY.slide("Part 3 중국 연료전지 산업", tags=("중국", "시장", "표"))
 def slide_10_china_market(prs):
     """중국 시장 — 데이터 확대"""
-    slide = setup_slide(prs, "[중국] 연료전지 시장 현황", 10)
+    slide = setup_slide(prs, "[중국] 연료전지 시장 현황")
 
     # 좌측: 핵심 지표 표
     tbl_shape = slide.shapes.add_table(6, 3, Inches(0.6), Inches(1.5),
@@ -517,9 +377,10 @@ def slide_10_china_market(prs):
     add_bullet(tf, "2025년 재무부 FCV 보조금: 3.21억$ | 5개 시범 도시 클러스터 운영", level=1, size=13)
 
 
+@REGISTRY.slide("Part 3 중국 연료전지 산업", tags=("중국", "기업", "표"))
 def slide_11_china_companies(prs):
     """중국 주요 기업"""
-    slide = setup_slide(prs, "[중국] 주요 연료전지 기업", 11)
+    slide = setup_slide(prs, "[중국] 주요 연료전지 기업")
 
     tbl_shape = slide.shapes.add_table(6, 4, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(5.2))
@@ -550,9 +411,10 @@ def slide_11_china_companies(prs):
     style_data_rows(table, data, size=11)
 
 
+@REGISTRY.slide("Part 3 중국 연료전지 산업", tags=("중국",))
 def slide_12_china_applications(prs):
     """중국 상용차 중심 응용"""
-    slide = setup_slide(prs, "[중국] 상용차 중심 대규모 보급", 12)
+    slide = setup_slide(prs, "[중국] 상용차 중심 대규모 보급")
     tf = add_body_textbox(slide, top=Inches(1.5))
 
     add_bullet(tf, "중국 연료전지 시장의 60%+ = 수송 부문, 상용차가 압도적 비중",
@@ -572,9 +434,10 @@ def slide_12_china_applications(prs):
     add_bullet(tf, "20개+ 주요 회랑에서 200대+ 운행, 40개+ 충전소 지원", level=1, size=15)
 
 
+@REGISTRY.slide("Part 4 미·중 경쟁, FCEV vs BEV, 지정학", tags=("미국", "중국", "비교", "표"))
 def slide_13_us_vs_china(prs):
     """미중 비교 — 10행으로 확장"""
-    slide = setup_slide(prs, "미국 vs 중국 연료전지 경쟁 구도", 13)
+    slide = setup_slide(prs, "미국 vs 중국 연료전지 경쟁 구도")
 
     tbl_shape = slide.shapes.add_table(11, 3, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(5.5))
@@ -599,9 +462,10 @@ def slide_13_us_vs_china(prs):
     style_data_rows(table, data, size=11)
 
 
+@REGISTRY.slide("Part 4 미·중 경쟁, FCEV vs BEV, 지정학", tags=("비교", "표"))
 def slide_14_fcev_vs_bev(prs):
     """[신규] FCEV vs BEV 효율 비교"""
-    slide = setup_slide(prs, "FCEV vs BEV: 효율 비교 및 시장 전망", 14)
+    slide = setup_slide(prs, "FCEV vs BEV: 효율 비교 및 시장 전망")
 
     # 상단: Well-to-Wheel 효율 비교 테이블
     add_colored_box(slide, Inches(0.5), Inches(1.4), Inches(7.5), Inches(0.6),
@@ -648,9 +512,10 @@ def slide_14_fcev_vs_bev(prs):
                size=14, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 4 미·중 경쟁, FCEV vs BEV, 지정학", tags=("정책", "표"))
 def slide_15_geopolitical_hydrogen(prs):
     """[신규] 지정학적 리스크와 수소 무역"""
-    slide = setup_slide(prs, "지정학적 리스크와 글로벌 수소 무역", 15)
+    slide = setup_slide(prs, "지정학적 리스크와 글로벌 수소 무역")
 
     # 좌측: 수소 수출국 TOP5
     add_colored_box(slide, Inches(0.5), Inches(1.4), Inches(6.2), Inches(0.6),
@@ -704,9 +569,10 @@ def slide_15_geopolitical_hydrogen(prs):
                size=14, color=DARK_GRAY)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "시장"))
 def slide_16_korea_market(prs):
     """한국 시장 현황"""
-    slide = setup_slide(prs, "[한국] 연료전지 시장 현황", 16)
+    slide = setup_slide(prs, "[한국] 연료전지 시장 현황")
 
     # 핵심 지표 박스 4개
     boxes = [
@@ -731,9 +597,10 @@ def slide_16_korea_market(prs):
     add_bullet(tf, "2024년 1,000대+ 신규 보급 (전년 대비 277% 급증) | 2025년 목표 2,000대", level=1, size=15)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "정책", "표"))
 def slide_17_korea_policy(prs):
     """한국 정책"""
-    slide = setup_slide(prs, "[한국] 수소경제 정책 체계", 17)
+    slide = setup_slide(prs, "[한국] 수소경제 정책 체계")
 
     tbl_shape = slide.shapes.add_table(7, 3, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(5.2))
@@ -754,9 +621,10 @@ def slide_17_korea_policy(prs):
     style_data_rows(table, data, size=12)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "기업", "표"))
 def slide_18_korea_companies(prs):
     """한국 주요 기업"""
-    slide = setup_slide(prs, "[한국] 주요 연료전지 기업 생태계", 18)
+    slide = setup_slide(prs, "[한국] 주요 연료전지 기업 생태계")
 
     tbl_shape = slide.shapes.add_table(8, 3, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(5.2))
@@ -785,9 +653,10 @@ def slide_18_korea_companies(prs):
     style_data_rows(table, data, size=11)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "기술", "표"))
 def slide_19_korea_rd(prs):
     """한국 R&D — 예산 감소 경고 추가"""
-    slide = setup_slide(prs, "[한국] 연료전지 R&D 핵심 성과", 19)
+    slide = setup_slide(prs, "[한국] 연료전지 R&D 핵심 성과")
 
     tbl_shape = slide.shapes.add_table(7, 4, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(3.5))
@@ -826,9 +695,10 @@ def slide_19_korea_rd(prs):
     add_bullet(tf2, "한국 PCT 국제특허출원 세계 4위 (5년 연속)", size=14, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "인프라", "표"))
 def slide_20_korea_infra(prs):
     """한국 인프라"""
-    slide = setup_slide(prs, "[한국] 수소 인프라 현황", 20)
+    slide = setup_slide(prs, "[한국] 수소 인프라 현황")
 
     # 좌측: 충전소
     add_colored_box(slide, Inches(0.6), Inches(1.5), Inches(5.8), Inches(0.7),
@@ -870,9 +740,10 @@ def slide_20_korea_infra(prs):
                first=True, size=14, color=MEDIUM_GRAY)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국",))
 def slide_21_korea_swot(prs):
     """한국 강점 약점"""
-    slide = setup_slide(prs, "[한국] 연료전지 분야 강점과 약점", 21)
+    slide = setup_slide(prs, "[한국] 연료전지 분야 강점과 약점")
 
     # 강점 (좌측)
     add_colored_box(slide, Inches(0.6), Inches(1.5), Inches(5.8), Inches(0.7),
@@ -911,34 +782,30 @@ def slide_21_korea_swot(prs):
         add_bullet(tf2, f"  {w}", first=(i == 0), size=14, color=DARK_GRAY, space_after=Pt(4))
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "정책", "표"))
 def slide_22_roadmap_achievement(prs):
     """로드맵 달성률 분석"""
-    slide = setup_slide(prs, "[한국] 수소경제 로드맵 달성률 분석", 22)
+    slide = setup_slide(prs, "[한국] 수소경제 로드맵 달성률 분석")
 
     # 상단 설명
     tf = add_body_textbox(slide, top=Inches(1.4), height=Inches(0.6))
     add_bullet(tf, "2019년 로드맵 목표 대비 2025년 현재 실제 달성 현황 — 분야별 상당한 편차 존재",
                first=True, size=16, bold=True, color=NAVY)
 
-    # 달성률 테이블
-    tbl_shape = slide.shapes.add_table(7, 5, Inches(0.6), Inches(2.1),
+    # 달성률 테이블 — 연구 문서 4.1 표에서 직접 가져옴
+    achievement = KOREA_RESEARCH.table("4.1 분야별 달성률 종합표")
+    columns = ["분야", "2022년 목표", "실제 달성", "달성률", "2030년 목표", "현재 실적"]
+    data = achievement.select(*columns)
+    # 수소버스는 4.2 본문에만 있어 별도 행으로 덧붙임
+    data.append(["수소버스", "-", "2,066대", "-", "-", "1,000대+ (2024, 277% 급증)"])
+
+    tbl_shape = slide.shapes.add_table(len(data) + 1, len(columns), Inches(0.6), Inches(2.1),
                                        Inches(12.1), Inches(3.8))
     table = tbl_shape.table
-    table.columns[0].width = Inches(2.2)
-    table.columns[1].width = Inches(2.2)
-    table.columns[2].width = Inches(2.2)
-    table.columns[3].width = Inches(1.5)
-    table.columns[4].width = Inches(4.0)
+    for col, width in zip(table.columns, (2.2, 1.6, 2.4, 1.2, 1.6, 3.1)):
+        col.width = Inches(width)
 
-    style_header_row(table, ["분야", "2022년 목표", "실제 달성", "달성률", "2030년 목표 대비 현황"])
-    data = [
-        ["수소차 보급", "8.1만 대", "~1.9만 대", "23%", "18만 대 목표 → 현재 3.8만 대"],
-        ["수소충전소", "310개소", "~170개소(→407기)", "55%→74%", "660기 목표 → 양호한 진척"],
-        ["발전용 연료전지", "1.5GW", "~1.0GW", "67%", "8GW 목표 → 1.08GW (13.5%)"],
-        ["건물용 연료전지", "50MW", "~13MW", "26%", "에네팜 49만대 대비 현저히 부족"],
-        ["수소 공급량", "47만 톤", "~22만 톤", "47%", "390만 톤 목표 → 그린 전환 시급"],
-        ["수소버스", "-", "2,066대", "-", "2024년 1,000대+ (277% 급증)"],
-    ]
+    style_header_row(table, columns)
     style_data_rows(table, data, size=12)
 
     # 하단: 달성률 평가 박스
@@ -950,9 +817,10 @@ def slide_22_roadmap_achievement(prs):
                     ACCENT_RED, "저조: 수소차(23%), 건물용(26%)", text_size=14)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "기술", "표"))
 def slide_23_parts_techgap(prs):
     """부품 국산화 + 기술격차 — 코오롱-Ballard MOU 추가"""
-    slide = setup_slide(prs, "[한국] 핵심부품 국산화율 및 기술격차 분석", 23)
+    slide = setup_slide(prs, "[한국] 핵심부품 국산화율 및 기술격차 분석")
 
     # 좌측: 부품 국산화율 테이블
     add_colored_box(slide, Inches(0.5), Inches(1.4), Inches(6.2), Inches(0.6),
@@ -1003,9 +871,10 @@ def slide_23_parts_techgap(prs):
                size=14, color=NAVY)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "인프라", "표"))
 def slide_24_charging_crisis(prs):
     """충전소 수익성 위기"""
-    slide = setup_slide(prs, "[한국] 수소충전소 수익성 위기 분석", 24)
+    slide = setup_slide(prs, "[한국] 수소충전소 수익성 위기 분석")
 
     # 좌측: 수익성 현황 테이블
     add_colored_box(slide, Inches(0.5), Inches(1.4), Inches(6.2), Inches(0.6),
@@ -1036,14 +905,9 @@ def slide_24_charging_crisis(prs):
     t2 = tbl2.table
     t2.columns[0].width = Inches(2.5)
     t2.columns[1].width = Inches(3.2)
-    style_header_row(t2, ["연도", "적자액"])
-    data2 = [
-        ["2019년", "11억 4,000만 원"],
-        ["2020년", "22억 5,800만 원"],
-        ["2021년", "58억 8,200만 원"],
-        ["2022년", "84억 5,000만 원"],
-        ["4년 누적", "166억 원 (639% 급증)"],
-    ]
+    hynet = KOREA_RESEARCH.table(caption="하이넷(HyNet) 적자 추이")
+    style_header_row(t2, list(hynet.header))
+    data2 = hynet.select()
     style_data_rows(t2, data2, size=12)
 
     # 하단: 원인 + 수소가격 추이
@@ -1054,9 +918,10 @@ def slide_24_charging_crisis(prs):
                size=14, color=ACCENT_RED)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("기술", "표"))
 def slide_25_tech_innovation(prs):
     """기술 혁신 트렌드 — 비용 테이블 확장 + W2W 효율"""
-    slide = setup_slide(prs, "최근 기술 혁신 및 비용 절감 트렌드", 25)
+    slide = setup_slide(prs, "최근 기술 혁신 및 비용 절감 트렌드")
 
     # 상단: 촉매 혁신
     tf = add_body_textbox(slide, top=Inches(1.5), height=Inches(1.8))
@@ -1093,9 +958,10 @@ def slide_25_tech_innovation(prs):
                     text_size=14, bold=False)
 
 
+@REGISTRY.slide("Part 5 한국의 현주소와 전망", tags=("한국", "표"))
 def slide_26_korea_global(prs):
     """한국 글로벌 위상"""
-    slide = setup_slide(prs, "[한국] 글로벌 시장에서의 위상", 26)
+    slide = setup_slide(prs, "[한국] 글로벌 시장에서의 위상")
 
     tbl_shape = slide.shapes.add_table(8, 3, Inches(0.6), Inches(1.5),
                                        Inches(12.1), Inches(4.2))
@@ -1122,9 +988,10 @@ def slide_26_korea_global(prs):
                first=True, size=15, bold=True, color=NAVY)
 
 
+@REGISTRY.slide("결론")
 def slide_27_conclusion(prs):
     """결론 및 전망 — 시나리오 분석 + 5대 과제 업데이트"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(prs.slide_layouts[render.BLANK_LAYOUT])
     add_background(slide, NAVY)
 
     # 상단 녹색 라인
@@ -1132,7 +999,7 @@ def slide_27_conclusion(prs):
         MSO_SHAPE.RECTANGLE, Emu(0), Inches(0.6), SLIDE_WIDTH, Inches(0.06)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = GREEN
+    set_color(shape.fill.fore_color, GREEN)
     shape.line.fill.background()
 
     # 제목
@@ -1196,46 +1063,15 @@ def slide_27_conclusion(prs):
                         Inches(2.2), Inches(0.85),
                         LIGHT_NAVY, ch, text_size=12, bold=True)
 
-    add_slide_number(slide, TOTAL_SLIDES)
+    add_slide_number(slide)
 
 
 # ── 메인 ──────────────────────────────────────────────
-def main():
-    prs = Presentation()
-    prs.slide_width = SLIDE_WIDTH
-    prs.slide_height = SLIDE_HEIGHT
-
-    slide_01_cover(prs)
-    slide_02_toc(prs)
-    slide_03_global_market(prs)
-    slide_04_fc_types(prs)
-    slide_05_applications(prs)
-    slide_06_global_policy(prs)
-    slide_07_us_policy(prs)
-    slide_08_us_companies(prs)
-    slide_09_us_applications(prs)
-    slide_10_china_market(prs)
-    slide_11_china_companies(prs)
-    slide_12_china_applications(prs)
-    slide_13_us_vs_china(prs)
-    slide_14_fcev_vs_bev(prs)
-    slide_15_geopolitical_hydrogen(prs)
-    slide_16_korea_market(prs)
-    slide_17_korea_policy(prs)
-    slide_18_korea_companies(prs)
-    slide_19_korea_rd(prs)
-    slide_20_korea_infra(prs)
-    slide_21_korea_swot(prs)
-    slide_22_roadmap_achievement(prs)
-    slide_23_parts_techgap(prs)
-    slide_24_charging_crisis(prs)
-    slide_25_tech_innovation(prs)
-    slide_26_korea_global(prs)
-    slide_27_conclusion(prs)
-
-    prs.save(OUTPUT_PATH)
-    print(f"PPT 생성 완료: {OUTPUT_PATH}")
-    print(f"총 {TOTAL_SLIDES}장 슬라이드")
+SLIDES = REGISTRY.slides()
+
+
+def main(argv=None):
+    build.main(SLIDES, OUTPUT_PATH, argv)
 
 
 if __name__ == "__main__":